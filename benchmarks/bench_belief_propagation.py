@@ -0,0 +1,28 @@
+"""Benchmarks for the belief propagation routines."""
+
+import quimb.tensor as qtn
+from quimb.tensor.belief_propagation import D1BP, D2BP, HV1BP, L1BP
+
+_BP_CLASSES = {
+    "D1BP": D1BP,
+    "D2BP": D2BP,
+    "HV1BP": HV1BP,
+    "L1BP": L1BP,
+}
+
+
+class BeliefPropagationRun:
+    params = (sorted(_BP_CLASSES), [10])
+    param_names = ["method", "L"]
+    timeout = 300
+
+    def setup(self, method, L):
+        if method == "D2BP":
+            # D2BP acts on the norm network of a state
+            self.tn = qtn.PEPS.rand(L, L, 2, seed=42, dist="uniform")
+        else:
+            self.tn = qtn.TN2D_rand(L, L, D=3, seed=42, dist="uniform")
+
+    def time_run(self, method, L):
+        bp = _BP_CLASSES[method](self.tn)
+        bp.run(max_iterations=20, tol=0.0)
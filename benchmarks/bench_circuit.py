@@ -0,0 +1,26 @@
+"""Benchmarks for quantum circuit simulation."""
+
+import quimb.tensor as qtn
+
+
+class CircuitSimulate:
+    params = ([12, 16], [4])
+    param_names = ["N", "depth"]
+    timeout = 300
+
+    def setup(self, N, depth):
+        self.circ = qtn.circ_qaoa(
+            terms={(i, (i + 1) % N): 1.0 for i in range(N)},
+            depth=depth,
+            gammas=[0.1] * depth,
+            betas=[0.2] * depth,
+        )
+        # warm up the path cache
+        self.circ.amplitude("0" * N)
+
+    def time_amplitude(self, N, depth):
+        self.circ.amplitude("0" * N)
+
+    def time_sample(self, N, depth):
+        for _ in self.circ.sample(4, seed=42):
+            pass
@@ -0,0 +1,15 @@
+"""Benchmarks for the cold start time of importing quimb."""
+
+
+class Import:
+    timeout = 120
+
+    def timeraw_import_quimb(self):
+        return "import quimb"
+
+    def timeraw_import_quimb_tensor(self):
+        return "import quimb.tensor"
+
+    def timeraw_import_quimb_tensor_core(self):
+        # first access of a lazy attribute imports the actual submodules
+        return "import quimb.tensor as qtn; qtn.Tensor"
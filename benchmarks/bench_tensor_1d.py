@@ -0,0 +1,78 @@
+"""Benchmarks for 1D tensor network algorithms."""
+
+import quimb as qu
+import quimb.tensor as qtn
+from quimb.tensor.tensor_dmrg import _dmrg_parallel_segment
+
+
+class MPSGateSplit:
+    params = ([16, 64], ["svd", "eig"])
+    param_names = ["bond_dim", "method"]
+
+    def setup(self, bond_dim, method):
+        self.psi = qtn.MPS_rand_state(20, bond_dim, seed=42)
+        self.G = qu.rand_uni(4, seed=42)
+
+    def time_gate_split(self, bond_dim, method):
+        self.psi.gate_split(self.G, (9, 10), method=method, max_bond=bond_dim)
+
+
+class DMRG2Solve:
+    params = [16, 32]
+    param_names = ["bond_dim"]
+    timeout = 300
+
+    def setup(self, bond_dim):
+        self.H = qtn.MPO_ham_heis(20)
+        self.p0 = qtn.MPS_rand_state(20, 4, seed=42)
+
+    def time_solve(self, bond_dim):
+        dmrg = qtn.DMRG2(self.H, bond_dims=[bond_dim], p0=self.p0)
+        dmrg.solve(max_sweeps=2, verbosity=0)
+
+
+class TEBDUpdateTo:
+    params = ([20], [32])
+    param_names = ["L", "bond_dim"]
+    timeout = 300
+
+    def setup(self, L, bond_dim):
+        self.H = qtn.ham_1d_heis(L)
+        self.p0 = qtn.MPS_neel_state(L)
+
+    def time_update_to(self, L, bond_dim):
+        tebd = qtn.TEBD(
+            self.p0, self.H, dt=0.05, split_opts={"max_bond": bond_dim}
+        )
+        tebd.update_to(1.0, progbar=False)
+
+
+class DMRGParallelIteration:
+    params = ([64, 128], [32, 64], [4, 8])
+    param_names = ["L", "bond_dim", "num_segments"]
+    timeout = 300
+
+    def setup(self, L, bond_dim, num_segments):
+        self.dmrg = qtn.DMRGParallel(
+            qtn.MPO_ham_heis(L),
+            bond_dims=[bond_dim],
+            num_segments=num_segments,
+            p0=qtn.MPS_rand_state(L, bond_dim, seed=42),
+        )
+        self.args = [
+            (hs, ps, "SA", bond_dim, 1e-8, self.dmrg.segment_sweeps, {})
+            for hs, ps in self.dmrg._tasks
+        ]
+        results = [_dmrg_parallel_segment(*a) for a in self.args]
+        self.boundaries = [e for _, e in self.dmrg._segments[:-1]]
+        self.segments = self.dmrg._get_segments(1)
+        self.dmrg._stitch(results)
+
+    def time_segments(self, L, bond_dim, num_segments):
+        # the work that an executor can distribute
+        for a in self.args:
+            _dmrg_parallel_segment(*a)
+
+    def time_serial(self, L, bond_dim, num_segments):
+        # the passes over the whole chain between segment optimizations
+        self.dmrg._prepare(self.segments, self.boundaries, bond_dim, 1e-8)
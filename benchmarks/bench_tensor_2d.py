@@ -0,0 +1,15 @@
+"""Benchmarks for 2D tensor network algorithms."""
+
+import quimb.tensor as qtn
+
+
+class ContractBoundary:
+    params = ([6, 10], [8, 16])
+    param_names = ["L", "max_bond"]
+    timeout = 300
+
+    def setup(self, L, max_bond):
+        self.tn = qtn.TN2D_rand(L, L, D=2, seed=42, dist="uniform")
+
+    def time_contract_boundary(self, L, max_bond):
+        self.tn.contract_boundary(max_bond=max_bond, cutoff=0.0)
@@ -0,0 +1,106 @@
+"""Benchmarks for core tensor and tensor network operations."""
+
+import numpy as np
+
+import quimb.tensor as qtn
+from quimb.tensor.tensor_core import _SPLIT_FNS
+
+# methods which assume a hermitian positive definite input
+_SPLIT_HERMITIAN_METHODS = {"cholesky", "eigh", "eigsh"}
+
+
+class TensorNetworkContract:
+    params = ([(6, 6), (8, 8)], ["greedy", "auto-hq"])
+    param_names = ["shape", "optimize"]
+
+    def setup(self, shape, optimize):
+        self.tn = qtn.TN2D_rand(*shape, D=2, seed=42, dist="uniform")
+        # warm up the path finder and any backend dispatch
+        self.tn.contract(..., optimize=optimize)
+
+    def time_contract(self, shape, optimize):
+        self.tn.contract(..., optimize=optimize)
+
+    def peakmem_contract(self, shape, optimize):
+        self.tn.contract(..., optimize=optimize)
+
+
+class TensorNetworkConstruct:
+    params = [10, 100]
+    param_names = ["L"]
+
+    def setup(self, L):
+        self.tn = qtn.TN2D_rand(L, L, D=2, seed=42)
+
+    def time_copy(self, L):
+        self.tn.copy()
+
+    def time_TN2D_rand(self, L):
+        qtn.TN2D_rand(L, L, D=2, seed=42)
+
+
+class TensorNetworkBuild:
+    params = [10_000, 50_000]
+    param_names = ["num_tensors"]
+
+    def setup(self, num_tensors):
+        # a chain of many small tensors, where the python bookkeeping of the
+        # tag and index maps dominates over the arrays themselves
+        self.ts = [
+            qtn.Tensor(
+                np.ones((2, 2, 2)),
+                inds=(f"k{i}", f"b{i}", f"b{i + 1}"),
+                tags=(f"I{i}", "PSI"),
+            )
+            for i in range(num_tensors)
+        ]
+
+    def time_tensor_copy(self, num_tensors):
+        for t in self.ts:
+            t.copy()
+
+    def time_construct(self, num_tensors):
+        qtn.TensorNetwork(self.ts)
+
+    def time_construct_virtual(self, num_tensors):
+        qtn.TensorNetwork(self.ts, virtual=True)
+
+    def peakmem_construct(self, num_tensors):
+        qtn.TensorNetwork(self.ts)
+
+
+class TensorNetworkFullSimplify:
+    params = ["ADCRS", "ADCRSL"]
+    param_names = ["seq"]
+
+    def setup(self, seq):
+        circ = qtn.circ_qaoa(
+            terms={(i, (i + 1) % 16): 1.0 for i in range(16)},
+            depth=2,
+            gammas=[0.1, 0.2],
+            betas=[0.3, 0.4],
+        )
+        self.tn = circ.amplitude_tn("0" * 16)
+
+    def time_full_simplify(self, seq):
+        self.tn.full_simplify(seq)
+
+
+class TensorSplit:
+    params = (sorted(_SPLIT_FNS), [64, 256])
+    param_names = ["method", "d"]
+
+    def setup(self, method, d):
+        rng = np.random.default_rng(42)
+        x = rng.normal(size=(d, d))
+        if method in _SPLIT_HERMITIAN_METHODS:
+            # symmetric positive definite
+            x = x @ x.T + d * np.eye(d)
+        self.t = qtn.Tensor(x.reshape(d // 4, 4, 4, d // 4), inds="abcd")
+        self.opts = {}
+        if method in ("eigsh", "svds", "rsvd", "isvd"):
+            # iterative methods require a target rank
+            self.opts["max_bond"] = d // 8
+
+    def time_tensor_split(self, method, d):
+        self.t.split(("a", "b"), method=method, **self.opts)
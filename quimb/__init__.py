@@ -1,6 +1,7 @@
 """
 Quantum Information for Many-Body calculations.
 """
+
 try:
     # -- Distribution mode --
     # import from _version.py generated by setuptools_scm during release
@@ -22,249 +23,283 @@ import warnings
 # some useful math
 from math import cos, exp, log, log2, log10, pi, sin, sqrt, tan
 
-# Functions for calculating properties
-from .calc import (
-    bell_decomp,
-    concurrence,
-    correlation,
-    cprint,
-    decomp,
-    dephase,
-    ent_cross_matrix,
-    entropy,
-    entropy_subsys,
-    fidelity,
-    heisenberg_energy,
-    is_degenerate,
-    is_eigenvector,
-    kraus_op,
-    logarithmic_negativity,
-    logneg,
-    logneg_subsys,
-    measure,
-    mutinf,
-    mutinf_subsys,
-    mutual_information,
-    negativity,
-    one_way_classical_information,
-    page_entropy,
-    partial_transpose,
-    pauli_correlations,
-    pauli_decomp,
-    projector,
-    purify,
-    qid,
-    quantum_discord,
-    schmidt_gap,
-    simulate_counts,
-    tr_sqrt,
-    tr_sqrt_subsys,
-    trace_distance,
-)
+from .utils import lazy_module_attrs
 
-# Core functions
-from .core import (
-    bra,
-    chop,
-    dag,
-    dim_compress,
-    dim_map,
-    dop,
-    dot,
-    expec,
-    expectation,
-    explt,
-    eye,
-    get_thread_pool,
-    identity,
-    ikron,
-    infer_size,
-    isbra,
-    isdense,
-    isherm,
-    isket,
-    isop,
-    ispos,
-    isreal,
-    issparse,
-    isvec,
-    itrace,
-    ket,
-    kron,
-    kronpow,
-    ldmul,
-    mul,
-    nmlz,
-    normalize,
-    outer,
-    partial_trace,
-    permute,
-    pkron,
-    prod,
-    ptr,
-    qarray,
-    qu,
-    quimbify,
-    rdmul,
-    rdot,
-    sparse,
-    speye,
-    tr,
-    trace,
-    vdot,
-)
+# public functions and classes are only imported from their submodules when
+# first accessed, so that ``import quimb`` itself is fast
 
-# Evolution class and methods
-from .evo import Evolution
-
-# Generating objects
-from .gen.operators import (
-    CNOT,
-    Rx,
-    Ry,
-    Rz,
-    S_gate,
-    T_gate,
-    U_gate,
-    Wsqrt,
-    Xsqrt,
-    Ysqrt,
-    Zsqrt,
-    ccX,
-    ccY,
-    ccZ,
-    controlled,
-    controlled_swap,
-    create,
-    cswap,
-    cX,
-    cY,
-    cZ,
-    destroy,
-    fredkin,
-    fsim,
-    fsimg,
-    hadamard,
-    ham_heis,
-    ham_heis_2D,
-    ham_hubbard_hardcore,
-    ham_ising,
-    ham_j1j2,
-    ham_mbl,
-    ham_XXZ,
-    ham_XY,
-    iswap,
-    ncontrolled_gate,
-    num,
-    pauli,
-    phase_gate,
-    rotation,
-    spin_operator,
-    swap,
-    toffoli,
-    zspin_projector,
-)
-from .gen.rand import (
-    gen_rand_haar_states,
-    rand,
-    rand_haar_state,
-    rand_herm,
-    rand_iso,
-    rand_ket,
-    rand_matrix,
-    rand_matrix_product_state,
-    rand_mera,
-    rand_mix,
-    rand_mps,
-    rand_pos,
-    rand_product_state,
-    rand_rho,
-    rand_seperable,
-    rand_uni,
-    randn,
-    seed_rand,
-    set_rand_bitgen,
-)
-from .gen.states import (
-    basis_vec,
-    bell_state,
-    bloch_state,
-    computational_state,
-    down,
-    ghz_state,
-    graph_state_1d,
-    levi_civita,
-    minus,
-    neel_state,
-    perm_state,
-    plus,
-    singlet,
-    singlet_pairs,
-    thermal_state,
-    up,
-    w_state,
-    werner_state,
-    xminus,
-    xplus,
-    yminus,
-    yplus,
-    zminus,
-    zplus,
-)
-from .linalg.approx_spectral import (
-    approx_spectral_function,
-    entropy_subsys_approx,
-    logneg_subsys_approx,
-    negativity_subsys_approx,
-    tr_abs_approx,
-    tr_exp_approx,
-    tr_sqrt_approx,
-    tr_xlogx_approx,
-    xlogx,
-)
+_LAZY_IMPORTS = {
+    # Functions for calculating properties
+    ".calc": (
+        "bell_decomp",
+        "concurrence",
+        "correlation",
+        "cprint",
+        "decomp",
+        "dephase",
+        "ent_cross_matrix",
+        "entropy",
+        "entropy_subsys",
+        "fidelity",
+        "heisenberg_energy",
+        "is_degenerate",
+        "is_eigenvector",
+        "kraus_op",
+        "logarithmic_negativity",
+        "logneg",
+        "logneg_subsys",
+        "measure",
+        "mutinf",
+        "mutinf_subsys",
+        "mutual_information",
+        "negativity",
+        "one_way_classical_information",
+        "page_entropy",
+        "partial_transpose",
+        "pauli_correlations",
+        "pauli_decomp",
+        "projector",
+        "purify",
+        "qid",
+        "quantum_discord",
+        "schmidt_gap",
+        "simulate_counts",
+        "tr_sqrt",
+        "tr_sqrt_subsys",
+        "trace_distance",
+    ),
+    # Core functions
+    ".core": (
+        "bra",
+        "chop",
+        "dag",
+        "dim_compress",
+        "dim_map",
+        "dop",
+        "dot",
+        "expec",
+        "expectation",
+        "explt",
+        "eye",
+        "get_thread_pool",
+        "identity",
+        "ikron",
+        "infer_size",
+        "isbra",
+        "isdense",
+        "isherm",
+        "isket",
+        "isop",
+        "ispos",
+        "isreal",
+        "issparse",
+        "isvec",
+        "itrace",
+        "ket",
+        "kron",
+        "kronpow",
+        "ldmul",
+        "mul",
+        "nmlz",
+        "normalize",
+        "outer",
+        "partial_trace",
+        "permute",
+        "pkron",
+        "prod",
+        "ptr",
+        "qarray",
+        "qu",
+        "quimbify",
+        "rdmul",
+        "rdot",
+        "sparse",
+        "speye",
+        "tr",
+        "trace",
+        "vdot",
+    ),
+    # Evolution class and methods
+    ".evo": ("Evolution",),
+    # Generating objects
+    ".gen.operators": (
+        "CNOT",
+        "Rx",
+        "Ry",
+        "Rz",
+        "S_gate",
+        "T_gate",
+        "U_gate",
+        "Wsqrt",
+        "Xsqrt",
+        "Ysqrt",
+        "Zsqrt",
+        "ccX",
+        "ccY",
+        "ccZ",
+        "controlled",
+        "controlled_swap",
+        "create",
+        "cswap",
+        "cX",
+        "cY",
+        "cZ",
+        "destroy",
+        "fredkin",
+        "fsim",
+        "fsimg",
+        "hadamard",
+        "ham_heis",
+        "ham_heis_2D",
+        "ham_hubbard_hardcore",
+        "ham_ising",
+        "ham_j1j2",
+        "ham_mbl",
+        "ham_XXZ",
+        "ham_XY",
+        "iswap",
+        "ncontrolled_gate",
+        "num",
+        "pauli",
+        "phase_gate",
+        "rotation",
+        "spin_operator",
+        "swap",
+        "toffoli",
+        "zspin_projector",
+    ),
+    ".gen.rand": (
+        "gen_rand_haar_states",
+        "rand",
+        "rand_haar_state",
+        "rand_herm",
+        "rand_iso",
+        "rand_ket",
+        "rand_matrix",
+        "rand_matrix_product_state",
+        "rand_mera",
+        "rand_mix",
+        "rand_mps",
+        "rand_pos",
+        "rand_product_state",
+        "rand_rho",
+        "rand_seperable",
+        "rand_uni",
+        "randn",
+        "seed_rand",
+        "set_rand_bitgen",
+    ),
+    ".gen.states": (
+        "basis_vec",
+        "bell_state",
+        "bloch_state",
+        "computational_state",
+        "down",
+        "ghz_state",
+        "graph_state_1d",
+        "levi_civita",
+        "minus",
+        "neel_state",
+        "perm_state",
+        "plus",
+        "singlet",
+        "singlet_pairs",
+        "thermal_state",
+        "up",
+        "w_state",
+        "werner_state",
+        "xminus",
+        "xplus",
+        "yminus",
+        "yplus",
+        "zminus",
+        "zplus",
+    ),
+    ".linalg.approx_spectral": (
+        "approx_spectral_function",
+        "entropy_subsys_approx",
+        "logneg_subsys_approx",
+        "negativity_subsys_approx",
+        "tr_abs_approx",
+        "tr_exp_approx",
+        "tr_sqrt_approx",
+        "tr_xlogx_approx",
+        "xlogx",
+    ),
+    # Linear algebra functions
+    ".linalg.base_linalg": (
+        "Lazy",
+        "bound_spectrum",
+        "eig",
+        "eigensystem",
+        "eigensystem_partial",
+        "eigh",
+        "eigh_window",
+        "eigvals",
+        "eigvalsh",
+        "eigvalsh_window",
+        "eigvecs",
+        "eigvecsh",
+        "eigvecsh_window",
+        "expm",
+        "expm_multiply",
+        "groundenergy",
+        "groundstate",
+        "norm",
+        "sqrtm",
+        "svd",
+        "svds",
+    ),
+    ".linalg.mpi_launcher": (
+        "can_use_mpi_pool",
+        "get_mpi_pool",
+    ),
+    ".linalg.rand_linalg": (
+        "estimate_rank",
+        "rsvd",
+    ),
+    ".utils": (
+        "LRU",
+        "format_number_with_error",
+        "load_from_disk",
+        "oset",
+        "save_to_disk",
+        "tree_apply",
+        "tree_flatten",
+        "tree_map",
+        "tree_unflatten",
+    ),
+    ".utils_plot": (
+        "plot",
+        "NEUTRAL_STYLE",
+        "default_to_neutral_style",
+        "plot_multi_series_zoom",
+    ),
+    ".utils_profile": (
+        "Profiler",
+        "profile",
+    ),
+    ".utils_warmup": ("warmup",),
+}
 
-# Linear algebra functions
-from .linalg.base_linalg import (
-    Lazy,
-    bound_spectrum,
-    eig,
-    eigensystem,
-    eigensystem_partial,
-    eigh,
-    eigh_window,
-    eigvals,
-    eigvalsh,
-    eigvalsh_window,
-    eigvecs,
-    eigvecsh,
-    eigvecsh_window,
-    expm,
-    expm_multiply,
-    groundenergy,
-    groundstate,
-    norm,
-    sqrtm,
-    svd,
-    svds,
-)
-from .linalg.mpi_launcher import can_use_mpi_pool, get_mpi_pool
-from .linalg.rand_linalg import estimate_rank, rsvd
-from .utils import (
-    LRU,
-    format_number_with_error,
-    load_from_disk,
-    oset,
-    save_to_disk,
-    tree_apply,
-    tree_flatten,
-    tree_map,
-    tree_unflatten,
-)
-from .utils_plot import (
-    plot,
-    NEUTRAL_STYLE,
-    default_to_neutral_style,
-    plot_multi_series_zoom,
+__getattr__, __dir__ = lazy_module_attrs(
+    __name__,
+    _LAZY_IMPORTS,
+    submodules=(
+        "calc",
+        "core",
+        "evo",
+        "experimental",
+        "gates",
+        "gen",
+        "linalg",
+        "schematic",
+        "tensor",
+        "utils",
+        "utils_plot",
+        "utils_profile",
+        "utils_warmup",
+    ),
 )
 
 warnings.filterwarnings("ignore", message="Caching is not available when ")
@@ -417,6 +452,8 @@ __all__ = [
     "plot",
     "plus",
     "prod",
+    "profile",
+    "Profiler",
     "projector",
     "ptr",
     "purify",
@@ -486,6 +523,7 @@ __all__ = [
     "up",
     "vdot",
     "w_state",
+    "warmup",
     "werner_state",
     "Wsqrt",
     "xlogx",
@@ -30,10 +30,12 @@ class HD1GBP(BeliefPropagationCommon):
     ----------
     tn : TensorNetwork
         The hyper tensor network to run GBP on.
-    regions : sequence[sequence[int | str]]
+    regions : sequence[sequence[int | str]] or RegionGraph
         The regions to use for GBP. Each region can be a set of tids and
         indices. If a tid is present in a region, all its indices are
         automatically included in the region when ``autocomplete=True``.
+        A previously constructed ``RegionGraph`` can also be supplied
+        directly, in which case it is reused as is.
     autocomplete : bool, optional
         Whether to automatically compute all intersection subregions for the
         RegionGraph.
@@ -62,14 +64,18 @@ class HD1GBP(BeliefPropagationCommon):
             **kwargs,
         )
 
-        if autocomplete:
-            regions = auto_add_indices(tn, regions)
+        if isinstance(regions, RegionGraph):
+            # reuse a previously constructed region graph
+            self.rg = regions
+        else:
+            if autocomplete:
+                regions = auto_add_indices(tn, regions)
 
-        self.rg = RegionGraph(
-            regions,
-            autocomplete=autocomplete,
-            autoprune=autoprune,
-        )
+            self.rg = RegionGraph(
+                regions,
+                autocomplete=autocomplete,
+                autoprune=autoprune,
+            )
         self.messages = {}
         self.new_messages = {}
         self.contract_opts = dict(
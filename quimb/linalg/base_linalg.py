@@ -22,6 +22,7 @@ from .scipy_linalg import (
     svds_scipy,
     svds_primme,
 )
+from .davidson_linalg import eigs_davidson
 from . import SLEPC4PY_FOUND
 
 if SLEPC4PY_FOUND:
@@ -73,6 +74,7 @@ _EIGS_METHODS = {
     "SCIPY": eigs_scipy,
     "PRIMME": eigs_primme,
     "LOBPCG": eigs_lobpcg,
+    "DAVIDSON": eigs_davidson,
     "SLEPC": eigs_slepc_spawn,
     "SLEPC-NOMPI": eigs_slepc,
 }
@@ -122,8 +124,8 @@ def eigensystem_partial(
         An initial vector guess to iterate with.
     sort : bool, optional
         Whether to explicitly sort by ascending eigenvalue order.
-    backend : {'AUTO', 'NUMPY', 'SCIPY',
-               'LOBPCG', 'SLEPC', 'SLEPC-NOMPI'}, optional
+    backend : {'AUTO', 'NUMPY', 'SCIPY', 'LOBPCG',
+               'DAVIDSON', 'SLEPC', 'SLEPC-NOMPI'}, optional
         Which solver to use.
     fallback_to_scipy : bool, optional
         If an error occurs and scipy is not being used, try using scipy.
@@ -531,8 +533,97 @@ def expm(A, herm=False):
         return evecs @ ldmul(np.exp(evals), dag(evecs))
 
 
+def _krylov_expm_err(H, k, h_next, tau):
+    """Estimate the error of approximating ``expm(tau * A) @ v`` with the
+    ``k`` dimensional Krylov subspace with hessenberg matrix ``H``.
+    """
+    return abs(h_next * sla.expm(tau * H[:k, :k])[-1, 0])
+
+
+def expm_multiply_krylov(mat, vec, tol=1e-12, ncv=30):
+    """Compute the action of ``expm(mat)`` on ``vec`` by projecting ``mat``
+    into a Krylov subspace generated by ``vec`` using the Arnoldi iteration.
+    Only matrix-vector products with ``mat`` are needed, so it can be a
+    ``LinearOperator``. If the subspace doesn't converge to ``tol`` within
+    ``ncv`` vectors, the exponential is applied in smaller sub-steps,
+    reusing the subspace, as in Expokit [1].
+
+    [1] R. B. Sidje, "Expokit: A Software Package for Computing Matrix
+    Exponentials", ACM Trans. Math. Softw. 24, 130-156 (1998).
+
+    Parameters
+    ----------
+    mat : operator
+        Operator with which to act with exponential on ``vec``.
+    vec : vector-like
+        Vector to act with exponential of operator on.
+    tol : float, optional
+        The estimated error, relative to the norm of ``vec``, allowed for
+        each sub-step.
+    ncv : int, optional
+        The maximum size of the Krylov subspace.
+
+    Returns
+    -------
+    vector
+        Result of ``expm(mat) @ vec``.
+    """
+    shape = np.shape(vec)
+    w = np.asarray(vec).ravel()
+    w = w.astype(np.result_type(w, mat.dtype, np.float64))
+    n = w.size
+    m = min(ncv, n)
+
+    V = np.empty((n, m + 1), dtype=w.dtype)
+    H = np.zeros((m + 1, m), dtype=w.dtype)
+    t_left = 1.0
+
+    while t_left > 0.0:
+        beta = np.linalg.norm(w)
+        if beta == 0.0:
+            break
+
+        # arnoldi iteration, with the a-posteriori error estimate of the
+        # exponential from the next, neglected, subdiagonal element
+        V[:, 0] = w / beta
+        H[:] = 0.0
+        happy = False
+        for k in range(1, m + 1):
+            u = np.asarray(mat @ V[:, k - 1]).ravel()
+            for _ in range(2):
+                h = V[:, :k].conj().T @ u
+                u = u - V[:, :k] @ h
+                H[:k, k - 1] += h
+            H[k, k - 1] = h_next = np.linalg.norm(u)
+
+            # happy breakdown -> subspace is invariant and result exact
+            happy = h_next <= 1e-14 * beta
+            if happy:
+                break
+
+            V[:, k] = u / h_next
+            if _krylov_expm_err(H, k, h_next, t_left) <= tol:
+                break
+
+        # step as far as possible within the error tolerance, shrinking the
+        # step according to the error scaling ~ tau^k, as in expokit
+        tau = t_left
+        if not happy:
+            for _ in range(20):
+                err = _krylov_expm_err(H, k, h_next, tau)
+                if err <= tol:
+                    break
+                tau *= 0.9 * (tol / err) ** (1 / k)
+
+        w = beta * (V[:, :k] @ sla.expm(tau * H[:k, :k])[:, 0])
+        t_left -= tau
+
+    return w.reshape(shape)
+
+
 _EXPM_MULTIPLY_METHODS = {
     "SCIPY": spla.expm_multiply,
+    "KRYLOV": expm_multiply_krylov,
     "SLEPC": functools.partial(mfn_multiply_slepc_spawn, fntype="exp"),
     "SLEPC-KRYLOV": functools.partial(
         mfn_multiply_slepc_spawn, fntype="exp", MFNType="KRYLOV"
@@ -553,8 +644,10 @@ def expm_multiply(mat, vec, backend="AUTO", **kwargs):
         Operator with which to act with exponential on ``vec``.
     vec : vector-like
         Vector to act with exponential of operator on.
-    backend : {'AUTO', 'SCIPY', 'SLEPC', 'SLEPC-KRYLOV', 'SLEPC-EXPOKIT'}
-        Which backend to use.
+    backend : {'AUTO', 'SCIPY', 'KRYLOV', 'SLEPC', 'SLEPC-KRYLOV',
+               'SLEPC-EXPOKIT'}
+        Which backend to use. ``'KRYLOV'`` only requires matrix-vector
+        products, see :func:`expm_multiply_krylov`.
     kwargs
         Supplied to backend function.
 
@@ -0,0 +1,254 @@
+"""Lightweight block Davidson eigensolver, suited to the many small, warm
+started, extremal eigenproblems that arise in e.g. DMRG.
+"""
+
+import numpy as np
+
+import quimb as qu
+
+from .scipy_linalg import maybe_sort_and_project
+
+
+def _orthonormalize_against(W, V, thresh=1e-10):
+    """Orthonormalize the columns of ``W`` against those of ``V`` (assumed
+    orthonormal) and each other, dropping any that are linearly dependent.
+    """
+    new = []
+    for j in range(W.shape[1]):
+        w = W[:, j]
+        nrm0 = nrm = np.linalg.norm(w)
+        if nrm0 == 0.0:
+            continue
+
+        # classical gram-schmidt, repeated while there is significant
+        # cancellation, which otherwise leaves components along ``V``
+        for _ in range(4):
+            if V.shape[1]:
+                w = w - V @ (V.conj().T @ w)
+            for u in new:
+                w = w - u * np.vdot(u, w)
+            nrm_new = np.linalg.norm(w)
+            if nrm_new > 0.5 * nrm:
+                break
+            nrm = nrm_new
+
+        if nrm_new > thresh * nrm0:
+            new.append(w / nrm_new)
+
+    if not new:
+        return W[:, :0]
+    return np.stack(new, axis=1)
+
+
+def _apply(A, V):
+    """Apply the operator ``A`` to each column of ``V``."""
+    if callable(A) and not hasattr(A, "shape"):
+        return np.stack([A(V[:, j]) for j in range(V.shape[1])], axis=1)
+    return np.asarray(A @ V).reshape(V.shape[0], -1)
+
+
+def eigs_davidson(
+    A,
+    k,
+    *,
+    B=None,
+    v0=None,
+    which=None,
+    return_vecs=True,
+    sigma=None,
+    isherm=True,
+    P=None,
+    sort=True,
+    tol=None,
+    ncv=None,
+    maxiter=None,
+    precond=None,
+    **davidson_opts,
+):
+    """Find a few extremal eigenpairs of a hermitian operator using the
+    (block) Davidson method, with an optional diagonal preconditioner. It has
+    very little setup cost, and converges rapidly when started from a good
+    guess ``v0``, making it well suited to the local eigenproblems in DMRG.
+    For ``k > 1``, the ``k`` Ritz vectors are refined simultaneously (block
+    Davidson).
+
+    Parameters
+    ----------
+    A : array_like, sparse_matrix, LinearOperator or callable
+        The hermitian operator to solve for. If ``precond`` is not given and
+        ``A`` has a ``diagonal`` method, it is used to precondition.
+    k : int
+        Number of eigenpairs to return.
+    B : None
+        Generalized eigenproblems are not supported.
+    v0 : array_like (d,) or (d, m), optional
+        The initial guess(es) to start iterating from. If fewer than ``k``
+        are given the remainder are random.
+    which : {'SA', 'LA'}, optional
+        Find the smallest (default) or largest eigenvalues.
+    return_vecs : bool, optional
+        Whether to return the eigenvectors found.
+    isherm : bool, optional
+        Must be ``True``.
+    P : array_like, sparse_matrix, LinearOperator or callable, optional
+        Perform the eigensolve in the subspace defined by this projector.
+    sort : bool, optional
+        Whether to ensure the eigenvalues are sorted in ascending value.
+    tol : float, optional
+        Converge once the residual norm of each eigenpair is below ``tol``
+        times the magnitude of its eigenvalue (or 1 if larger), default 1e-10.
+    ncv : int, optional
+        The maximum subspace size before restarting, default 20, and at least
+        ``3 * k``. On restart, the current and previous Ritz vectors are kept,
+        so even small subspaces converge well.
+    maxiter : int, optional
+        The maximum number of iterations, each of which applies ``A`` to (at
+        most) ``k`` new vectors, default 100. If reached, the current best
+        estimates are returned.
+    precond : array_like (d,), optional
+        The diagonal of ``A``, used to form the Davidson correction vectors
+        ``(theta - diag(A))^-1 r``. If not given (and not available from
+        ``A.diagonal()``) the plain residuals are used, which is then
+        equivalent to a restarted Lanczos method.
+
+    Returns
+    -------
+    lk : array_like (k,)
+        The eigenvalues.
+    vk : array_like (d, k)
+        The eigenvectors, if ``return_vecs=True``.
+
+    See Also
+    --------
+    eigs_scipy, eigs_lobpcg
+    """
+    if not isherm:
+        raise ValueError("davidson can only solve hermitian problems.")
+    if sigma is not None:
+        raise ValueError("davidson can only solve extremal eigenvalues.")
+    if B is not None:
+        raise ValueError("davidson can't solve generalized eigenproblems.")
+
+    # options that might get passed that davidson doesn't support
+    davidson_opts.pop("EPSType", None)
+    if davidson_opts:
+        raise TypeError(f"Unexpected options: {tuple(davidson_opts)}.")
+
+    largest = {None: False, "SA": False, "LA": True}[
+        None if which is None else which.upper()
+    ]
+
+    if isinstance(A, qu.Lazy):
+        A = A()
+    if isinstance(P, qu.Lazy):
+        P = P()
+
+    # project into subspace
+    if P is not None:
+        A = qu.dag(P) @ (A @ P)
+        precond = None
+
+    # avoid matrix like behaviour
+    if isinstance(A, qu.qarray):
+        A = A.toarray()
+
+    if precond is None and hasattr(A, "diagonal"):
+        precond = A.diagonal()
+    if precond is not None:
+        precond = np.real(np.asarray(precond)).ravel()
+
+    d = A.shape[0]
+    tol = 1e-10 if tol is None else tol
+    max_space = min(d, max(20 if ncv is None else ncv, 3 * k))
+    maxiter = 100 if maxiter is None else maxiter
+
+    dtype = np.result_type(A.dtype, np.float64)
+    if v0 is not None:
+        v0 = np.asarray(v0)
+        # check if intial space should be projected too
+        if P is not None and v0.shape[0] != d:
+            v0 = qu.dag(P) @ v0
+        v0 = v0.reshape(d, -1)
+        dtype = np.result_type(dtype, v0.dtype)
+    else:
+        v0 = np.empty((d, 0), dtype=dtype)
+
+    # if not enough initial states given, flesh out with random
+    if v0.shape[1] < k:
+        v0 = np.hstack((v0, qu.randn((d, k - v0.shape[1]), dtype=dtype)))
+
+    # preallocate the subspace, its image, and the projected operator
+    V = np.empty((d, max_space), dtype=dtype)
+    AV = np.empty((d, max_space), dtype=dtype)
+    H = np.zeros((max_space, max_space), dtype=dtype)
+    m = 0
+
+    def extend(T):
+        nonlocal m
+        p = T.shape[1]
+        V[:, m : m + p] = T
+        AV[:, m : m + p] = _apply(A, T)
+        Hnew = V[:, : m + p].conj().T @ AV[:, m : m + p]
+        H[: m + p, m : m + p] = Hnew
+        H[m : m + p, :m] = Hnew[:m].conj().T
+        m += p
+
+    extend(_orthonormalize_against(v0.astype(dtype), V[:, :0]))
+    y_prev = None
+
+    for _ in range(maxiter):
+        # rayleigh-ritz in the current subspace
+        Hm = H[:m, :m]
+        theta, y = np.linalg.eigh((Hm + Hm.conj().T) / 2)
+        sel = slice(-k, None) if largest else slice(k)
+        theta, y = theta[sel], y[:, sel]
+        X, AX = V[:, :m] @ y, AV[:, :m] @ y
+        R = AX - X * theta
+
+        rnorms = np.linalg.norm(R, axis=0)
+        unconverged = rnorms > tol * np.maximum(np.abs(theta), 1.0)
+        if (not np.any(unconverged)) or (m >= d):
+            break
+
+        # davidson correction vectors from the unconverged residuals
+        T = R[:, unconverged]
+        if precond is not None:
+            denom = precond[:, None] - theta[unconverged]
+            small = np.abs(denom) < 1e-8
+            denom[small] = np.where(denom[small] < 0, -1e-8, 1e-8)
+            # olsen's correction, which projects out the component along
+            # the ritz vector that an accurate preconditioner would otherwise
+            # reproduce, causing stagnation
+            Xu = X[:, unconverged]
+            MR, MX = T / denom, Xu / denom
+            eps = np.sum(Xu.conj() * MR, axis=0) / np.sum(
+                Xu.conj() * MX, axis=0
+            )
+            T = MR - eps * MX
+
+        if m + T.shape[1] > max_space:
+            # thick restart keeping the current and previous ritz vectors,
+            # which both lie in the current subspace -> no new matvecs
+            C = y if y_prev is None else np.hstack((y, y_prev))
+            C = _orthonormalize_against(C, C[:, :0])
+            q = C.shape[1]
+            V[:, :q] = V[:, :m] @ C
+            AV[:, :q] = AV[:, :m] @ C
+            H[:q, :q] = C.conj().T @ H[:m, :m] @ C
+            y = C.conj().T @ y
+            m = q
+            T = T[:, : max_space - m]
+
+        T = _orthonormalize_against(T, V[:, :m])
+        if T.shape[1] == 0:
+            # no new directions, subspace has stagnated
+            break
+
+        # coefficients of the current ritz vectors in the expanded subspace
+        y_prev = np.vstack((y, np.zeros((T.shape[1], y.shape[1]), dtype)))
+        extend(T)
+
+    if return_vecs:
+        return maybe_sort_and_project(theta, qu.qarray(X), P, sort)
+    else:
+        return np.sort(theta) if sort else theta
@@ -1,8 +1,11 @@
 import functools
+import heapq
+import itertools
 import math
 import operator
 
 import autoray as ar
+import numpy as np
 
 from quimb.tensor import TensorNetwork, array_contract, bonds
 from quimb.utils import RollingDiffMean
@@ -52,6 +55,14 @@ class BeliefPropagationCommon:
         ``zvals`` at corresponding points ``zval_its``.
     inplace : bool, optional
         Whether to perform any operations inplace on the input tensor network.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, which
+        should have a ``submit`` method. If ``True`` or an integer, use a
+        thread pool with the default or that number of workers. For
+        sequential updates, the messages are grouped by a greedy coloring of
+        the graph, such that messages within a group are independent and can
+        be computed at once, with each group inserted before the next is
+        computed.
     """
 
     def __init__(
@@ -64,8 +75,10 @@ class BeliefPropagationCommon:
         distance=None,
         contract_every=None,
         inplace=False,
+        executor=None,
     ):
         self.tn = tn if inplace else tn.copy()
+        self.executor = maybe_get_thread_pool(executor)
         self.backend = self.tn.backend
         self.dtype = self.tn.dtype
         self.sign = 1.0
@@ -126,9 +139,17 @@ class BeliefPropagationCommon:
 
     @normalize.setter
     def normalize(self, normalize):
+        # the batched variants act on stacks of matrix messages, with shape
+        # ``(n, d, d)``, normalizing each of the ``n`` messages independently
+        axis = (-2, -1)
+
         if callable(normalize):
             # custom normalization function
             _normalize_fn = normalize
+            _stack = ar.get_lib_fn(self.backend, "stack")
+
+            def _normalize_fn_batched(bx):
+                return _stack([normalize(x) for x in bx])
 
         elif normalize == "L1":
             _abs = ar.get_lib_fn(self.backend, "abs")
@@ -137,6 +158,9 @@ class BeliefPropagationCommon:
             def _normalize_fn(x):
                 return x / _sum(_abs(x))
 
+            def _normalize_fn_batched(bx):
+                return bx / _sum(_abs(bx), axis=axis, keepdims=True)
+
         elif normalize == "L2":
             _abs = ar.get_lib_fn(self.backend, "abs")
             _sum = ar.get_lib_fn(self.backend, "sum")
@@ -144,9 +168,15 @@ class BeliefPropagationCommon:
             def _normalize_fn(x):
                 return x / (_sum(_abs(x) ** 2) ** 0.5)
 
+            def _normalize_fn_batched(bx):
+                return bx / (
+                    _sum(_abs(bx) ** 2, axis=axis, keepdims=True) ** 0.5
+                )
+
         elif normalize == "L2phased":
             _sum = ar.get_lib_fn(self.backend, "sum")
             _abs = ar.get_lib_fn(self.backend, "abs")
+            _where = ar.get_lib_fn(self.backend, "where")
 
             def _normalize_fn(x):
                 xnrm = float(_sum(_abs(x) ** 2)) ** 0.5
@@ -158,6 +188,16 @@ class BeliefPropagationCommon:
                     xnrm *= sumx
                 return x / xnrm
 
+            def _normalize_fn_batched(bx):
+                xnrm = _sum(_abs(bx) ** 2, axis=axis, keepdims=True) ** 0.5
+                sumx = _sum(bx, axis=axis, keepdims=True)
+                abs_sumx = _abs(sumx)
+                # messages summing to zero are left unphased
+                iszero = abs_sumx == 0.0
+                phase = sumx / _where(iszero, 1.0, abs_sumx)
+                phase = _where(iszero, 1.0, phase)
+                return bx / (xnrm * phase)
+
         elif normalize == "Linf":
             _abs = ar.get_lib_fn(self.backend, "abs")
             _max = ar.get_lib_fn(self.backend, "max")
@@ -165,11 +205,15 @@ class BeliefPropagationCommon:
             def _normalize_fn(x):
                 return x / _max(_abs(x))
 
+            def _normalize_fn_batched(bx):
+                return bx / _max(_abs(bx), axis=axis, keepdims=True)
+
         else:
             raise ValueError(f"Unrecognized normalize={normalize}")
 
         self._normalize = normalize
         self._normalize_fn = _normalize_fn
+        self._normalize_fn_batched = _normalize_fn_batched
 
     @property
     def distance(self):
@@ -177,9 +221,18 @@ class BeliefPropagationCommon:
 
     @distance.setter
     def distance(self, distance):
+        # the batched variants act on two stacks of matrix messages, with
+        # shape ``(n, d, d)``, returning the ``n`` distances as a numpy array
+        axis = (-2, -1)
+
         if callable(distance):
             _distance_fn = distance
 
+            def _distance_fn_batched(bx, by):
+                return np.array(
+                    [float(distance(x, y)) for x, y in zip(bx, by)]
+                )
+
         elif distance == "L1":
             _abs = ar.get_lib_fn(self.backend, "abs")
             _sum = ar.get_lib_fn(self.backend, "sum")
@@ -187,6 +240,9 @@ class BeliefPropagationCommon:
             def _distance_fn(x, y):
                 return float(_sum(_abs(x - y)))
 
+            def _distance_fn_batched(bx, by):
+                return ar.to_numpy(_sum(_abs(bx - by), axis=axis))
+
         elif distance == "L2":
             _abs = ar.get_lib_fn(self.backend, "abs")
             _sum = ar.get_lib_fn(self.backend, "sum")
@@ -194,6 +250,9 @@ class BeliefPropagationCommon:
             def _distance_fn(x, y):
                 return float(_sum(_abs(x - y) ** 2) ** 0.5)
 
+            def _distance_fn_batched(bx, by):
+                return ar.to_numpy(_sum(_abs(bx - by) ** 2, axis=axis) ** 0.5)
+
         elif distance == "L2phased":
             _conj = ar.get_lib_fn(self.backend, "conj")
             _sum = ar.get_lib_fn(self.backend, "sum")
@@ -210,6 +269,15 @@ class BeliefPropagationCommon:
                 # L2 distance between normalized, phased vectors
                 return float(_sum(_abs(xn - yn) ** 2) ** 0.5)
 
+            def _distance_fn_batched(bx, by):
+                xnorm = _sum(_abs(bx) ** 2, axis=axis, keepdims=True) ** 0.5
+                ynorm = _sum(_abs(by) ** 2, axis=axis, keepdims=True) ** 0.5
+                cs = _sum(_conj(bx) * by, axis=axis, keepdims=True)
+                phase = cs / _abs(cs)
+                xn = bx / xnorm
+                yn = by / (ynorm * phase)
+                return ar.to_numpy(_sum(_abs(xn - yn) ** 2, axis=axis) ** 0.5)
+
         elif distance == "Linf":
             _abs = ar.get_lib_fn(self.backend, "abs")
             _max = ar.get_lib_fn(self.backend, "max")
@@ -217,6 +285,9 @@ class BeliefPropagationCommon:
             def _distance_fn(x, y):
                 return float(_max(_abs(x - y)))
 
+            def _distance_fn_batched(bx, by):
+                return ar.to_numpy(_max(_abs(bx - by), axis=axis))
+
         elif distance == "cosine":
             # this is like L2phased, but with less precision
             _conj = ar.get_lib_fn(self.backend, "conj")
@@ -232,11 +303,19 @@ class BeliefPropagationCommon:
                 cs = min(max(cs, -1.0), 1.0)
                 return (2 - 2 * cs) ** 0.5
 
+            def _distance_fn_batched(bx, by):
+                xnorm = _sum(_abs(bx) ** 2, axis=axis) ** 0.5
+                ynorm = _sum(_abs(by) ** 2, axis=axis) ** 0.5
+                cs = _abs(_sum(_conj(bx) * by, axis=axis)) / (xnorm * ynorm)
+                cs = np.clip(ar.to_numpy(cs), -1.0, 1.0)
+                return (2 - 2 * cs) ** 0.5
+
         else:
             raise ValueError(f"Unrecognized distance={distance}")
 
         self._distance = distance
         self._distance_fn = _distance_fn
+        self._distance_fn_batched = _distance_fn_batched
 
     def _maybe_contract(self):
         should_contract = (
@@ -688,6 +767,63 @@ def normalize_message_pair(mi, mj):
     return mi / (nij * nii / njj), mj / (nij * njj / nii)
 
 
+class ResidualQueue:
+    """Priority queue of message residuals for residual belief propagation,
+    where the update with the largest residual is always performed first.
+    Pushing a key again replaces its residual, with any old heap entries being
+    skipped lazily.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._residuals = {}
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._residuals)
+
+    def push(self, key, residual):
+        """Set the residual of ``key``."""
+        residual = float(residual)
+        c = next(self._counter)
+        self._residuals[key] = (residual, c)
+        heapq.heappush(self._heap, (-residual, c, key))
+
+    def raise_to(self, key, residual):
+        """Set the residual of ``key`` to ``residual``, if it is larger than
+        the current value.
+        """
+        current = self._residuals.get(key, (-1.0, None))[0]
+        if residual > current:
+            self.push(key, residual)
+
+    def _clean(self):
+        # drop any heap entries that have been superseded or popped
+        while self._heap:
+            _, c, key = self._heap[0]
+            if self._residuals.get(key, (None, None))[1] == c:
+                break
+            heapq.heappop(self._heap)
+
+    def max_residual(self):
+        """The current largest residual, or 0.0 if the queue is empty."""
+        self._clean()
+        if not self._heap:
+            return 0.0
+        return -self._heap[0][0]
+
+    def pop(self):
+        """Remove and return the key with the largest residual."""
+        self._clean()
+        _, _, key = heapq.heappop(self._heap)
+        del self._residuals[key]
+        return key
+
+    def count_above(self, tol):
+        """The number of keys with residual greater than ``tol``."""
+        return sum(r > tol for r, _ in self._residuals.values())
+
+
 def maybe_get_thread_pool(thread_pool):
     """Get a thread pool if requested."""
     if thread_pool is False:
@@ -706,6 +842,91 @@ def maybe_get_thread_pool(thread_pool):
     return thread_pool
 
 
+def _call_chunk(fn, chunk):
+    return [fn(*args) for args in chunk]
+
+
+def executor_map(executor, fn, args, chunksize=None):
+    """Call ``fn(*a)`` for each ``a`` in ``args``, returning the results in
+    order, optionally using ``executor``. The calls are split into chunks,
+    by default about four per worker, each submitted as a single task, to
+    amortize the overhead of submission, especially for process pools, for
+    which ``fn`` and ``args`` should be picklable.
+
+    Parameters
+    ----------
+    executor : Executor or None
+        The executor to use, if None, simply call ``fn`` in serial.
+    fn : callable
+        The function to call.
+    args : sequence[tuple]
+        The positional arguments for each call.
+    chunksize : int, optional
+        How many calls to group into each task.
+
+    Returns
+    -------
+    list
+    """
+    if executor is None:
+        return [fn(*a) for a in args]
+
+    args = list(args)
+    if chunksize is None:
+        nworkers = getattr(executor, "_max_workers", None) or 1
+        chunksize = max(1, -(-len(args) // (4 * nworkers)))
+
+    futs = [
+        executor.submit(_call_chunk, fn, args[i : i + chunksize])
+        for i in range(0, len(args), chunksize)
+    ]
+    return [x for fut in futs for x in fut.result()]
+
+
+def greedy_coloring(neighbors):
+    """Greedily color the nodes of a graph, largest degree first, such that
+    no two neighboring nodes share a color.
+
+    Parameters
+    ----------
+    neighbors : dict[hashable, sequence[hashable]]
+        The neighbors of each node.
+
+    Returns
+    -------
+    colors : dict[hashable, int]
+        The color of each node, with the lowest colors the most common.
+    """
+    colors = {}
+    for node in sorted(neighbors, key=lambda n: -len(neighbors[n])):
+        used = {colors[n] for n in neighbors[node] if n in colors}
+        colors[node] = next(c for c in itertools.count() if c not in used)
+    return colors
+
+
+def group_by_color(keys, colors, key_to_node=None):
+    """Group ``keys`` by the color of their node, in order of color.
+
+    Parameters
+    ----------
+    keys : iterable[hashable]
+        The keys to group, e.g. messages or tensor ids.
+    colors : dict[hashable, int]
+        The color of each node, e.g. from :func:`greedy_coloring`.
+    key_to_node : callable, optional
+        Map each key to its node, by default the keys are the nodes.
+
+    Returns
+    -------
+    groups : list[list[hashable]]
+    """
+    groups = {}
+    for key in keys:
+        node = key if key_to_node is None else key_to_node(key)
+        groups.setdefault(colors[node], []).append(key)
+    return [groups[c] for c in sorted(groups)]
+
+
 def create_lazy_community_edge_map(tn, site_tags=None, rank_simplify=True):
     """For lazy BP algorithms, create the data structures describing the
     effective graph of the lazily grouped 'sites' given by ``site_tags``.
@@ -16,7 +16,11 @@ from quimb.utils import oset
 
 from .bp_common import (
     BeliefPropagationCommon,
+    ResidualQueue,
     combine_local_contractions,
+    executor_map,
+    greedy_coloring,
+    group_by_color,
     normalize_message_pair,
     process_loop_series_expansion_weights,
 )
@@ -66,12 +70,19 @@ class D1BP(BeliefPropagationCommon):
         of the old message into the new one, with the final message being
         ``damping * old + (1 - damping) * new``. This makes convergence more
         reliable but slower.
-    update : {'sequential', 'parallel'}, optional
+    update : {'sequential', 'parallel', 'residual'}, optional
         Whether to update messages sequentially (newly computed messages are
         immediately used for other updates in the same iteration round) or in
         parallel (all messages are comptued using messages from the previous
         round only). Sequential generally helps convergence but parallel can
-        possibly converge to differnt solutions.
+        possibly converge to differnt solutions. 'residual' keeps a priority
+        queue of tensor residuals, estimated as the largest change of each
+        tensor's incoming messages since its outgoing messages were last
+        updated, and always updates the tensor with the largest residual
+        first. Each iteration then performs at most one update per tensor,
+        stopping early once the largest residual falls below ``tol``, so that
+        late in convergence only the few messages still changing are
+        recomputed.
     normalize : {'L1', 'L2', 'L2phased', 'Linf', callable}, optional
         How to normalize messages after each update. If None choose
         automatically. If a callable, it should take a message and return the
@@ -96,6 +107,14 @@ class D1BP(BeliefPropagationCommon):
         ``zvals`` at corresponding points ``zval_its``.
     inplace : bool, optional
         Whether to perform any operations inplace on the input tensor network.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, e.g. a
+        ``ThreadPoolExecutor``, for 'sequential' and 'parallel' updates. If
+        ``True`` or an integer, use a thread pool with the default or that
+        number of workers. Sequential updates are then performed one color
+        group of tensors at a time, where the groups come from a greedy
+        coloring of the tensor network, such that the messages leaving all
+        tensors of the same color can be computed at once.
 
     Attributes
     ----------
@@ -122,6 +141,7 @@ class D1BP(BeliefPropagationCommon):
         message_init_function=None,
         contract_every=None,
         inplace=False,
+        executor=None,
     ):
         super().__init__(
             tn=tn,
@@ -131,6 +151,7 @@ class D1BP(BeliefPropagationCommon):
             distance=distance,
             contract_every=contract_every,
             inplace=inplace,
+            executor=executor,
         )
 
         self.local_convergence = local_convergence
@@ -142,6 +163,8 @@ class D1BP(BeliefPropagationCommon):
 
         # record which messages touch which tids, for efficient updates
         self.touched = oset()
+        self._residual_queue = None
+        self._colors = None
         self.key_pairs = {}
         for ix, tids in tn.ind_map.items():
             if len(tids) != 2:
@@ -150,7 +173,87 @@ class D1BP(BeliefPropagationCommon):
             self.key_pairs[ix, tidb] = (ix, tida)
             self.key_pairs[ix, tida] = (ix, tidb)
 
+    def _get_colors(self):
+        """Get a greedy coloring of the tensors, such that no two tensors
+        sharing a bond have the same color.
+        """
+        if self._colors is None:
+            self._colors = greedy_coloring(
+                {
+                    tid: [
+                        self.key_pairs[ix, tid][1]
+                        for ix in t.inds
+                        if (ix, tid) in self.key_pairs
+                    ]
+                    for tid, t in self.tn.tensor_map.items()
+                }
+            )
+        return self._colors
+
+    def _compute_ms(self, tid):
+        """Compute the candidate new messages sent out from tensor ``tid``,
+        returning their keys and values.
+        """
+        t = self.tn.tensor_map[tid]
+        new_ms = compute_all_tensor_messages_tree(
+            t.data,
+            [self.messages[ix, tid] for ix in t.inds],
+            self.backend,
+        )
+        new_ms = [self._normalize_fn(m) for m in new_ms]
+        new_ks = [self.key_pairs[ix, tid] for ix in t.inds]
+
+        return new_ks, new_ms
+
+    def _iterate_residual(self, tol):
+        """Perform up to one update per tensor, largest residual first. The
+        residual of each tensor is estimated, without recomputing its
+        messages, as the largest change of any incoming message since its
+        outgoing messages were last updated.
+        """
+        if self._residual_queue is None:
+            self._residual_queue = ResidualQueue()
+            self.touched = oset(self.tn.tensor_map)
+
+        # any tensors marked as changed externally are updated first
+        while self.touched:
+            self._residual_queue.push(self.touched.pop(), float("inf"))
+
+        ncheck = 0
+        for _ in range(self.tn.num_tensors):
+            if self._residual_queue.max_residual() < tol:
+                break
+
+            tid = self._residual_queue.pop()
+            keys, new_ms = self._compute_ms(tid)
+            ncheck += 1
+
+            for key, new_m in zip(keys, new_ms):
+                old_m = self.messages[key]
+                mdiff = float(self._distance_fn(old_m, new_m))
+                self.messages[key] = self._damping_fn(old_m, new_m)
+
+                if mdiff > tol:
+                    # only the receiving tensor's messages can change
+                    self._residual_queue.raise_to(key[1], mdiff)
+                    if self.damping:
+                        # the new message has not been fully reached yet
+                        self._residual_queue.raise_to(
+                            tid, self.damping * mdiff
+                        )
+
+        nconv = self.tn.num_tensors - self._residual_queue.count_above(tol)
+
+        return {
+            "nconv": nconv,
+            "ncheck": ncheck,
+            "max_mdiff": self._residual_queue.max_residual(),
+        }
+
     def iterate(self, tol=5e-6):
+        if self.update == "residual":
+            return self._iterate_residual(tol)
+
         if (not self.local_convergence) or (not self.touched):
             # assume if asked to iterate that we want to check all messages
             self.touched = oset(self.tn.tensor_map)
@@ -160,17 +263,7 @@ class D1BP(BeliefPropagationCommon):
         max_mdiff = -1.0
         new_touched = oset()
 
-        def _compute_ms(tid):
-            t = self.tn.tensor_map[tid]
-            new_ms = compute_all_tensor_messages_tree(
-                t.data,
-                [self.messages[ix, tid] for ix in t.inds],
-                self.backend,
-            )
-            new_ms = [self._normalize_fn(m) for m in new_ms]
-            new_ks = [self.key_pairs[ix, tid] for ix in t.inds]
-
-            return new_ks, new_ms
+        _compute_ms = self._compute_ms
 
         def _update_m(key, new_m):
             nonlocal nconv, max_mdiff
@@ -195,7 +288,18 @@ class D1BP(BeliefPropagationCommon):
             max_mdiff = max(max_mdiff, mdiff)
             self.messages[key] = new_m
 
-        if self.update == "sequential":
+        if self.update == "sequential" and self.executor is not None:
+            # compute the messages leaving each color group of tensors
+            # concurrently, inserting them before the next group
+            for tids in group_by_color(self.touched, self._get_colors()):
+                for keys, new_ms in executor_map(
+                    self.executor, _compute_ms, [(tid,) for tid in tids]
+                ):
+                    for key, new_m in zip(keys, new_ms):
+                        _update_m(key, new_m)
+            self.touched.clear()
+
+        elif self.update == "sequential":
             # compute each new message and immediately re-insert it
             while self.touched:
                 tid = self.touched.pop()
@@ -206,9 +310,11 @@ class D1BP(BeliefPropagationCommon):
         elif self.update == "parallel":
             new_data = {}
             # compute all new messages
-            while self.touched:
-                tid = self.touched.pop()
-                keys, new_ms = _compute_ms(tid)
+            tids = tuple(self.touched)
+            self.touched.clear()
+            for keys, new_ms in executor_map(
+                self.executor, _compute_ms, [(tid,) for tid in tids]
+            ):
                 for key, new_m in zip(keys, new_ms):
                     new_data[key] = new_m
             # insert all new messages
@@ -570,6 +676,7 @@ def contract_d1bp(
     check_zero=True,
     info=None,
     progbar=False,
+    executor=None,
     **contract_opts,
 ):
     """Estimate the contraction of standard tensor network ``tn`` using dense
@@ -591,8 +698,9 @@ def contract_d1bp(
         help converge the messages by extrapolating to low error guesses.
         If a dict, should contain options for the DIIS algorithm. The
         relevant options are {`max_history`, `beta`, `rcond`}.
-    update : {'sequential', 'parallel'}, optional
-        Whether to update messages sequentially or in parallel.
+    update : {'sequential', 'parallel', 'residual'}, optional
+        Whether to update messages sequentially, in parallel, or largest
+        residual first.
     normalize : {'L1', 'L2', 'L2phased', 'Linf', callable}, optional
         How to normalize messages after each update. If None choose
         automatically. If a callable, it should take a message and return the
@@ -629,6 +737,9 @@ def contract_d1bp(
         ``rolling_abs_mean_diff`` (float).
     progbar : bool, optional
         Whether to show a progress bar.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, see
+        :class:`~quimb.tensor.belief_propagation.D1BP`.
     """
     bp = D1BP(
         tn,
@@ -637,6 +748,7 @@ def contract_d1bp(
         update=update,
         normalize=normalize,
         distance=distance,
+        executor=executor,
         **contract_opts,
     )
     bp.run(
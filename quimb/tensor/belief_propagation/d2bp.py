@@ -4,13 +4,18 @@ import itertools
 import operator
 
 import autoray as ar
+import numpy as np
 
 import quimb.tensor as qtn
 from quimb.utils import oset
 
 from .bp_common import (
     BeliefPropagationCommon,
+    ResidualQueue,
     combine_local_contractions,
+    executor_map,
+    greedy_coloring,
+    group_by_color,
     normalize_message_pair,
     process_loop_series_expansion_weights,
 )
@@ -62,12 +67,25 @@ class D2BP(BeliefPropagationCommon):
         of the old message into the new one, with the final message being
         ``damping * old + (1 - damping) * new``. This makes convergence more
         reliable but slower.
-    update : {'sequential', 'parallel'}, optional
+    update : {'sequential', 'parallel', 'residual'}, optional
         Whether to update messages sequentially (newly computed messages are
         immediately used for other updates in the same iteration round) or in
         parallel (all messages are comptued using messages from the previous
         round only). Sequential generally helps convergence but parallel can
-        possibly converge to differnt solutions.
+        possibly converge to differnt solutions. 'residual' keeps a priority
+        queue of message residuals, estimated as the largest change of each
+        message's inputs since it was last updated, and always updates the
+        message with the largest residual first. Each iteration then performs
+        at most one update per message, stopping early once the largest
+        residual falls below ``tol``, so that late in convergence only the
+        few messages still changing are recomputed. 'batched' performs
+        parallel updates, but stacks tensors of the same shape, and their
+        messages, so that all messages leaving the same position of every
+        tensor in a group are computed with a single batched contraction,
+        rather than one contraction per message. This greatly reduces the
+        python overhead for large, regular, tensor networks such as PEPS.
+        Every message is then updated each iteration, i.e.
+        ``local_convergence`` is ignored.
     normalize : {'L1', 'L2', 'L2phased', 'Linf', callable}, optional
         How to normalize messages after each update. If None choose
         automatically. If a callable, it should take a message and return the
@@ -92,6 +110,14 @@ class D2BP(BeliefPropagationCommon):
         ``zvals`` at corresponding points ``zval_its``.
     inplace : bool, optional
         Whether to perform any operations inplace on the input tensor network.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, e.g. a
+        ``ThreadPoolExecutor``, for 'sequential' and 'parallel' updates. If
+        ``True`` or an integer, use a thread pool with the default or that
+        number of workers. Sequential updates are then performed one color
+        group of tensors at a time, where the groups come from a greedy
+        coloring of the tensor network, such that all messages leaving
+        tensors of the same color can be computed at once.
     contract_opts
         Other options supplied to ``cotengra.array_contract``.
     """
@@ -110,6 +136,7 @@ class D2BP(BeliefPropagationCommon):
         local_convergence=True,
         contract_every=None,
         inplace=False,
+        executor=None,
         **contract_opts,
     ):
         super().__init__(
@@ -120,6 +147,7 @@ class D2BP(BeliefPropagationCommon):
             distance=distance,
             contract_every=contract_every,
             inplace=inplace,
+            executor=executor,
         )
 
         self.contract_opts = contract_opts
@@ -140,6 +168,9 @@ class D2BP(BeliefPropagationCommon):
         self.touch_map = {}
         self.touched = oset()
         self.exprs = {}
+        self._residual_queue = None
+        self._batched_groups = None
+        self._colors = None
 
         # populate any messages
         for ix, tids in self.tn.ind_map.items():
@@ -147,7 +178,6 @@ class D2BP(BeliefPropagationCommon):
                 continue
 
             tida, tidb = tids
-            jx = ix + "*"
             ta, tb = self.tn._tids_get(tida, tidb)
 
             for tid, t, t_in in ((tida, ta, tb), (tidb, tb, ta)):
@@ -161,21 +191,34 @@ class D2BP(BeliefPropagationCommon):
                 self.touch_map[ix, tid] = this_touchmap
 
                 if (ix, tid) not in self.messages:
-                    m = (t_in.reindex({ix: jx}).conj_() @ t_in).data
-                    self.messages[ix, tid] = self._normalize_fn(m)
+                    self._initialize_message(ix, tid)
 
-        # for efficiency setup all the contraction expressions ahead of time
+        # for efficiency setup all the contraction expressions ahead of time,
+        # recording which data each tensor had when its expressions were built
+        self._built_data = {}
         for ix, tids in self.tn.ind_map.items():
             if ix not in self.output_inds:
                 self.build_expr(ix)
 
+    def _initialize_message(self, ix, tid):
+        """Initialize the message along ``ix`` into tensor ``tid`` as the
+        partial norm of the tensor on the other side of the bond.
+        """
+        (tid_in,) = (n for n in self.tn.ind_map[ix] if n != tid)
+        t_in = self.tn.tensor_map[tid_in]
+        m = (t_in.reindex({ix: ix + "*"}).conj_() @ t_in).data
+        self.messages[ix, tid] = self._normalize_fn(m)
+
     def build_expr(self, ix):
         from quimb.tensor.contraction import array_contract_expression
 
         tids = self.tn.ind_map[ix]
+        # any batched contractions need to be rebuilt
+        self._batched_groups = None
 
         for tida, tidb in (sorted(tids), sorted(tids, reverse=True)):
             ta = self.tn.tensor_map[tida]
+            self._built_data[tida] = ta.data
             kix = ta.inds
             bix = tuple(i if i in self.output_inds else i + "*" for i in kix)
             inputs = [kix, bix]
@@ -219,8 +262,241 @@ class D2BP(BeliefPropagationCommon):
         tids = self.tn._get_tids_from_inds(inds, which)
         self.update_touched_from_tids(*tids)
 
+    def update_touched_from_data(self):
+        """Find any tensors whose data has been changed since their
+        contraction expressions were built, for example when running BP
+        inplace on a tensor network that is then updated by gates. Their
+        expressions are rebuilt (reinitializing any messages whose bond
+        dimension has changed) and their outgoing messages marked as touched,
+        such that, with ``local_convergence=True``, subsequent iterations
+        only update messages in the region affected by the changes. This is
+        called automatically at the start of each iteration. Note only
+        tensors with new data arrays are detected, not arrays modified
+        inplace, and the structure of the network should not change.
+
+        Returns
+        -------
+        changed : tuple[int]
+            The ids of the tensors found to have changed.
+        """
+        changed = tuple(
+            tid
+            for tid, t in self.tn.tensor_map.items()
+            if (tid in self._built_data)
+            and (t.data is not self._built_data[tid])
+        )
+        if not changed:
+            return changed
+
+        rebuild = oset()
+        for tid in changed:
+            for ix in self.tn.tensor_map[tid].inds:
+                if ix in self.output_inds:
+                    continue
+                d = self.tn.ind_size(ix)
+                for ntid in self.tn.ind_map[ix]:
+                    if ar.shape(self.messages[ix, ntid]) != (d, d):
+                        self._initialize_message(ix, ntid)
+                rebuild.add(ix)
+
+        for ix in rebuild:
+            self.build_expr(ix)
+        self.update_touched_from_tids(*changed)
+
+        return changed
+
+    def _get_colors(self):
+        """Get a greedy coloring of the tensors, such that no two tensors
+        sharing a bond have the same color.
+        """
+        if self._colors is None:
+            neighbors = {
+                tid: [
+                    ntid
+                    for ix in t.inds
+                    if ix not in self.output_inds
+                    for ntid in self.tn.ind_map[ix]
+                    if ntid != tid
+                ]
+                for tid, t in self.tn.tensor_map.items()
+            }
+            self._colors = greedy_coloring(neighbors)
+        return self._colors
+
+    def _get_source_tid(self, key):
+        """Get the id of the tensor that message ``key`` is sent from."""
+        ix, tid = key
+        return next(o for o in self.tn.ind_map[ix] if o != tid)
+
+    def _compute_m(self, key):
+        """Compute the candidate new message for ``key``."""
+        expr, data = self.exprs[key]
+        m = expr(*data[:2], *(self.messages[mkey] for mkey in data[2:]))
+        # enforce hermiticity and normalize
+        return self._normalize_fn(m + ar.dag(m))
+
+    def _iterate_residual(self, tol):
+        """Perform up to one update per message, largest residual first. The
+        residual of each message is estimated, without recomputing it, as the
+        largest change of any of its inputs since it was last updated.
+        """
+        if self._residual_queue is None:
+            self._residual_queue = ResidualQueue()
+            self.touched.update(self.exprs.keys())
+
+        # any messages marked as changed externally are updated first
+        while self.touched:
+            self._residual_queue.push(self.touched.pop(), float("inf"))
+
+        ncheck = 0
+        for _ in range(len(self.exprs)):
+            if self._residual_queue.max_residual() < tol:
+                break
+
+            key = self._residual_queue.pop()
+            old_m = self.messages[key]
+            new_m = self._compute_m(key)
+            mdiff = float(self._distance_fn(old_m, new_m))
+            self.messages[key] = self._damping_fn(old_m, new_m)
+            ncheck += 1
+
+            if mdiff > tol:
+                # only the messages this one feeds into can change
+                for nkey in self.touch_map[key]:
+                    self._residual_queue.raise_to(nkey, mdiff)
+                if self.damping:
+                    # the new message has not been fully reached yet
+                    self._residual_queue.raise_to(key, self.damping * mdiff)
+
+        nconv = len(self.exprs) - self._residual_queue.count_above(tol)
+
+        return {
+            "nconv": nconv,
+            "ncheck": ncheck,
+            "max_mdiff": self._residual_queue.max_residual(),
+        }
+
+    def _build_batched_groups(self):
+        """Group the tensors by the shape of their bonds and output indices,
+        stacking them and building, for each bond position, a single
+        contraction expression with a leading batch index that computes the
+        messages leaving that position for every tensor in the group.
+        """
+        from quimb.tensor.contraction import array_contract_expression
+
+        grouped = {}
+        for tid, t in self.tn.tensor_map.items():
+            bix = tuple(ix for ix in t.inds if ix not in self.output_inds)
+            if not bix:
+                continue
+            oix = tuple(ix for ix in t.inds if ix in self.output_inds)
+            bdims = tuple(t.ind_size(ix) for ix in bix)
+            odim = functools.reduce(
+                operator.mul, (t.ind_size(ix) for ix in oix), 1
+            )
+            # transpose to (*bonds, outputs) and fuse the output indices
+            x = ar.do(
+                "transpose", t.data, [t.inds.index(ix) for ix in bix + oix]
+            )
+            x = ar.do("reshape", x, (*bdims, odim))
+            grouped.setdefault((bdims, odim), []).append((tid, bix, x))
+
+        self._batched_groups = []
+        for (bdims, odim), members in grouped.items():
+            n = len(members)
+            data = ar.do("stack", [x for _, _, x in members])
+            # the messages into each tensor for each bond position
+            in_keys = [
+                [(bix[i], tid) for tid, bix, _ in members]
+                for i in range(len(bdims))
+            ]
+            # the messages out of each tensor for each bond position
+            out_keys = [
+                [
+                    (
+                        bix[i],
+                        next(o for o in self.tn.ind_map[bix[i]] if o != tid),
+                    )
+                    for tid, bix, _ in members
+                ]
+                for i in range(len(bdims))
+            ]
+
+            kix = ("_n", *(f"_k{i}" for i in range(len(bdims))), "_p")
+            bix = ("_n", *(f"_b{i}" for i in range(len(bdims))), "_p")
+            exprs = []
+            for i in range(len(bdims)):
+                inputs = [kix, bix]
+                shapes = [(n, *bdims, odim)] * 2
+                for j, d in enumerate(bdims):
+                    if j != i:
+                        inputs.append(("_n", f"_b{j}", f"_k{j}"))
+                        shapes.append((n, d, d))
+                exprs.append(
+                    array_contract_expression(
+                        inputs=inputs,
+                        output=("_n", f"_b{i}", f"_k{i}"),
+                        shapes=shapes,
+                        **self.contract_opts,
+                    )
+                )
+
+            self._batched_groups.append(
+                (data, ar.conj(data), in_keys, out_keys, exprs)
+            )
+
+    def _iterate_batched(self, tol):
+        """Perform a single parallel update of every message, with one
+        batched contraction per group of same shaped tensors and bond
+        position.
+        """
+        if self._batched_groups is None:
+            self._build_batched_groups()
+
+        # all messages are updated regardless
+        self.touched.clear()
+
+        new_messages = []
+        for data, data_conj, in_keys, out_keys, exprs in self._batched_groups:
+            bms = [
+                ar.do("stack", [self.messages[key] for key in keys])
+                for keys in in_keys
+            ]
+            for i, expr in enumerate(exprs):
+                bm = expr(data, data_conj, *bms[:i], *bms[i + 1 :])
+                # enforce hermiticity and normalize
+                bm = bm + ar.conj(ar.do("swapaxes", bm, -1, -2))
+                bm = self._normalize_fn_batched(bm)
+                new_messages.append((out_keys[i], bm))
+
+        ncheck = nconv = 0
+        max_mdiff = -1.0
+        for keys, new_bm in new_messages:
+            old_bm = ar.do("stack", [self.messages[key] for key in keys])
+            mdiffs = self._distance_fn_batched(old_bm, new_bm)
+            if self.damping:
+                new_bm = self._damping_fn(old_bm, new_bm)
+            for key, new_m in zip(keys, new_bm):
+                self.messages[key] = new_m
+
+            ncheck += len(keys)
+            nconv += int(np.sum(mdiffs <= tol))
+            max_mdiff = max(max_mdiff, float(np.max(mdiffs)))
+
+        return {
+            "nconv": nconv,
+            "ncheck": ncheck,
+            "max_mdiff": max_mdiff,
+        }
+
     def iterate(self, tol=5e-6):
         """Perform a single iteration of dense 2-norm belief propagation."""
+        self.update_touched_from_data()
+
+        if self.update == "residual":
+            return self._iterate_residual(tol)
+        if self.update == "batched":
+            return self._iterate_batched(tol)
 
         if (not self.local_convergence) or (not self.touched):
             # assume if asked to iterate that we want to check all messages
@@ -231,11 +507,7 @@ class D2BP(BeliefPropagationCommon):
         max_mdiff = -1.0
         new_touched = oset()
 
-        def _compute_m(key):
-            expr, data = self.exprs[key]
-            m = expr(*data[:2], *(self.messages[mkey] for mkey in data[2:]))
-            # enforce hermiticity and normalize
-            return self._normalize_fn(m + ar.dag(m))
+        _compute_m = self._compute_m
 
         def _update_m(key, new_m):
             nonlocal nconv, max_mdiff
@@ -260,15 +532,29 @@ class D2BP(BeliefPropagationCommon):
             self.messages[key] = new_m
 
         if self.update == "parallel":
-            new_messages = {}
             # compute all new messages
-            while self.touched:
-                key = self.touched.pop()
-                new_messages[key] = _compute_m(key)
+            keys = tuple(self.touched)
+            self.touched.clear()
+            new_ms = executor_map(
+                self.executor, _compute_m, [(key,) for key in keys]
+            )
             # insert all new messages
-            for key, new_m in new_messages.items():
+            for key, new_m in zip(keys, new_ms):
                 _update_m(key, new_m)
 
+        elif self.update == "sequential" and self.executor is not None:
+            # compute the messages leaving each color group of tensors
+            # concurrently, inserting them before the next group
+            for keys in group_by_color(
+                self.touched, self._get_colors(), self._get_source_tid
+            ):
+                new_ms = executor_map(
+                    self.executor, _compute_m, [(key,) for key in keys]
+                )
+                for key, new_m in zip(keys, new_ms):
+                    _update_m(key, new_m)
+            self.touched.clear()
+
         elif self.update == "sequential":
             # compute each new message and immediately re-insert it
             while self.touched:
@@ -1177,6 +1463,7 @@ def contract_d2bp(
     check_zero=True,
     info=None,
     progbar=False,
+    executor=None,
     **contract_opts,
 ):
     """Estimate the norm squared of ``tn`` using dense 2-norm belief
@@ -1203,8 +1490,9 @@ def contract_d2bp(
         help converge the messages by extrapolating to low error guesses.
         If a dict, should contain options for the DIIS algorithm. The
         relevant options are {`max_history`, `beta`, `rcond`}.
-    update : {'sequential', 'parallel'}, optional
-        Whether to update messages sequentially or in parallel.
+    update : {'sequential', 'parallel', 'residual', 'batched'}, optional
+        Whether to update messages sequentially, in parallel, largest
+        residual first, or in parallel batched by tensor shape.
     normalize : {'L1', 'L2', 'L2phased', 'Linf', callable}, optional
         How to normalize messages after each update. If None choose
         automatically. If a callable, it should take a message and return the
@@ -1243,6 +1531,9 @@ def contract_d2bp(
         ``rolling_abs_mean_diff`` (float).
     progbar : bool, optional
         Whether to show a progress bar.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, see
+        :class:`~quimb.tensor.belief_propagation.D2BP`.
     contract_opts
         Other options supplied to ``cotengra.array_contract``.
 
@@ -1260,6 +1551,7 @@ def contract_d2bp(
         update=update,
         normalize=normalize,
         distance=distance,
+        executor=executor,
         **contract_opts,
     )
     bp.run(
@@ -1299,6 +1591,7 @@ def compress_d2bp(
     inplace=False,
     info=None,
     progbar=False,
+    executor=None,
     **contract_opts,
 ):
     """Compress the tensor network ``tn`` using dense 2-norm belief
@@ -1333,8 +1626,9 @@ def compress_d2bp(
         help converge the messages by extrapolating to low error guesses.
         If a dict, should contain options for the DIIS algorithm. The
         relevant options are {`max_history`, `beta`, `rcond`}.
-    update : {'sequential', 'parallel'}, optional
-        Whether to update messages sequentially or in parallel.
+    update : {'sequential', 'parallel', 'residual', 'batched'}, optional
+        Whether to update messages sequentially, in parallel, largest
+        residual first, or in parallel batched by tensor shape.
     normalize : {'L1', 'L2', 'L2phased', 'Linf', callable}, optional
         How to normalize messages after each update. If None choose
         automatically. If a callable, it should take a message and return the
@@ -1370,6 +1664,9 @@ def compress_d2bp(
         belief propagation run.
     progbar : bool, optional
         Whether to show a progress bar.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, see
+        :class:`~quimb.tensor.belief_propagation.D2BP`.
     contract_opts
         Other options supplied to ``cotengra.array_contract``.
 
@@ -1388,6 +1685,7 @@ def compress_d2bp(
         distance=distance,
         local_convergence=local_convergence,
         inplace=inplace,
+        executor=executor,
         **contract_opts,
     )
     bp.run(
@@ -1458,8 +1756,9 @@ def sample_d2bp(
         help converge the messages by extrapolating to low error guesses.
         If a dict, should contain options for the DIIS algorithm. The
         relevant options are {`max_history`, `beta`, `rcond`}.
-    update : {'sequential', 'parallel'}, optional
-        Whether to update messages sequentially or in parallel.
+    update : {'sequential', 'parallel', 'residual', 'batched'}, optional
+        Whether to update messages sequentially, in parallel, largest
+        residual first, or in parallel batched by tensor shape.
     normalize : {'L1', 'L2', 'L2phased', 'Linf', callable}, optional
         How to normalize messages after each update. If None choose
         automatically. If a callable, it should take a message and return the
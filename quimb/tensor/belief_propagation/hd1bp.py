@@ -18,6 +18,7 @@ from .bp_common import (
     combine_local_contractions,
     compute_all_index_marginals_from_messages,
     contract_hyper_messages,
+    executor_map,
     initialize_hyper_messages,
     prod,
 )
@@ -218,6 +219,15 @@ class HD1BP(BeliefPropagationCommon):
         by zero. Note when this happens the numerator will also be zero.
     inplace : bool, optional
         Whether to perform any operations inplace on the input tensor network.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor. If
+        ``True`` or an integer, use a thread pool with the default or that
+        number of workers. The index and tensor messages are each computed in
+        a separate stage, within which all messages are independent, such
+        that the results are the same as in serial. The work is submitted in
+        chunks of picklable functions and arrays, so that a
+        ``ProcessPoolExecutor`` can also be used, e.g. for very large
+        hypergraphs.
     """
 
     def __init__(
@@ -231,6 +241,7 @@ class HD1BP(BeliefPropagationCommon):
         distance=None,
         smudge_factor=1e-12,
         inplace=False,
+        executor=None,
     ):
         super().__init__(
             tn,
@@ -239,6 +250,7 @@ class HD1BP(BeliefPropagationCommon):
             normalize=normalize,
             distance=distance,
             inplace=inplace,
+            executor=executor,
         )
 
         self.smudge_factor = smudge_factor
@@ -282,11 +294,15 @@ class HD1BP(BeliefPropagationCommon):
         max_mdiff = 0.0
 
         # hyper index messages
-        for ix, tids in self.tn.ind_map.items():
-            ms = compute_all_hyperind_messages_prod(
-                [self.messages[tid, ix] for tid in tids],
-                self.smudge_factor,
-            )
+        all_ms = executor_map(
+            self.executor,
+            compute_all_hyperind_messages_prod,
+            [
+                ([self.messages[tid, ix] for tid in tids], self.smudge_factor)
+                for ix, tids in self.tn.ind_map.items()
+            ],
+        )
+        for (ix, tids), ms in zip(self.tn.ind_map.items(), all_ms):
             for tid, m in zip(tids, ms):
                 max_mdiff = _normalize_and_insert((ix, tid), m, max_mdiff)
 
@@ -295,13 +311,16 @@ class HD1BP(BeliefPropagationCommon):
             new_messages.clear()
 
         # tensor messages
-        for tid, t in self.tn.tensor_map.items():
-            inds = t.inds
-            ms = compute_all_tensor_messages_tree(
-                t.data,
-                [self.messages[ix, tid] for ix in inds],
-            )
-            for ix, m in zip(inds, ms):
+        all_ms = executor_map(
+            self.executor,
+            compute_all_tensor_messages_tree,
+            [
+                (t.data, [self.messages[ix, tid] for ix in t.inds])
+                for tid, t in self.tn.tensor_map.items()
+            ],
+        )
+        for (tid, t), ms in zip(self.tn.tensor_map.items(), all_ms):
+            for ix, m in zip(t.inds, ms):
                 max_mdiff = _normalize_and_insert((tid, ix), m, max_mdiff)
 
         if self.update == "parallel":
@@ -453,6 +472,7 @@ def contract_hd1bp(
     check_zero=True,
     info=None,
     progbar=False,
+    executor=None,
 ):
     """Estimate the contraction of ``tn`` with hyper, vectorized, 1-norm
     belief propagation, via the exponential of the Bethe free entropy.
@@ -512,6 +532,9 @@ def contract_hd1bp(
         belief propagation run.
     progbar : bool, optional
         Whether to show a progress bar.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, see
+        :class:`~quimb.tensor.belief_propagation.HD1BP`.
 
     Returns
     -------
@@ -525,6 +548,7 @@ def contract_hd1bp(
         normalize=normalize,
         distance=distance,
         smudge_factor=smudge_factor,
+        executor=executor,
     )
     bp.run(
         max_iterations=max_iterations,
@@ -550,6 +574,7 @@ def run_belief_propagation_hd1bp(
     smudge_factor=1e-12,
     info=None,
     progbar=False,
+    executor=None,
 ):
     """Run belief propagation on a tensor network until it converges. This
     is the basic version that does not vectorize contractions.
@@ -574,6 +599,9 @@ def run_belief_propagation_hd1bp(
         belief propagation run.
     progbar : bool, optional
         Whether to show a progress bar.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, see
+        :class:`~quimb.tensor.belief_propagation.HD1BP`.
 
     Returns
     -------
@@ -583,7 +611,11 @@ def run_belief_propagation_hd1bp(
         Whether the algorithm converged.
     """
     bp = HD1BP(
-        tn, messages=messages, damping=damping, smudge_factor=smudge_factor
+        tn,
+        messages=messages,
+        damping=damping,
+        smudge_factor=smudge_factor,
+        executor=executor,
     )
     bp.run(max_iterations=max_iterations, tol=tol, info=info, progbar=progbar)
     return bp.messages, bp.converged
@@ -600,6 +632,7 @@ def sample_hd1bp(
     bias=False,
     seed=None,
     progbar=False,
+    executor=None,
 ):
     """Sample all indices of a tensor network using repeated belief propagation
     runs and decimation.
@@ -628,15 +661,13 @@ def sample_hd1bp(
         marginals. If ``True``, then each index is 'sampled' to be its largest
         weight value always. If a float, then the local probability
         distribution is raised to this power before sampling.
-    thread_pool : bool, int or ThreadPoolExecutor, optional
-        Whether to use a thread pool for parallelization. If an integer, then
-        this is the number of threads to use. If ``True``, then the number of
-        threads is set to the number of cores. If a ``ThreadPoolExecutor``,
-        then this is used directly.
     seed : int, optional
         A random seed to use for the sampling.
     progbar : bool, optional
         Whether to show a progress bar.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, see
+        :class:`~quimb.tensor.belief_propagation.HD1BP`.
 
     Returns
     -------
@@ -684,6 +715,7 @@ def sample_hd1bp(
             damping=damping,
             smudge_factor=smudge_factor,
             progbar=True,
+            executor=executor,
         )
 
         marginals = compute_all_index_marginals_from_messages(
@@ -1,3 +1,5 @@
+import operator
+
 import quimb.tensor as qtn
 from quimb.utils import oset
 
@@ -5,6 +7,9 @@ from .bp_common import (
     BeliefPropagationCommon,
     combine_local_contractions,
     create_lazy_community_edge_map,
+    executor_map,
+    greedy_coloring,
+    group_by_color,
 )
 
 
@@ -57,6 +62,14 @@ class L1BP(BeliefPropagationCommon):
         ``zvals`` at corresponding points ``zval_its``.
     inplace : bool, optional
         Whether to perform any operations inplace on the input tensor network.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, e.g. a
+        ``ThreadPoolExecutor``, for 'sequential' and 'parallel' updates. If
+        ``True`` or an integer, use a thread pool with the default or that
+        number of workers. Sequential updates are then performed one color
+        group of sites at a time, where the groups come from a greedy
+        coloring of the sites, such that the messages leaving all sites of
+        the same color can be computed at once.
     contract_opts
         Other options supplied to ``cotengra.array_contract``.
     """
@@ -75,6 +88,7 @@ class L1BP(BeliefPropagationCommon):
         message_init_function=None,
         contract_every=None,
         inplace=False,
+        executor=None,
         **contract_opts,
     ):
         super().__init__(
@@ -85,6 +99,7 @@ class L1BP(BeliefPropagationCommon):
             distance=distance,
             contract_every=contract_every,
             inplace=inplace,
+            executor=executor,
         )
 
         self.local_convergence = local_convergence
@@ -103,6 +118,7 @@ class L1BP(BeliefPropagationCommon):
             self.touch_map,
         ) = create_lazy_community_edge_map(tn, site_tags)
         self.touched = oset()
+        self._colors = None
 
         # for each meta bond create initial messages
         self.messages = {}
@@ -193,15 +209,31 @@ class L1BP(BeliefPropagationCommon):
             tm.modify(data=data)
 
         if self.update == "parallel":
-            new_data = {}
             # compute all new messages
-            while self.touched:
-                key = self.touched.pop()
-                new_data[key] = _compute_m(key)
+            keys = tuple(self.touched)
+            self.touched.clear()
+            new_data = executor_map(
+                self.executor, _compute_m, [(key,) for key in keys]
+            )
             # insert all new messages
-            for key, data in new_data.items():
+            for key, data in zip(keys, new_data):
                 _update_m(key, data)
 
+        elif self.update == "sequential" and self.executor is not None:
+            if self._colors is None:
+                self._colors = greedy_coloring(self.neighbors)
+            # compute the messages leaving each color group of sites
+            # concurrently, inserting them before the next group
+            for keys in group_by_color(
+                self.touched, self._colors, operator.itemgetter(0)
+            ):
+                new_data = executor_map(
+                    self.executor, _compute_m, [(key,) for key in keys]
+                )
+                for key, data in zip(keys, new_data):
+                    _update_m(key, data)
+            self.touched.clear()
+
         elif self.update == "sequential":
             # compute each new message and immediately re-insert it
             while self.touched:
@@ -280,6 +312,7 @@ def contract_l1bp(
     strip_exponent=False,
     info=None,
     progbar=False,
+    executor=None,
     **contract_opts,
 ):
     """Estimate the contraction of ``tn`` using lazy 1-norm belief propagation.
@@ -313,6 +346,9 @@ def contract_l1bp(
     info : dict, optional
         If specified, update this dictionary with information about the
         belief propagation run.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, see
+        :class:`~quimb.tensor.belief_propagation.L1BP`.
     contract_opts
         Other options supplied to ``cotengra.array_contract``.
     """
@@ -323,6 +359,7 @@ def contract_l1bp(
         local_convergence=local_convergence,
         update=update,
         optimize=optimize,
+        executor=executor,
         **contract_opts,
     )
     bp.run(
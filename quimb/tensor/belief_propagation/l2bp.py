@@ -1,4 +1,5 @@
 import math
+import operator
 
 import autoray as ar
 
@@ -9,6 +10,9 @@ from .bp_common import (
     BeliefPropagationCommon,
     combine_local_contractions,
     create_lazy_community_edge_map,
+    executor_map,
+    greedy_coloring,
+    group_by_color,
 )
 
 
@@ -69,6 +73,14 @@ class L2BP(BeliefPropagationCommon):
         ``zvals`` at corresponding points ``zval_its``.
     inplace : bool, optional
         Whether to perform any operations inplace on the input tensor network.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, e.g. a
+        ``ThreadPoolExecutor``, for 'sequential' and 'parallel' updates. If
+        ``True`` or an integer, use a thread pool with the default or that
+        number of workers. Sequential updates are then performed one color
+        group of sites at a time, where the groups come from a greedy
+        coloring of the sites, such that the messages leaving all sites of
+        the same color can be computed at once.
     contract_opts
         Other options supplied to ``cotengra.array_contract``.
     """
@@ -87,6 +99,7 @@ class L2BP(BeliefPropagationCommon):
         optimize="auto-hq",
         contract_every=None,
         inplace=False,
+        executor=None,
         **contract_opts,
     ):
         super().__init__(
@@ -97,6 +110,7 @@ class L2BP(BeliefPropagationCommon):
             distance=distance,
             contract_every=contract_every,
             inplace=inplace,
+            executor=executor,
         )
 
         self.local_convergence = local_convergence
@@ -115,6 +129,7 @@ class L2BP(BeliefPropagationCommon):
             self.touch_map,
         ) = create_lazy_community_edge_map(tn, site_tags)
         self.touched = oset()
+        self._colors = None
 
         # these are all settable properties
         self.symmetrize = symmetrize
@@ -261,15 +276,31 @@ class L2BP(BeliefPropagationCommon):
             tm.modify(data=data)
 
         if self.update == "parallel":
-            new_data = {}
             # compute all new messages
-            while self.touched:
-                key = self.touched.pop()
-                new_data[key] = _compute_m(key)
+            keys = tuple(self.touched)
+            self.touched.clear()
+            new_data = executor_map(
+                self.executor, _compute_m, [(key,) for key in keys]
+            )
             # insert all new messages
-            for key, data in new_data.items():
+            for key, data in zip(keys, new_data):
                 _update_m(key, data)
 
+        elif self.update == "sequential" and self.executor is not None:
+            if self._colors is None:
+                self._colors = greedy_coloring(self.neighbors)
+            # compute the messages leaving each color group of sites
+            # concurrently, inserting them before the next group
+            for keys in group_by_color(
+                self.touched, self._colors, operator.itemgetter(0)
+            ):
+                new_data = executor_map(
+                    self.executor, _compute_m, [(key,) for key in keys]
+                )
+                for key, data in zip(keys, new_data):
+                    _update_m(key, data)
+            self.touched.clear()
+
         elif self.update == "sequential":
             # compute each new message and immediately re-insert it
             while self.touched:
@@ -462,6 +493,7 @@ def contract_l2bp(
     strip_exponent=False,
     info=None,
     progbar=False,
+    executor=None,
     **contract_opts,
 ):
     """Estimate the norm squared of ``tn`` using lazy belief propagation.
@@ -493,6 +525,9 @@ def contract_l2bp(
         belief propagation run.
     progbar : bool, optional
         Whether to show a progress bar.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, see
+        :class:`~quimb.tensor.belief_propagation.L2BP`.
     contract_opts
         Other options supplied to ``cotengra.array_contract``.
     """
@@ -503,6 +538,7 @@ def contract_l2bp(
         update=update,
         local_convergence=local_convergence,
         optimize=optimize,
+        executor=executor,
         **contract_opts,
     )
     bp.run(
@@ -530,6 +566,7 @@ def compress_l2bp(
     inplace=False,
     info=None,
     progbar=False,
+    executor=None,
     **contract_opts,
 ):
     """Compress ``tn`` using lazy belief propagation, producing a tensor
@@ -572,6 +609,9 @@ def compress_l2bp(
         belief propagation run.
     progbar : bool, optional
         Whether to show a progress bar.
+    executor : bool, int or Executor, optional
+        If given, compute messages concurrently using this executor, see
+        :class:`~quimb.tensor.belief_propagation.L2BP`.
     contract_opts
         Other options supplied to ``cotengra.array_contract``.
 
@@ -588,6 +628,7 @@ def compress_l2bp(
         update=update,
         local_convergence=local_convergence,
         optimize=optimize,
+        executor=executor,
         **contract_opts,
     )
     bp.run(
@@ -3,6 +3,8 @@
 import functools
 import itertools
 
+import numpy as np
+
 
 def cached_region_property(name):
     """Decorator for caching information about regions."""
@@ -10,11 +12,11 @@ def cached_region_property(name):
     def wrapper(meth):
         @functools.wraps(meth)
         def getter(self, region):
+            cache = self.info.setdefault(name, {})
             try:
-                return self.info[region][name]
+                return cache[region]
             except KeyError:
-                region_info = self.info.setdefault(region, {})
-                region_info[name] = value = meth(self, region)
+                cache[region] = value = meth(self, region)
                 return value
 
         return getter
@@ -22,10 +24,47 @@ def cached_region_property(name):
     return wrapper
 
 
+def _bits_to_ids(bits):
+    """Get the positions of the set bits of the integer ``bits``."""
+    if not bits:
+        return []
+    b = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    b = np.unpackbits(np.frombuffer(b, dtype=np.uint8), bitorder="little")
+    return np.flatnonzero(b).tolist()
+
+
+def _minimal_regions(regions):
+    """Get the regions which contain no other region in ``regions``."""
+    minimal = []
+    for r in sorted(regions, key=len):
+        if not any(m < r for m in minimal):
+            minimal.append(r)
+    return minimal
+
+
+def _maximal_regions(regions):
+    """Get the regions not contained by any other region in ``regions``."""
+    maximal = []
+    for r in sorted(regions, key=len, reverse=True):
+        if not any(r < m for m in maximal):
+            maximal.append(r)
+    return maximal
+
+
 class RegionGraph:
     """A graph of regions, where each region is a set of nodes. For generalized
     belief propagation or cluster expansion methods.
 
+    Internally each region is given an integer id, and each node an integer
+    bitset of the ids of the regions containing it, such that all the super
+    regions (ancestors) of a region are found with a few bitwise ands, and
+    all the overlapping regions with a few bitwise ors. Adding or removing a
+    region only updates the parent-child links around it, and only
+    invalidates the cached properties, such as counts, of its ancestors or
+    descendents. The graph pickles compactly, along with any computed
+    counts, so it can be saved, e.g. with :func:`quimb.save_to_disk`, and
+    reused.
+
     Parameters
     ----------
     regions : Iterable[Sequence[Hashable]]
@@ -44,12 +83,18 @@ class RegionGraph:
         autoprune=True,
     ):
         regions = tuple(map(frozenset, regions))
-        self.base_nodes = frozenset.intersection(*regions)
+        if regions:
+            self.base_nodes = frozenset.intersection(*regions)
+        else:
+            self.base_nodes = frozenset()
 
-        self.lookup = {}
+        self.ids = {}
+        self.id_regions = []
+        self.node_bits = {}
         self.parents = {}
         self.children = {}
         self.info = {}
+        self._all_bits = 0
 
         for region in regions:
             self.add_region(region)
@@ -66,24 +111,65 @@ class RegionGraph:
     def regions(self):
         return tuple(self.children)
 
+    def _decode(self, bits):
+        """Get the regions corresponding to the set bits of ``bits``."""
+        return [self.id_regions[i] for i in _bits_to_ids(bits)]
+
+    def _get_superset_bits(self, region):
+        """Get the bitset of all regions containing ``region``."""
+        bits = self._all_bits
+        for node in region:
+            bits &= self.node_bits.get(node, 0)
+        return bits
+
+    def _get_overlapping_bits(self, region):
+        """Get the bitset of all regions sharing a node with ``region``."""
+        bits = 0
+        for node in region:
+            bits |= self.node_bits.get(node, 0)
+        return bits
+
+    def _get_supersets(self, region):
+        """Get all regions that strictly contain ``region``."""
+        return [
+            r
+            for r in self._decode(self._get_superset_bits(region))
+            if r != region
+        ]
+
+    def _get_subsets(self, region):
+        """Get all regions strictly contained by ``region``."""
+        return [
+            r
+            for r in self._decode(self._get_overlapping_bits(region))
+            if r < region
+        ]
+
+    def _invalidate(self, region, supersets, subsets):
+        """Remove the cached properties affected by adding or removing
+        ``region``, given its ``supersets`` and ``subsets``.
+        """
+        # these depend on the regions above
+        for name in ("ancestors", "count", "level"):
+            cache = self.info.get(name, {})
+            for r in (region, *subsets):
+                cache.pop(r, None)
+        # these depend on the regions below
+        cache = self.info.get("descendents", {})
+        for r in (region, *supersets):
+            cache.pop(r, None)
+        # these depend on the local structure more widely
+        self.info.pop("coparent_pairs", None)
+        self.info.pop("message_parts", None)
+
     def get_overlapping(self, region):
         """Get all regions that intersect with the given region."""
         region = frozenset(region)
-
-        if self.base_nodes:
-            # all regions are overlapping
-            return {
-                other_region
-                for other_region in self.regions
-                if other_region != region
-            }
-        else:
-            return {
-                other_region
-                for node in region
-                for other_region in self.lookup[node]
-                if other_region != region
-            }
+        return {
+            other
+            for other in self._decode(self._get_overlapping_bits(region))
+            if other != region
+        }
 
     def add_region(self, region):
         """Add a new region and update parent-child relationships.
@@ -95,85 +181,94 @@ class RegionGraph:
         """
         region = frozenset(region)
 
-        if region in self.parents:
+        if region in self.ids:
             # already added
             return
 
+        supersets = self._get_supersets(region)
+        subsets = self._get_subsets(region)
+        parents = _minimal_regions(supersets)
+        children = _maximal_regions(subsets)
+
         # populate data structures
-        self.parents[region] = set()
-        self.children[region] = set()
+        i = len(self.id_regions)
+        self.ids[region] = i
+        self.id_regions.append(region)
+        bit = 1 << i
+        self._all_bits |= bit
         for node in region:
-            # collect regions that contain nodes for fast neighbor lookup
-            self.lookup.setdefault(node, set()).add(region)
+            self.node_bits[node] = self.node_bits.get(node, 0) | bit
 
         # add parent-child relationships
-        for other in self.get_overlapping(region):
-            if region.issubset(other):
-                self.parents[region].add(other)
-                self.children[other].add(region)
-            elif other.issubset(region):
-                self.children[region].add(other)
-                self.parents[other].add(region)
-
-        # prune redundant parents and children
-        children = sorted(self.children[region], key=len)
-        for i, c in enumerate(children):
-            if any(c.issubset(cc) for cc in children[i + 1 :]):
-                # child is a subset of larger child -> remove
-                self.children[region].remove(c)
-                self.parents[c].remove(region)
-
-        parents = sorted(self.parents[region], key=len, reverse=True)
-        for i, p in enumerate(parents):
-            if any(p.issuperset(pp) for pp in parents[i + 1 :]):
-                # parent is a superset of smaller parent -> remove
-                self.parents[region].remove(p)
-                self.children[p].remove(region)
-
-            for c in self.children[region]:
-                if p.issuperset(c):
-                    # parent is a superset of child -> ensure no link
-                    self.parents[c].discard(p)
-                    self.children[p].discard(c)
-
-        self.reset_info()
+        self.parents[region] = set(parents)
+        self.children[region] = set(children)
+        for p in parents:
+            self.children[p].add(region)
+            for c in children:
+                # any direct links between these now go via region
+                self.children[p].discard(c)
+                self.parents[c].discard(p)
+        for c in children:
+            self.parents[c].add(region)
+
+        self._invalidate(region, supersets, subsets)
 
     def remove_region(self, region):
         """Remove a region and update parent-child relationships."""
+        region = frozenset(region)
+        supersets = self._get_supersets(region)
+        subsets = self._get_subsets(region)
+
         # remove from lookup
+        i = self.ids.pop(region)
+        self.id_regions[i] = None
+        bit = 1 << i
+        self._all_bits ^= bit
         for node in region:
-            self.lookup[node].remove(region)
+            self.node_bits[node] ^= bit
 
         # remove from parents and children, joining those up
         parents = self.parents.pop(region)
         children = self.children.pop(region)
         for p in parents:
             self.children[p].remove(region)
-            self.children[p].update(children)
         for c in children:
             self.parents[c].remove(region)
-            self.parents[c].update(parents)
+            others = tuple(self.parents[c])
+            for p in parents:
+                # only link if no other parent of c is in between
+                if not any(q < p for q in others):
+                    self.parents[c].add(p)
+                    self.children[p].add(c)
 
-        self.reset_info()
+        self._invalidate(region, supersets, subsets)
 
     def autocomplete(self):
-        """Add all missing intersecting sub-regions."""
-        if self.base_nodes:
-            # all regions are overlapping
-            rs = self.regions
-            for i in range(len(rs)):
-                for j in range(i + 1, len(rs)):
-                    self.add_region(rs[i] & rs[j])
-        else:
-            for r in self.regions:
-                for other in self.get_overlapping(r):
-                    self.add_region(r & other)
+        """Add all missing intersecting sub-regions, including intersections
+        of the intersections, until the set of regions is closed.
+        """
+        # any intersection of the current regions can be built up by
+        # intersecting with one of the current regions at a time
+        current_bits = self._all_bits
+        queue = list(self.regions)
+        while queue:
+            r = queue.pop()
+            bits = self._get_overlapping_bits(r) & current_bits
+            for other in self._decode(bits):
+                rij = r & other
+                if rij not in self.ids:
+                    self.add_region(rij)
+                    queue.append(rij)
 
     def autoprune(self):
         """Remove all regions with a count of zero."""
+        counts = {r: self.get_count(r) for r in self.regions}
         for r in self.regions:
-            if self.get_count(r) == 0:
+            if counts[r] == 0:
                 self.remove_region(r)
+                del counts[r]
+        # removing regions with zero count leaves all other counts unchanged
+        self.info["count"] = counts
 
     def autoextend(self, regions=None):
         """Extend this region graph upwards by adding in all pairwise unions of
@@ -208,30 +303,14 @@ class RegionGraph:
         """Get all regions that contain the given region, not just direct
         parents.
         """
-        seen = set()
-        queue = [region]
-        while queue:
-            r = queue.pop()
-            for rp in self.parents[r]:
-                if rp not in seen:
-                    seen.add(rp)
-                    queue.append(rp)
-        return seen
+        return set(self._get_supersets(region))
 
     @cached_region_property("descendents")
     def get_descendents(self, region):
         """Get all regions that are contained by the given region, not just
         direct children.
         """
-        seen = set()
-        queue = [region]
-        while queue:
-            r = queue.pop()
-            for rc in self.children[r]:
-                if rc not in seen:
-                    seen.add(rc)
-                    queue.append(rc)
-        return seen
+        return set(self._get_subsets(region))
 
     @cached_region_property("coparent_pairs")
     def get_coparent_pairs(self, region):
@@ -349,11 +428,61 @@ class RegionGraph:
                 assert not rca.issubset(rcb)
                 assert not rcb.issubset(rca)
 
+    def copy(self):
+        """Copy this region graph, including any cached region properties."""
+        new = self.__class__.__new__(self.__class__)
+        new.__setstate__(self.__getstate__())
+        return new
+
+    def __getstate__(self):
+        # store compactly, with regions referenced by position, this allows
+        # the graph, and its counts, to be cheaply saved and reused
+        regions = self.regions
+        index = {r: i for i, r in enumerate(regions)}
+        parents = [[index[p] for p in self.parents[r]] for r in regions]
+        counts = self.info.get("count", {})
+        counts = [counts.get(r, None) for r in regions]
+        return {
+            "base_nodes": self.base_nodes,
+            "regions": regions,
+            "parents": parents,
+            "counts": counts,
+        }
+
+    def __setstate__(self, state):
+        self.base_nodes = state["base_nodes"]
+        self.ids = {}
+        self.id_regions = []
+        self.node_bits = {}
+        self.parents = {}
+        self.children = {}
+        self.info = {}
+        self._all_bits = 0
+
+        regions = state["regions"]
+        for i, region in enumerate(regions):
+            self.ids[region] = i
+            self.id_regions.append(region)
+            bit = 1 << i
+            self._all_bits |= bit
+            for node in region:
+                self.node_bits[node] = self.node_bits.get(node, 0) | bit
+            self.children[region] = set()
+
+        for region, pis in zip(regions, state["parents"]):
+            self.parents[region] = {regions[i] for i in pis}
+            for p in self.parents[region]:
+                self.children[p].add(region)
+
+        self.info["count"] = {
+            r: c for r, c in zip(regions, state["counts"]) if c is not None
+        }
+
     def draw(self, pos=None, a=20, scale=1.0, radius=0.1, **drawing_opts):
         from quimb.schematic import Drawing, hash_to_color
 
         if pos is None:
-            pos = {node: node for node in self.lookup}
+            pos = {node: node for node in self.node_bits}
 
         def get_draw_pos(coo):
             return tuple(scale * s for s in pos[coo])
@@ -3,11 +3,20 @@
 import collections
 import contextlib
 import functools
+import hashlib
 import itertools
+import json
+import os
+import pickle
+import tempfile
 import threading
+import time
 
+import autoray as ar
 import cotengra as ctg
 
+from ..utils_profile import profiled
+
 _CONTRACT_STRATEGY = "greedy"
 _TEMP_CONTRACT_STRATEGIES = collections.defaultdict(list)
 
@@ -269,6 +278,34 @@ def tensor_linop_backend(backend, set_globally=False):
             temp_backends.pop()
 
 
+def _array_contract_profile_info(
+    arrays,
+    inputs,
+    output=None,
+    optimize=None,
+    backend=None,
+    **kwargs,
+):
+    """Get the FLOPs and largest intermediate size of an ``array_contract``
+    call, for profiling. Only done if the contraction tree can be retrieved
+    without repeating a path search, i.e. if ``optimize`` is a named
+    (and thus cached) strategy, an explicit path or a tree.
+    """
+    if optimize is None:
+        optimize = get_contract_strategy()
+    if not isinstance(optimize, (str, tuple, list, ctg.ContractionTree)):
+        return None, None
+
+    tree = array_contract_tree(
+        inputs,
+        output,
+        shapes=tuple(map(ar.shape, arrays)),
+        optimize=optimize,
+    )
+    return tree.total_flops(), tree.max_size()
+
+
+@profiled("array_contract", info=_array_contract_profile_info)
 @functools.wraps(ctg.array_contract)
 def array_contract(
     arrays,
@@ -306,6 +343,7 @@ def array_contract_tree(*args, optimize=None, **kwargs):
     return ctg.array_contract_tree(*args, optimize=optimize, **kwargs)
 
 
+@profiled("array_contract_path")
 @functools.wraps(ctg.array_contract_path)
 def array_contract_path(*args, optimize=None, **kwargs):
     if optimize is None:
@@ -337,3 +375,591 @@ def array_contract_pathinfo(*args, **kwargs):
         path = ((0,),)
 
     return oe.contract_path(eq, *shapes, shapes=True, optimize=path)[1]
+
+
+class ContractionPathCache:
+    """A cache of contraction paths, keyed by a tensor network's
+    :meth:`~quimb.tensor.tensor_core.TensorNetwork.geometry_hash` and the
+    name of the path optimization strategy. There is an in-memory least
+    recently used tier, and an optional on-disk tier (a directory of small
+    json files) which can be shared between processes and across restarts.
+
+    Only the path, which is independent of the actual index names, is stored,
+    so that any network with matching geometry can reuse it. Paths are only
+    cached for named (``str``) strategies. For caching the results of
+    arbitrary optimizers see :class:`cotengra.ReusableHyperOptimizer`.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of paths to keep in memory.
+    directory : str, optional
+        If given, a directory to also persistently store paths in. It will be
+        created if it doesn't exist.
+    """
+
+    def __init__(self, maxsize=2**10, directory=None):
+        from ..utils import LRU
+
+        self.maxsize = maxsize
+        self._memory = LRU(maxsize)
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(geometry_hash, optimize):
+        """Get the key for a particular geometry and strategy, or ``None`` if
+        the strategy is not cacheable.
+        """
+        if not isinstance(optimize, str):
+            return None
+        return f"{geometry_hash}-{optimize}"
+
+    def _get_filename(self, key):
+        # make sure custom preset names are safe to use as filenames
+        safe_key = "".join(c if c.isalnum() or c in "-_" else "_" for c in key)
+        return os.path.join(self.directory, f"{safe_key}.json")
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._get_filename(key)) as f:
+                return tuple(map(tuple, json.load(f)))
+        except (OSError, ValueError):
+            # missing or corrupt (e.g. partially written by crashed process)
+            return None
+
+    def _dump(self, key, path):
+        if self.directory is None:
+            return
+        # write to a temporary file first, then atomically move it into place
+        # so that concurrent processes never see a partially written path
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(path, f)
+            os.replace(tmp, self._get_filename(key))
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+
+    def get(self, key):
+        """Retrieve the path for ``key``, checking memory then disk, returning
+        ``None`` if not present.
+        """
+        try:
+            path = self._memory[key]
+        except KeyError:
+            path = self._load(key)
+            if path is not None:
+                self._memory[key] = path
+
+        if path is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return path
+
+    def put(self, key, path):
+        """Store ``path`` under ``key``, in memory and on disk if enabled."""
+        path = tuple(tuple(map(int, con)) for con in path)
+        self._memory[key] = path
+        self._dump(key, path)
+
+    def __contains__(self, key):
+        return (key in self._memory) or (
+            self.directory is not None
+            and os.path.exists(self._get_filename(key))
+        )
+
+    def __len__(self):
+        return len(self._memory)
+
+    def clear(self, disk=False):
+        """Clear the in-memory cache, and optionally the on-disk one too."""
+        self._memory.clear()
+        if disk and (self.directory is not None):
+            for fname in os.listdir(self.directory):
+                if fname.endswith(".json"):
+                    with contextlib.suppress(OSError):
+                        os.remove(os.path.join(self.directory, fname))
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(size={len(self)}, "
+            f"maxsize={self.maxsize}, directory={self.directory!r}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+
+def _parse_contract_path_cache(cache):
+    if (cache is None) or (cache is False):
+        return None
+    if cache is True:
+        return ContractionPathCache()
+    if isinstance(cache, (str, os.PathLike)):
+        return ContractionPathCache(directory=os.fspath(cache))
+    return cache
+
+
+_CONTRACT_PATH_CACHE = _parse_contract_path_cache(
+    os.environ.get("QUIMB_CONTRACT_PATH_CACHE", None)
+)
+
+
+def get_contract_path_cache():
+    """Get the current global :class:`ContractionPathCache`, or ``None`` if
+    path caching is disabled. The default can be set by the
+    ``QUIMB_CONTRACT_PATH_CACHE`` environment variable, pointing to a
+    directory to use as the on-disk tier.
+
+    See Also
+    --------
+    set_contract_path_cache, contract_path_cache
+    """
+    return _CONTRACT_PATH_CACHE
+
+
+def set_contract_path_cache(cache=True):
+    """Set the global contraction path cache used when contracting entire
+    tensor networks with a named ``optimize`` strategy.
+
+    Parameters
+    ----------
+    cache : bool, str, ContractionPathCache or None
+        If ``True``, use a new in-memory only cache, if a str, use a new cache
+        with this on-disk directory, if ``None`` or ``False`` turn caching off.
+
+    See Also
+    --------
+    get_contract_path_cache, contract_path_cache
+    """
+    global _CONTRACT_PATH_CACHE
+    _CONTRACT_PATH_CACHE = _parse_contract_path_cache(cache)
+
+
+@contextlib.contextmanager
+def contract_path_cache(cache=True):
+    """A context manager to temporarily set the global contraction path
+    cache, see :func:`set_contract_path_cache`. Yields the cache itself.
+    """
+    orig_cache = get_contract_path_cache()
+    set_contract_path_cache(cache)
+    try:
+        yield get_contract_path_cache()
+    finally:
+        set_contract_path_cache(orig_cache)
+
+
+def _get_output_inds(inputs):
+    """Get the default output indices, those appearing once, in order."""
+    from ..utils import concat, frequencies
+
+    return tuple(ix for ix, c in frequencies(concat(inputs)).items() if c == 1)
+
+
+def _get_ind_positions(inputs):
+    """Map each index to the (tensor, axis) position of its first appearance,
+    which is independent of the actual index names.
+    """
+    positions = {}
+    for i, term in enumerate(inputs):
+        for j, ix in enumerate(term):
+            positions.setdefault(ix, (i, j))
+    return positions
+
+
+def _get_geometry_key(inputs, output, shapes):
+    """Get a key for the geometry of a contraction which is independent of
+    the actual index names.
+    """
+    labels = {ix: n for n, ix in enumerate(_get_ind_positions(inputs))}
+    canonical = (
+        tuple(tuple(labels[ix] for ix in term) for term in inputs),
+        tuple(labels[ix] for ix in output),
+        tuple(tuple(map(int, shape)) for shape in shapes),
+    )
+    return hashlib.sha1(pickle.dumps(canonical)).hexdigest()
+
+
+def _contract_slices(tree, arrays, slice_ids, backend=None):
+    """Contract and sum the slices ``slice_ids`` of ``tree``."""
+    result = None
+    for i in slice_ids:
+        x = tree.contract_slice(arrays, i, backend=backend)
+        result = x if result is None else result + x
+    return result
+
+
+_SLICE_WORKER_STATE = {}
+
+
+def _init_slice_worker(tree, arrays):
+    """Store the tree and arrays once per process pool worker, rather than
+    sending them with every task.
+    """
+    _SLICE_WORKER_STATE["tree"] = tree
+    _SLICE_WORKER_STATE["arrays"] = arrays
+
+
+def _contract_slices_in_worker(slice_ids, backend=None):
+    return _contract_slices(
+        _SLICE_WORKER_STATE["tree"],
+        _SLICE_WORKER_STATE["arrays"],
+        slice_ids,
+        backend,
+    )
+
+
+class SlicedContractionCheckpoint:
+    """Persistent state for a sliced contraction, so that it can be resumed.
+    The directory contains a ``state.json`` file, recording the contraction
+    path, the sliced indices, the finished slices, and the name of a numpy
+    file holding the partial sum of those slices. A new partial sum file is
+    written and the state file atomically replaced each time, so that a crash
+    at any point leaves a consistent checkpoint.
+
+    Parameters
+    ----------
+    directory : str
+        The directory to store the checkpoint in, created if necessary.
+    key : str
+        The geometry key of the contraction, used to check a loaded
+        checkpoint belongs to the same contraction.
+    """
+
+    def __init__(self, directory, key):
+        self.directory = os.fspath(directory)
+        self.key = key
+        self.state_file = os.path.join(self.directory, "state.json")
+        os.makedirs(self.directory, exist_ok=True)
+        self.counter = 0
+
+    def load(self):
+        """Load the current state, returning ``None`` if there is none, and
+        raising if it belongs to a different contraction.
+        """
+        try:
+            with open(self.state_file) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        if state["key"] != self.key:
+            raise ValueError(
+                f"The checkpoint in '{self.directory}' is for a different "
+                "contraction, remove it or supply a different directory."
+            )
+
+        self.counter = state["counter"]
+        if state["sum"] is not None:
+            import numpy as np
+
+            # memory map then copy so the file can be replaced later
+            fname = os.path.join(self.directory, state["sum"])
+            state["sum"] = np.array(np.load(fname, mmap_mode="r"))
+
+        state["done"] = set(map(tuple, state["done"]))
+        return state
+
+    def save(self, path, sliced, done, total):
+        """Save a new checkpoint."""
+        import numpy as np
+
+        self.counter += 1
+        if total is not None:
+            total = ar.to_numpy(total)
+            sum_file = f"sum-{self.counter}.npy"
+            mm = np.lib.format.open_memmap(
+                os.path.join(self.directory, sum_file),
+                mode="w+",
+                dtype=total.dtype,
+                shape=total.shape,
+            )
+            mm[...] = total
+            mm.flush()
+            del mm
+        else:
+            sum_file = None
+
+        state = {
+            "key": self.key,
+            "counter": self.counter,
+            "path": [list(map(int, con)) for con in path],
+            "sliced": [list(pos) for pos in sliced],
+            "done": sorted(map(list, done)),
+            "sum": sum_file,
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_file)
+
+        # remove any now stale partial sums
+        for fname in os.listdir(self.directory):
+            if fname.startswith("sum-") and (fname != sum_file):
+                with contextlib.suppress(OSError):
+                    os.remove(os.path.join(self.directory, fname))
+
+
+def array_contract_sliced(
+    arrays,
+    inputs,
+    output=None,
+    optimize=None,
+    max_memory=None,
+    checkpoint=None,
+    checkpoint_interval=10.0,
+    executor=None,
+    parallel=None,
+    pool="process",
+    batch_size=None,
+    backend=None,
+    progbar=False,
+):
+    """Contract ``arrays`` by explicitly slicing the contraction tree so that
+    every intermediate fits within a memory budget, then contracting and
+    summing the slices in batches, optionally in parallel and with
+    checkpointing to disk, such that an interrupted contraction can be
+    resumed from the last finished batch.
+
+    Parameters
+    ----------
+    arrays : sequence of array_like
+        The arrays to contract.
+    inputs : sequence of sequence of hashable
+        The indices of each array.
+    output : sequence of hashable, optional
+        The output indices, by default those which appear once.
+    optimize : str, PathOptimizer, ContractionTree or path_like, optional
+        The contraction path optimization strategy to use. Any slicing of a
+        supplied tree is kept, though output indices cannot be sliced.
+    max_memory : int, optional
+        The maximum size, in bytes, of any single intermediate tensor in the
+        contraction of a slice. If given, indices (but never output indices)
+        are sliced until this is satisfied.
+    checkpoint : str, optional
+        A directory in which to store the contraction path, slicing and
+        partial sum of finished slices. If it already contains a checkpoint
+        for this contraction, the contraction is resumed, reusing the path and
+        skipping finished slices. The arrays are assumed to be the same.
+    checkpoint_interval : float, optional
+        The minimum number of seconds between writing checkpoints. The final
+        result is always written.
+    executor : Executor, optional
+        A ``concurrent.futures`` style executor to contract batches of slices
+        with. If neither this nor ``parallel`` is given, the slices are
+        contracted serially.
+    parallel : int or bool, optional
+        If given, and ``executor`` isn't, the number of workers (``True`` for
+        the default number) in a new pool to contract batches of slices with.
+        If the tree doesn't already have enough slices to keep every worker
+        busy, more indices are sliced.
+    pool : {'process', 'thread'}, optional
+        The type of pool to create if ``parallel`` is given. A process pool
+        receives the tree and arrays just once per worker, a thread pool is
+        shared and avoids any copying but relies on the backend releasing the
+        GIL. For process pools you may want to limit the number of threads
+        each worker's BLAS uses.
+    batch_size : int, optional
+        How many slices to contract and sum per task. By default, one if
+        contracting serially, or enough to give each worker about four tasks.
+        If an explicit ``executor`` is supplied the arrays are sent with each
+        task, so for process pools larger batches amortize this.
+    backend : str, optional
+        Which backend to use to perform the contraction.
+    progbar : bool, optional
+        Whether to show a progress bar over slices.
+
+    Returns
+    -------
+    array_like
+    """
+    inputs = tuple(map(tuple, inputs))
+    if output is None:
+        output = _get_output_inds(inputs)
+    else:
+        output = tuple(output)
+    shapes = tuple(map(ar.shape, arrays))
+    key = _get_geometry_key(inputs, output, shapes)
+
+    if checkpoint is not None:
+        checkpoint = SlicedContractionCheckpoint(checkpoint, key)
+        state = checkpoint.load()
+    else:
+        state = None
+
+    if state is not None:
+        # resume -> rebuild exactly the same sliced tree
+        tree = array_contract_tree(
+            inputs,
+            output,
+            shapes=shapes,
+            optimize=tuple(map(tuple, state["path"])),
+        )
+        for i, j in state["sliced"]:
+            tree.remove_ind_(tree.inputs[i][j])
+        done = state["done"]
+        total = state["sum"]
+        if total is not None:
+            total = ar.do("array", total, like=arrays[0])
+    else:
+        tree = array_contract_tree(
+            inputs, output, shapes=shapes, optimize=optimize
+        )
+        if max_memory is not None:
+            import numpy as np
+
+            itemsize = np.result_type(
+                *(ar.get_dtype_name(x) for x in arrays)
+            ).itemsize
+            target_size = max(1, max_memory // itemsize)
+            if tree.max_size() > target_size:
+                tree = tree.slice(target_size=target_size, allow_outer=False)
+        done = set()
+        total = None
+
+    own_executor = (executor is None) and parallel
+    if own_executor:
+        if parallel is True:
+            from ..core import _NUM_THREAD_WORKERS as num_workers
+        else:
+            num_workers = int(parallel)
+
+        if (state is None) and (tree.nslices < 4 * num_workers):
+            # make sure there is enough work to distribute
+            tree = tree.slice(target_slices=4 * num_workers, allow_outer=False)
+
+    if any(ix in tree.output for ix in tree.sliced_inds):
+        raise ValueError("Sliced output indices are not supported.")
+
+    # track slices by the value of each sliced index, which unlike the
+    # linear slice number doesn't depend on the index names, n.b. the tree
+    # itself may internally use different index names (symbols)
+    positions = _get_ind_positions(tree.inputs)
+    sliced = [ix for ix in positions if ix in tree.sliced_inds]
+    path = tree.get_path()
+    sliced_positions = [positions[ix] for ix in sliced]
+
+    pending = []
+    slice_keys = {}
+    for i in range(tree.nslices):
+        slice_key = tree.slice_key(i)
+        slice_key = tuple(int(slice_key[ix]) for ix in sliced)
+        if slice_key not in done:
+            pending.append(i)
+            slice_keys[i] = slice_key
+
+    if own_executor:
+        if pool == "process":
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = ProcessPoolExecutor(
+                num_workers,
+                initializer=_init_slice_worker,
+                initargs=(tree, arrays),
+            )
+        elif pool == "thread":
+            from ..core import get_thread_pool
+
+            # shared pool, so don't shutdown at the end
+            executor = get_thread_pool(num_workers)
+            own_executor = False
+        else:
+            raise ValueError(
+                f"Unknown pool type {pool}, should be 'process' or 'thread'."
+            )
+    elif executor is not None:
+        num_workers = getattr(executor, "_max_workers", 1)
+
+    def _submit(batch):
+        if own_executor:
+            # tree and arrays are already in the worker processes
+            return executor.submit(_contract_slices_in_worker, batch, backend)
+        return executor.submit(_contract_slices, tree, arrays, batch, backend)
+
+    if batch_size is None:
+        if executor is None:
+            batch_size = 1
+        else:
+            batch_size = max(1, len(pending) // (4 * num_workers))
+    batches = [
+        pending[i : i + batch_size] for i in range(0, len(pending), batch_size)
+    ]
+
+    if progbar:
+        import tqdm
+
+        pbar = tqdm.tqdm(
+            total=tree.nslices, initial=tree.nslices - len(pending)
+        )
+    else:
+        pbar = None
+
+    last_save = time.time()
+    futures = {}
+
+    def _accumulate(batch, x):
+        nonlocal total, last_save
+
+        total = x if total is None else total + x
+        done.update(slice_keys[i] for i in batch)
+        if pbar is not None:
+            pbar.update(len(batch))
+
+        if checkpoint is not None:
+            now = time.time()
+            if now - last_save >= checkpoint_interval:
+                checkpoint.save(path, sliced_positions, done, total)
+                last_save = now
+
+    if checkpoint is not None and state is None:
+        # record the path and slicing even before any slices are finished
+        checkpoint.save(path, sliced_positions, done, total)
+
+    try:
+        if executor is None:
+            for batch in batches:
+                _accumulate(
+                    batch, _contract_slices(tree, arrays, batch, backend)
+                )
+        else:
+            import concurrent.futures
+
+            # keep a limited number of batches in flight to bound memory
+            max_in_flight = 2 * num_workers
+            batches = iter(batches)
+            while True:
+                for batch in itertools.islice(
+                    batches, max_in_flight - len(futures)
+                ):
+                    futures[_submit(batch)] = batch
+                if not futures:
+                    break
+                finished, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for f in finished:
+                    _accumulate(futures.pop(f), f.result())
+    except BaseException:
+        if executor is not None:
+            for f in futures:
+                f.cancel()
+        if checkpoint is not None:
+            # make sure no finished work is lost
+            checkpoint.save(path, sliced_positions, done, total)
+        raise
+    finally:
+        if pbar is not None:
+            pbar.close()
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+    if checkpoint is not None:
+        checkpoint.save(path, sliced_positions, done, total)
+
+    return total
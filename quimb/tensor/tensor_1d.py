@@ -1594,6 +1594,142 @@ class TensorNetwork1DFlat(TensorNetwork1D):
         tn.cyclic = True
         return tn
 
+    def to_abelian(self, symmetry, index_map=None, tol=1e-12, inplace=False):
+        """Convert this flat, open boundary, 1D TN with dense arrays into one
+        with abelian symmetric block-sparse arrays, using ``symmray``. The
+        charges of the bonds are inferred from the sparsity of the arrays,
+        with all sites carrying zero charge apart from the last, which carries
+        the total charge (zero for hamiltonians, or the sector for states).
+
+        Parameters
+        ----------
+        symmetry : str or symmray.Symmetry
+            The symmetry, e.g. ``"U1"`` or ``"Z2"``.
+        index_map : sequence of hashable, optional
+            The charge of each linear index of the physical dimension. For
+            ``"U1"`` the default is the index itself, e.g. the number of spins
+            down for the standard spin basis, and for ``"ZN"`` the index
+            modulo ``N``.
+        tol : float, optional
+            Entries smaller than this in magnitude are treated as zero.
+        inplace : bool, optional
+            Whether to perform the conversion in place.
+
+        Returns
+        -------
+        MatrixProductState or MatrixProductOperator
+
+        Raises
+        ------
+        ValueError
+            If the TN is cyclic, or is not symmetric with respect to
+            ``symmetry`` and ``index_map``.
+        """
+        import symmray as sr
+
+        if self.cyclic:
+            raise ValueError("Only open boundary 1D TNs can be converted.")
+
+        tn = self if inplace else self.copy()
+        sym = sr.get_symmetry(symmetry)
+
+        if index_map is None:
+            d = tn.phys_dim()
+            if str(sym) == "U1":
+                index_map = list(range(d))
+            elif str(sym)[0] == "Z" and str(sym)[1:].isdigit():
+                index_map = [k % int(str(sym)[1:]) for k in range(d)]
+            else:
+                raise ValueError(
+                    f"No default `index_map` for symmetry {sym}, please "
+                    "supply one."
+                )
+
+        # physical indices of operators contract with the ket (upper) and bra
+        # (lower) respectively, which have opposite duality
+        if isinstance(tn, TensorNetwork1DOperator):
+            phys_duals = {}
+            for i in range(tn.L):
+                phys_duals[tn.upper_ind(i)] = True
+                phys_duals[tn.lower_ind(i)] = False
+        else:
+            phys_duals = {tn.site_ind(i): False for i in range(tn.L)}
+
+        zero = sym.combine()
+        left_map = None
+        for i in range(tn.L):
+            t = tn[i]
+            x = do("to_numpy", t.data)
+            lix = tn.bond(i - 1, i) if i > 0 else None
+            rix = tn.bond(i, i + 1) if i < tn.L - 1 else None
+
+            index_maps, duals, known = [], [], []
+            for ax, ix in enumerate(t.inds):
+                if ix == lix:
+                    index_maps.append(left_map)
+                    duals.append(True)
+                    known.append(ax)
+                elif ix == rix:
+                    right_ax = ax
+                    right_map = [None] * x.shape[ax]
+                    index_maps.append(right_map)
+                    duals.append(False)
+                else:
+                    index_maps.append(index_map)
+                    duals.append(phys_duals[ix])
+                    known.append(ax)
+
+            charge = zero if rix is not None else None
+            for idx in zip(*np.nonzero(np.abs(x) > tol)):
+                total = sym.combine(
+                    *(
+                        sym.sign(index_maps[ax][idx[ax]], duals[ax])
+                        for ax in known
+                    )
+                )
+                if rix is None:
+                    # last site, infer the overall charge
+                    if charge is None:
+                        charge = total
+                    elif total != charge:
+                        raise ValueError(
+                            f"The TN is not {sym} symmetric, the last site "
+                            "has entries with different charges."
+                        )
+                else:
+                    c = sym.sign(total)
+                    k = idx[right_ax]
+                    if right_map[k] is None:
+                        right_map[k] = c
+                    elif right_map[k] != c:
+                        raise ValueError(
+                            f"The TN is not {sym} symmetric, the bond between "
+                            f"sites {i} and {i + 1} has index {k} with "
+                            "inconsistent charges."
+                        )
+
+            if rix is not None:
+                # unused bond indices can be assigned any charge
+                for k, c in enumerate(right_map):
+                    if c is None:
+                        right_map[k] = zero
+                left_map = right_map
+
+            t.modify(
+                data=sr.AbelianArray.from_dense(
+                    x,
+                    index_maps=index_maps,
+                    duals=duals,
+                    charge=zero if charge is None else charge,
+                    symmetry=sym,
+                    invalid_sectors="raise",
+                )
+            )
+
+        return tn
+
+    to_abelian_ = functools.partialmethod(to_abelian, inplace=True)
+
     def show(self, max_width=None):
         l1 = ""
         l2 = ""
@@ -0,0 +1,361 @@
+"""Time-dependent variational principle (TDVP) evolution of MPS."""
+
+import numpy as np
+from autoray import do
+
+from ..linalg.base_linalg import expm_multiply
+from ..utils import continuous_progbar, ensure_dict
+from ..utils import progbar as Progbar
+from ..utils_profile import profiled
+from .tensor_core import Tensor, TensorNetwork, TNLinearOperator, rand_uuid
+from .tensor_dmrg import DenseEffectiveOperator, MovingEnvironment
+
+
+class TDVP:
+    r"""Class implementing one and two site time-dependent variational
+    principle (TDVP) evolution of a matrix product state under a matrix
+    product operator hamiltonian [1]. Each step is a symmetric, second order,
+    pair of sweeps in which the local one or two site tensors are evolved
+    forwards in time, and the tensors between them backwards, using a
+    Krylov approximation of the local exponential. Unlike ``TEBD``, the
+    hamiltonian can have any range, e.g. from ``SpinHam1D.build_mpo``, at a
+    cost linear in its MPO bond dimension.
+
+    [1] J. Haegeman, C. Lubich, I. Oseledets, B. Vandereycken and F.
+    Verstraete, Unifying time evolution and optimization with matrix product
+    states, PRB 94, 165116 (2016).
+
+    Parameters
+    ----------
+    p0 : MatrixProductState
+        Initial state, with open boundary conditions.
+    H : MatrixProductOperator
+        The hamiltonian, with open boundary conditions.
+    dt : float, optional
+        Default time step.
+    t0 : float, optional
+        Initial time. Defaults to 0.0.
+    bsz : {1, 2}, optional
+        How many sites to evolve together. Two site TDVP grows the bond
+        dimension as needed, according to ``split_opts``. One site TDVP keeps
+        the bond dimensions of ``p0`` fixed, e.g. as set with
+        ``p0.expand_bond_dimension``, but is cheaper and conserves energy.
+    split_opts : dict, optional
+        Compression options applied when splitting the two site tensors, see
+        :func:`~quimb.tensor.tensor_core.tensor_split`.
+    expm_opts : dict, optional
+        Supplied to :func:`~quimb.linalg.base_linalg.expm_multiply` to
+        compute the local exponentials, by default using the ``'krylov'``
+        backend.
+    progbar : bool, optional
+        Whether to show a progress bar by default during evolution.
+    imag : bool, optional
+        Enable imaginary time evolution. Defaults to ``False``.
+
+    See Also
+    --------
+    quimb.tensor.tensor_1d_tebd.TEBD, quimb.Evolution
+    """
+
+    def __init__(
+        self,
+        p0,
+        H,
+        dt=None,
+        t0=0.0,
+        bsz=2,
+        split_opts=None,
+        expm_opts=None,
+        progbar=True,
+        imag=False,
+    ):
+        if p0.cyclic or H.cyclic:
+            raise ValueError(
+                "TDVP is only supported for open boundary conditions."
+            )
+        if bsz not in (1, 2):
+            raise ValueError(f"``bsz`` should be 1 or 2, not {bsz}.")
+
+        self.L = p0.L
+        self.bsz = bsz
+        self.t0 = self.t = t0
+        self.dt = dt
+        self.imag = imag
+        self.progbar = progbar
+        self.split_opts = ensure_dict(split_opts)
+        self.expm_opts = {"backend": "krylov", **ensure_dict(expm_opts)}
+
+        # create internal states and ham, as for DMRG
+        self._k = p0.canonicalize(0)
+        self._b = self._k.H
+        self.H = H.copy()
+        self._k.add_tag("_KET")
+        self._b.add_tag("_BRA")
+        self.H.add_tag("_HAM")
+        self._k.align_(self.H, self._b)
+        self.TN_energy = self._b | self.H | self._k
+
+        # the index names of each site are preserved throughout
+        self._bra_inds = {
+            ix: jx
+            for i in range(self.L)
+            for ix, jx in zip(self._k[i].inds, self._b[i].inds)
+        }
+
+    @property
+    def pt(self):
+        """The MPS state of the system at the current time."""
+        pt = self._k.copy()
+        pt.drop_tags("_KET")
+        return pt
+
+    def _set_site(self, i, data, inds):
+        """Insert new data for site ``i`` into the ket and bra, and thus all
+        environments viewing them.
+        """
+        self._k[i].modify(data=data, inds=inds)
+        self._b[i].modify(
+            data=do("conj", data),
+            inds=tuple(self._bra_inds[ix] for ix in inds),
+        )
+
+    def _evolve(self, tn, x, dt, left_inds=None):
+        """Evolve the tensor ``x`` by time ``dt`` under the effective
+        hamiltonian ``tn``, which maps the indices of ``x`` to ``left_inds``,
+        by default the corresponding bra indices.
+        """
+        right_inds = x.inds
+        if left_inds is None:
+            left_inds = tuple(self._bra_inds[ix] for ix in right_inds)
+
+        if all(isinstance(t.data, np.ndarray) for t in tn):
+            Heff = DenseEffectiveOperator(
+                tn, left_inds=left_inds, right_inds=right_inds
+            )
+        else:
+            Heff = TNLinearOperator(
+                tn,
+                left_inds=left_inds,
+                right_inds=right_inds,
+                ldims=x.shape,
+                rdims=x.shape,
+            )
+
+        factor = -dt if self.imag else -1j * dt
+        v = expm_multiply(factor * Heff, x.data.reshape(-1), **self.expm_opts)
+        return Tensor(np.asarray(v).reshape(x.shape), right_inds)
+
+    def _update_local_state_1site(self, i, direction, dt):
+        r"""Evolve site ``i`` forwards by ``dt``, then, unless at the end of
+        the sweep, split off the bond tensor towards the next site and evolve
+        it backwards by ``dt``, before absorbing it into the next site::
+
+                 |         ---Q--C--        ---Q--C'-|-
+            L----H----R  =>    |  |     =>    |      |
+                                                  ^ next site
+        """
+        x = self._evolve(self._eff_ham()["_HAM"], self._k[i], dt)
+
+        j = {"right": i + 1, "left": i - 1}[direction]
+        if not (0 <= j < self.L):
+            self._set_site(i, x.data, x.inds)
+            return
+
+        bond = self._k.bond(i, j)
+        others = tuple(ix for ix in x.inds if ix != bond)
+        if direction == "right":
+            Q, C = x.split(others, method="qr", get="arrays")
+            self._set_site(i, Q, (*others, bond))
+            env_tag, other_env_tag = "_LEFT", "_RIGHT"
+        else:
+            C, Q = x.split((bond,), method="lq", get="arrays")
+            self._set_site(i, Q, (bond, *others))
+            env_tag, other_env_tag = "_RIGHT", "_LEFT"
+
+        # the zero site effective hamiltonian of the bond tensor, the new
+        # bond index on the side of site i is temporarily renamed
+        eff = self._eff_ham() ^ (env_tag, self._k.site_tag(i))
+        cix, cjx = rand_uuid(), rand_uuid()
+        bra_bond = self._bra_inds[bond]
+        tn = TensorNetwork(
+            (
+                eff[env_tag].reindex({bond: cix, bra_bond: cjx}),
+                eff[other_env_tag],
+            )
+        )
+        if direction == "right":
+            C = Tensor(C, (cix, bond))
+            left_inds = (cjx, bra_bond)
+        else:
+            C = Tensor(C, (bond, cix))
+            left_inds = (bra_bond, cjx)
+        C = self._evolve(tn, C, -dt, left_inds=left_inds)
+
+        nxt = (C @ self._k[j]).reindex({cix: bond})
+        self._set_site(j, nxt.data, nxt.inds)
+
+    def _update_local_state_2site(self, i, direction, dt):
+        r"""Evolve sites ``i`` and ``i + 1`` together forwards by ``dt``,
+        split them, then, unless at the end of the sweep, evolve the site
+        containing the orthogonality center backwards by ``dt``::
+
+                 |  |           |  |          |  |
+            L----H--H----R  =>  >--o    =>    >--o'
+                                   ^ next site
+        """
+        k = self._k
+        bond = k.bond(i, i + 1)
+        uix_L = tuple(ix for ix in k[i].inds if ix != bond)
+        uix_R = tuple(ix for ix in k[i + 1].inds if ix != bond)
+
+        x = self._evolve(self._eff_ham()["_HAM"], k[i] @ k[i + 1], dt)
+        L, R = x.split(
+            left_inds=uix_L,
+            right_inds=uix_R,
+            absorb=direction,
+            get="arrays",
+            **self.split_opts,
+        )
+        self._set_site(i, L, (*uix_L, bond))
+        self._set_site(i + 1, R, (bond, *uix_R))
+
+        if (direction == "right") and (i < self.L - 2):
+            j, env_tags = i + 1, ("_LEFT", k.site_tag(i))
+        elif (direction == "left") and (i > 0):
+            j, env_tags = i, ("_RIGHT", k.site_tag(i + 1))
+        else:
+            return
+
+        eff = self._eff_ham() ^ env_tags
+        y = self._evolve(eff["_HAM"], k[j], -dt)
+        self._set_site(j, y.data, y.inds)
+
+    @profiled("TDVP.sweep")
+    def sweep(self, direction, dt, canonize=True):
+        """Perform a single sweep of local evolutions, by time ``dt``, leaving
+        the orthogonality center at the far end of the sweep.
+
+        Parameters
+        ----------
+        direction : {'right', 'left'}
+            Which direction to sweep.
+        dt : float
+            The time to evolve by.
+        canonize : bool, optional
+            Canonize the state first, not needed if doing alternate sweeps.
+        """
+        if canonize:
+            {"right": self._k.right_canonize, "left": self._k.left_canonize}[
+                direction
+            ](bra=self._b)
+
+        n, bsz = self.L, self.bsz
+        begin, sweep = {
+            "right": ("left", range(n - bsz + 1)),
+            "left": ("right", range(n - bsz, -1, -1)),
+        }[direction]
+
+        self._eff_ham = MovingEnvironment(self.TN_energy, begin=begin, bsz=bsz)
+        update = {
+            1: self._update_local_state_1site,
+            2: self._update_local_state_2site,
+        }[bsz]
+
+        for i in sweep:
+            self._eff_ham.move_to(i)
+            update(i, direction, dt)
+
+        if self.imag:
+            # renormalize the orthogonality center
+            c = {"right": n - 1, "left": 0}[direction]
+            self._set_site(
+                c, self._k[c].data / self._k[c].norm(), self._k[c].inds
+            )
+
+    def step(self, dt=None, progbar=None):
+        """Perform a single, second order, step of time ``dt``, by default
+        ``self.dt``.
+        """
+        dt = self.dt if dt is None else dt
+        if dt is None:
+            raise ValueError("Must set ``dt``.")
+
+        self.sweep("right", dt / 2)
+        self.sweep("left", dt / 2, canonize=False)
+        self.t += dt
+
+        if progbar is not None:
+            progbar.cupdate(self.t)
+            self._set_progbar_desc(progbar)
+
+    TARGET_TOL = 1e-13  # tolerance to have 'reached' target time
+
+    def update_to(self, T, dt=None, progbar=None):
+        """Update the state to time ``T``.
+
+        Parameters
+        ----------
+        T : float
+            The time to evolve to.
+        dt : float, optional
+            Time step to use, by default ``self.dt``.
+        progbar : bool, optional
+            Manually turn the progress bar off.
+        """
+        if T < self.t - self.TARGET_TOL:
+            # can't go backwards yet
+            raise NotImplementedError
+
+        dt = self.dt if dt is None else dt
+        if dt is None:
+            raise ValueError("Must set ``dt``.")
+
+        # set up progress bar and start evolution
+        progbar = self.progbar if (progbar is None) else progbar
+        progbar = continuous_progbar(self.t, T) if progbar else None
+
+        while self.t < T - dt:
+            # get closer until we can reach in a single step
+            self.step(dt=dt, progbar=progbar)
+
+        if T - self.t > self.TARGET_TOL:
+            self.step(dt=T - self.t, progbar=progbar)
+
+        if progbar:
+            progbar.close()
+
+    def _set_progbar_desc(self, progbar):
+        msg = f"t={self.t:.4g}, max-bond={self._k.max_bond()}"
+        progbar.set_description(msg)
+
+    def at_times(self, ts, dt=None, progbar=None):
+        """Generate the time evolved state at each time in ``ts``.
+
+        Parameters
+        ----------
+        ts : sequence of float
+            The times to evolve to and yield the state at.
+        dt : float, optional
+            Time step to use, by default ``self.dt``.
+        progbar : bool, optional
+            Manually turn the progress bar off.
+
+        Yields
+        ------
+        pt : MatrixProductState
+            The state at each of the times in ``ts``. This is a copy of
+            internal state used, so inplace changes can be made to it.
+        """
+        ts = sorted(ts)
+
+        progbar = self.progbar if (progbar is None) else progbar
+        if progbar:
+            ts = Progbar(ts)
+
+        for t in ts:
+            self.update_to(t, dt=dt, progbar=False)
+
+            if progbar:
+                self._set_progbar_desc(ts)
+
+            yield self.pt
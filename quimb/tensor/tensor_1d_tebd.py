@@ -5,9 +5,12 @@ import itertools
 import numpy as np
 from autoray import do
 
+from ..core import isherm
 from ..utils import continuous_progbar, deprecated, ensure_dict
 from ..utils import progbar as Progbar
+from ..utils_profile import profiled
 from .array_ops import norm_fro
+from .decomp import _compute_number_svals_to_keep_numba, map_cutoff_mode
 from .tensor_arbgeom_tebd import LocalHamGen
 
 
@@ -214,6 +217,48 @@ class LocalHam1D(LocalHamGen):
 NNI = deprecated(LocalHam1D, "NNI", "LocalHam1D")
 
 
+def _tebd_batched_update(As, Bs, ss, Us, cutoff, cutoff_mode, max_bond):
+    """Apply the stacked gates ``Us`` to the stacked right canonical site
+    pairs ``As`` and ``Bs``, each with shape ``(n, left, right, phys)``, and
+    with singular values ``ss`` on their left bonds, returning the new site
+    arrays and singular values for each pair.
+    """
+    n, Dl, Dm, da = do("shape", As)
+    _, _, Dr, db = do("shape", Bs)
+
+    # contract pairs -> (n, Dl, da * db, Dr)
+    As = do("reshape", do("transpose", As, (0, 1, 3, 2)), (n, -1, Dm))
+    Bs = do("reshape", do("transpose", Bs, (0, 1, 3, 2)), (n, Dm, -1))
+    T = do("reshape", do("matmul", As, Bs), (n, Dl, da * db, Dr))
+
+    # apply the gates
+    T = do("matmul", Us[:, None, :, :], T)
+
+    # split including the singular values to the left
+    sT = do("reshape", T, (n, Dl, -1)) * do("reshape", ss, (n, Dl, 1))
+    _, S, Y = do("linalg.svd", do("reshape", sT, (n, Dl * da, -1)))
+    T = do("reshape", T, (n, Dl * da, db * Dr))
+    TYH = do("matmul", T, do("conj", do("transpose", Y, (0, 2, 1))))
+
+    S_np = do("to_numpy", S)
+    new = []
+    for j in range(n):
+        k = _compute_number_svals_to_keep_numba(S_np[j], cutoff, cutoff_mode)
+        if max_bond > 0:
+            k = min(k, max_bond)
+
+        Ai = do("reshape", TYH[j, :, :k], (Dl, da, k))
+        Bi = do("reshape", Y[j, :k, :], (k, db, Dr))
+        new.append(
+            (
+                do("transpose", Ai, (0, 2, 1)),
+                do("transpose", Bi, (0, 2, 1)),
+                S[j, :k],
+            )
+        )
+    return new
+
+
 class TEBD:
     """Class implementing Time Evolving Block Decimation (TEBD) [1].
 
@@ -241,6 +286,23 @@ class TEBD:
         :func:`~quimb.tensor.tensor_core.tensor_split`.
     imag : bool, optional
         Enable imaginary time evolution. Defaults to ``False``.
+    batched : bool, optional
+        Whether to apply each even or odd layer of gates all at once, stacking
+        the site pairs of equal shape into single batched contractions and
+        SVDs, rather than one gate at a time. This removes the per gate python
+        overhead. The state is kept in the 'inverse-free' right canonical form
+        of Hastings [2], along with the singular values of every bond, so that
+        each gate can be applied independently. Only real time evolution with
+        open boundary conditions is supported, and only the ``'max_bond'``,
+        ``'cutoff'`` and ``'cutoff_mode'`` entries of ``split_opts`` are used.
+    executor : concurrent.futures.Executor, optional
+        If supplied, along with ``batched=True``, update every bond of each
+        layer concurrently with this executor, e.g. a
+        ``ThreadPoolExecutor``, since the underlying matrix multiplications
+        and SVDs release the GIL.
+
+    [2] M. B. Hastings, Light-cone matrix product, J. Math. Phys. 50, 095207
+    (2009).
 
     See Also
     --------
@@ -257,6 +319,8 @@ class TEBD:
         split_opts=None,
         progbar=True,
         imag=False,
+        batched=False,
+        executor=None,
     ):
         # prepare initial state
         self._pt = p0.canonicalize(0)
@@ -294,6 +358,21 @@ class TEBD:
         self.progbar = progbar
         self.split_opts = ensure_dict(split_opts)
 
+        # buffers for observations taken during the final sweep
+        self._record = None
+        self._recording = False
+
+        self.batched = batched
+        self.executor = executor
+        if (executor is not None) and (not batched):
+            raise ValueError(
+                "An ``executor`` can only be used with ``batched=True``, "
+                "since sequential gates depend on each other through the "
+                "orthogonality center."
+            )
+        if batched:
+            self._init_batched()
+
     @property
     def pt(self):
         """The MPS state of the system at the current time."""
@@ -316,6 +395,7 @@ class TEBD:
         imag_factor = 1.0 if self.imag else 1.0j
         return self.H.get_gate_expm(sites, -imag_factor * self._dt * dt_frac)
 
+    @profiled("TEBD.sweep")
     def sweep(self, direction, dt_frac, dt=None, queue=False):
         """Perform a single sweep of gates and compression. This shifts the
         orthonognality centre along with the gates as they are applied and
@@ -366,6 +446,9 @@ class TEBD:
 
         # ------------------------------------------------------------------- #
 
+        if self.batched:
+            return self._sweep_batched(direction, dt_frac)
+
         if direction == "right":
             start_site_ind = 0
             final_site_ind = self.L - 1
@@ -384,9 +467,13 @@ class TEBD:
                 self._pt.gate_split_(
                     U, where=sites, absorb="right", **self.split_opts
                 )
+                if self._recording:
+                    self._record_center(i + 1)
 
             if self.L % 2 == 1:
                 self._pt.left_canonize_site(self.L - 2)
+                if self._recording:
+                    self._record_center(self.L - 1)
                 if self.cyclic:
                     sites = (self.L - 1, 0)
                     U = self._get_gate_from_ham(dt_frac, sites)
@@ -431,26 +518,218 @@ class TEBD:
             factor = self._pt[final_site_ind].norm()
             self._pt[final_site_ind] /= factor
 
-    def _step_order2(self, tau=1, **sweep_opts):
-        """Perform a single, second order step."""
+    def _get_site_array(self, i, x=None):
+        """Get the data of site ``i`` with shape ``(left, right, phys)``,
+        padding the end sites with size 1 bonds.
+        """
+        if x is None:
+            x = self._pt[i].data
+        if i == 0:
+            x = do("reshape", x, (1, *do("shape", x)))
+        if i == self.L - 1:
+            Dl, d = do("shape", x)
+            x = do("reshape", x, (Dl, 1, d))
+        return x
+
+    def _set_site_array(self, i, x):
+        """Set the data of site ``i`` from shape ``(left, right, phys)``."""
+        Dl, Dr, d = do("shape", x)
+        if i == 0:
+            x = do("reshape", x, (Dr, d))
+        elif i == self.L - 1:
+            x = do("reshape", x, (Dl, d))
+        self._pt[i].modify(data=x)
+
+    def _get_ordered_site_array(self, i):
+        """Get the data of site ``i`` with shape ``(left, right, phys)``, for
+        any ordering of its indices.
+        """
+        inds = []
+        if i > 0:
+            inds.append(self._pt.bond(i - 1, i))
+        if i < self.L - 1:
+            inds.append(self._pt.bond(i, i + 1))
+        inds.append(self._pt.site_ind(i))
+        return self._get_site_array(i, self._pt[i].transpose(*inds).data)
+
+    def _record_center(self, i):
+        """Record the singular values of the bonds either side of site ``i``,
+        the orthogonality center, and the reduced density matrices of it and
+        the left canonical site to its left. These are all final, since any
+        remaining gates of the sweep act unitarily on the right only.
+        """
+        svals, rhos = self._record["svals"], self._record["rdms"]
+
+        C = self._get_ordered_site_array(i)
+        Dl, Dr, d = do("shape", C)
+        Cm = do("reshape", C, (Dl, Dr * d))
+
+        if i > 0:
+            svals[i - 1] = do("linalg.svd", Cm)[1]
+            M = do("matmul", Cm, do("conj", do("transpose", Cm)))
+            A = self._get_ordered_site_array(i - 1)
+            AM = do("tensordot", A, M, ((1,), (0,)))
+            rhos[i - 1] = do("tensordot", AM, do("conj", A), ((0, 2), (0, 1)))
+        if i < self.L - 1:
+            Cm = do("reshape", do("transpose", C, (0, 2, 1)), (Dl * d, Dr))
+            svals[i] = do("linalg.svd", Cm)[1]
+
+        rhos[i] = do("tensordot", C, do("conj", C), ((0, 1), (0, 1)))
+
+    def _record_batched(self):
+        """Record the singular values of every bond, and the reduced density
+        matrix of every site, directly from the batched canonical form.
+        """
+        svals, rhos = self._record["svals"], self._record["rdms"]
+        svals[:] = self._svals
+        for i in range(self.L):
+            sB = self._get_site_array(i) * do(
+                "reshape", self._get_left_svals(i), (-1, 1, 1)
+            )
+            rhos[i] = do("tensordot", sB, do("conj", sB), ((0, 1), (0, 1)))
+
+    def _init_batched(self):
+        """Bring the state into right canonical form and compute the singular
+        values of every bond, ready for batched layers of gates.
+        """
+        if self.cyclic or self.imag:
+            raise ValueError(
+                "Batched TEBD only supports real time evolution with open "
+                "boundary conditions."
+            )
+        self._batched_gate_cache = {}
+
+        self._pt.permute_arrays("lrp")
+        self._pt.left_canonize()
+        self._svals = [None] * (self.L - 1)
+
+        # sweep back to the left with SVDs, so that each singular value
+        # spectrum is exactly that of the left canonical part
+        x = self._get_site_array(self.L - 1)
+        for i in range(self.L - 1, 0, -1):
+            Dl, Dr, d = do("shape", x)
+            U, s, VH = do("linalg.svd", do("reshape", x, (Dl, Dr * d)))
+            self._set_site_array(i, do("reshape", VH, (-1, Dr, d)))
+            self._svals[i - 1] = s
+            x = do(
+                "transpose",
+                do(
+                    "tensordot",
+                    self._get_site_array(i - 1),
+                    U * s,
+                    ((1,), (0,)),
+                ),
+                (0, 2, 1),
+            )
+        self._set_site_array(0, x)
+
+    def _get_left_svals(self, i):
+        """Get the singular values of the bond to the left of site ``i``."""
+        if i == 0:
+            return do("ones", (1,), like=self._svals[0])
+        return self._svals[i - 1]
+
+    def _get_stacked_gates(self, dt_frac, sites):
+        """Get the exponentiated gates for the bonds starting at each of
+        ``sites``, as matrices stacked along a new first dimension, cached.
+        """
+        key = (self._dt * dt_frac, tuple(sites))
+        if key not in self._batched_gate_cache:
+            Us = []
+            for i in sites:
+                U = self._get_gate_from_ham(dt_frac, (i, i + 1))
+                d2 = int(do("size", U) ** 0.5)
+                Us.append(do("reshape", U, (d2, d2)))
+            self._batched_gate_cache[key] = do("stack", Us)
+        return self._batched_gate_cache[key]
+
+    @profiled("TEBD.sweep_batched")
+    def _sweep_batched(self, direction, dt_frac):
+        r"""Apply every even (``direction='right'``) or odd
+        (``direction='left'``) gate at once. For each bond, with right
+        canonical sites ``B`` and left singular values ``s``, the gated pair
+        ``T = U B B`` is split as ``s T = X S Y``, then the new sites are
+        ``T Y^\dagger`` and ``Y`` with new singular values ``S``, which needs
+        no inversion of ``s`` and no shifting of the orthogonality center.
+        """
+        parity = {"right": 0, "left": 1}[direction]
+
+        max_bond = self.split_opts.get("max_bond", None)
+        max_bond = -1 if max_bond is None else max_bond
+        cutoff = self.split_opts.get("cutoff", 1e-10)
+        # same default as ``MatrixProductState.gate_split`` with OBC
+        cutoff_mode = map_cutoff_mode(
+            self.split_opts.get("cutoff_mode", "rsum2")
+        )
+
+        # group the pairs of sites in this layer by shape
+        groups = {}
+        for i in range(parity, self.L - 1, 2):
+            key = (
+                do("shape", self._get_site_array(i)),
+                do("shape", self._get_site_array(i + 1)),
+            )
+            groups.setdefault(key, []).append(i)
+
+        if self.executor is None:
+            batches = list(groups.values())
+        else:
+            # update every bond concurrently
+            batches = [[i] for sites in groups.values() for i in sites]
+
+        tasks = []
+        for sites in batches:
+            As = do("stack", [self._get_site_array(i) for i in sites])
+            Bs = do("stack", [self._get_site_array(i + 1) for i in sites])
+            ss = do("stack", [self._get_left_svals(i) for i in sites])
+            Us = self._get_stacked_gates(dt_frac, sites)
+            args = (As, Bs, ss, Us, cutoff, cutoff_mode, max_bond)
+
+            if self.executor is None:
+                tasks.append((sites, _tebd_batched_update(*args)))
+            else:
+                tasks.append(
+                    (sites, self.executor.submit(_tebd_batched_update, *args))
+                )
+
+        for sites, result in tasks:
+            if self.executor is not None:
+                result = result.result()
+            for i, (Ai, Bi, si) in zip(sites, result):
+                self._set_site_array(i, Ai)
+                self._set_site_array(i + 1, Bi)
+                self._svals[i] = si
+
+    def _step_order2(self, tau=1, record=False, **sweep_opts):
+        """Perform a single, second order step, if ``record``, recording
+        observations during the final sweep.
+        """
         self.sweep("right", tau / 2, **sweep_opts)
         self.sweep("left", tau, **sweep_opts)
-        self.sweep("right", tau / 2, **sweep_opts)
-
-    def _step_order4(self, **sweep_opts):
-        """Perform a single, fourth order step."""
+        self._recording = record
+        try:
+            self.sweep("right", tau / 2, **sweep_opts)
+        finally:
+            self._recording = False
+
+    def _step_order4(self, record=False, **sweep_opts):
+        """Perform a single, fourth order step, if ``record``, recording
+        observations during the final sweep.
+        """
         tau1 = tau2 = 1 / (4 * 4 ** (1 / 3))
         tau3 = 1 - 2 * tau1 - 2 * tau2
         self._step_order2(tau1, **sweep_opts)
         self._step_order2(tau2, **sweep_opts)
         self._step_order2(tau3, **sweep_opts)
         self._step_order2(tau2, **sweep_opts)
-        self._step_order2(tau1, **sweep_opts)
+        self._step_order2(tau1, record=record, **sweep_opts)
 
-    def step(self, order=2, dt=None, progbar=None, **sweep_opts):
-        """Perform a single step of time ``self.dt``."""
+    def step(self, order=2, dt=None, progbar=None, record=False, **sweep_opts):
+        """Perform a single step of time ``self.dt``. If ``record``, and not
+        queueing sweeps, record observations during its final sweep.
+        """
         {2: self._step_order2, 4: self._step_order4}[order](
-            dt=dt, **sweep_opts
+            dt=dt, record=record, **sweep_opts
         )
 
         dt = self._dt if dt is None else dt
@@ -510,8 +789,15 @@ class TEBD:
             # get closer until we can reach in a single step
             self.step(order=order, progbar=progbar, dt=None, queue=True)
 
-        # always perform final sweep with queue draining
-        self.step(order=order, progbar=progbar, dt=T - self.t, queue=False)
+        # always perform final sweep with queue draining, which is also when
+        # any observations are recorded
+        self.step(
+            order=order,
+            progbar=progbar,
+            dt=T - self.t,
+            queue=False,
+            record=self._record is not None,
+        )
 
         if progbar:
             progbar.close()
@@ -562,6 +848,118 @@ class TEBD:
 
             yield self.pt
 
+    def observe(
+        self,
+        ts,
+        ops=None,
+        entropy=True,
+        rdms=False,
+        dt=None,
+        tol=None,
+        order=4,
+        progbar=None,
+    ):
+        """Evolve to each time in ``ts``, collecting the entropy of every bond,
+        and the reduced density matrix and expectation of local operators of
+        every site, into preallocated arrays. These are computed from the
+        orthogonality center as it passes each site during the final sweep of
+        gates, so, unlike calling ``MatrixProductState.entropy`` or
+        ``local_expectation`` on each state, require no extra canonization or
+        contraction of the whole chain.
+
+        Parameters
+        ----------
+        ts : sequence of float
+            The times to evolve to and observe the state at.
+        ops : dict[str, array_like], optional
+            Single site operators to compute the expectation of at every site,
+            keyed by the name to store the results under.
+        entropy : bool, optional
+            Whether to compute the entropy of every bond.
+        rdms : bool, optional
+            Whether to store the reduced density matrix of every site.
+        dt : float, optional
+            Time step to use. Can't be set as well as ``tol``.
+        tol : float, optional
+            Tolerance for whole evolution. Can't be set as well as ``dt``.
+        order : int, optional
+            Trotter order to use.
+        progbar : bool, optional
+            Manually turn the progress bar off.
+
+        Returns
+        -------
+        data : dict[str, numpy.ndarray]
+            With the following keys, with the time as the first dimension of
+            every array:
+
+                - ``'entropy'``: shape ``(len(ts), L - 1)``, where
+                  ``data['entropy'][k, i]`` is ``pt.entropy(i + 1)``.
+                - ``'rdms'``: shape ``(len(ts), L, d, d)``.
+                - each name in ``ops``: shape ``(len(ts), L)``.
+        """
+        if self.cyclic or self.imag:
+            raise ValueError(
+                "Observations are only supported for real time evolution "
+                "with open boundary conditions."
+            )
+
+        ops = ensure_dict(ops)
+        ts = sorted(ts)
+        nt = len(ts)
+        d = self._pt.phys_dim()
+
+        # preallocate the outputs
+        data = {}
+        if entropy:
+            data["entropy"] = np.empty((nt, self.L - 1))
+        if rdms:
+            data["rdms"] = np.empty((nt, self.L, d, d), dtype=complex)
+        herm = {name: isherm(op) for name, op in ops.items()}
+        for name in ops:
+            dtype = float if herm[name] else complex
+            data[name] = np.empty((nt, self.L), dtype=dtype)
+
+        # need to use dt always so tol applies over whole T sweep
+        dt = self._compute_sweep_dt_tol(ts[-1], dt, tol, order)
+
+        progbar = self.progbar if (progbar is None) else progbar
+        if progbar:
+            ts = Progbar(ts)
+
+        self._record = {
+            "svals": [None] * (self.L - 1),
+            "rdms": [None] * self.L,
+        }
+        try:
+            for k, t in enumerate(ts):
+                self.update_to(t, dt=dt, tol=False, order=order, progbar=False)
+                if self.batched:
+                    self._record_batched()
+
+                if entropy:
+                    for i, s in enumerate(self._record["svals"]):
+                        p = do("to_numpy", s) ** 2
+                        p = p[p > 0.0]
+                        data["entropy"][k, i] = -np.sum(p * np.log2(p))
+
+                if rdms or ops:
+                    rhos = np.stack(
+                        [do("to_numpy", rho) for rho in self._record["rdms"]]
+                    )
+                    if rdms:
+                        data["rdms"][k] = rhos
+                    for name, op in ops.items():
+                        x = np.einsum("ipq,qp->i", rhos, np.asarray(op))
+                        data[name][k] = x.real if herm[name] else x
+
+                if progbar:
+                    self._set_progbar_desc(ts)
+        finally:
+            self._record = None
+
+        return data
+
 
 def OTOC_local(
     psi0,
@@ -840,6 +840,44 @@ class TensorNetworkGen(TensorNetwork):
         self._site_set = None
         self._site_tag_set = None
         self._site_tags = None
+        self._d2bp = None
+
+    def get_d2bp(self, reset=False, **bp_opts):
+        """Get a persistent dense 2-norm belief propagation session for this
+        tensor network. The first call creates a
+        :class:`~quimb.tensor.belief_propagation.D2BP` object acting inplace
+        on this tensor network, subsequent calls return the same object, with
+        its messages kept from previous runs. Since it detects which tensors
+        have been given new data since it last iterated, for example by
+        applying gates, calling ``run`` on it again only re-converges the
+        messages in the region affected by the changes, rather than starting
+        from scratch.
+
+        Parameters
+        ----------
+        reset : bool, optional
+            Whether to discard any existing session and create a new one.
+        bp_opts
+            Supplied to :class:`~quimb.tensor.belief_propagation.D2BP` when
+            creating a new session, ignored otherwise.
+
+        Returns
+        -------
+        D2BP
+        """
+        bp = getattr(self, "_d2bp", None)
+        if reset or (bp is None):
+            from quimb.tensor.belief_propagation import D2BP
+
+            bp = self._d2bp = D2BP(self, inplace=True, **bp_opts)
+        return bp
+
+    def __getstate__(self):
+        # any belief propagation session can't be pickled, and is rebuilt
+        # on demand by ``get_d2bp`` anyway
+        d = super().__getstate__()
+        d.pop("_d2bp", None)
+        return d
 
     @functools.wraps(tensor_network_align)
     def align(self, *args, inplace=False, **kwargs):
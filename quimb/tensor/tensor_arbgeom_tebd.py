@@ -14,6 +14,7 @@ from ..utils import (
 )
 from ..utils import progbar as Progbar
 from ..utils_plot import default_to_neutral_style
+from ..utils_profile import profiled
 from .drawing import get_colors, get_positions
 from .tensor_core import Tensor
 
@@ -503,6 +504,7 @@ class TEBDGen:
         callback=None,
         keep_best=False,
         progbar=True,
+        executor=None,
     ):
         self.imag = imag
         if not imag:
@@ -512,6 +514,7 @@ class TEBDGen:
         self.ham = ham
         self.progbar = progbar
         self.callback = callback
+        self.executor = executor
 
         # default time step to use
         self.tau = tau
@@ -561,6 +564,7 @@ class TEBDGen:
         self.best = dict(energy=float("inf"), state=None, it=None)
         self.stop = False
 
+    @profiled("TEBDGen.sweep")
     def sweep(self, tau):
         r"""Perform a full sweep of gates at every pair.
 
@@ -581,10 +585,14 @@ class TEBDGen:
             factor = 1.0
 
         layer = set()
+        layer_gates = []
 
         for where in ordering:
             if any(coo in layer for coo in where):
                 # starting a new non-commuting layer
+                if layer_gates:
+                    self.gate_layer(layer_gates)
+                    layer_gates = []
                 self.postlayer()
                 layer = set(where)
             else:
@@ -598,8 +606,14 @@ class TEBDGen:
 
             G = self.ham.get_gate_expm(where, -self.last_tau / factor)
 
-            self.gate(G, where)
+            if self.executor is None:
+                self.gate(G, where)
+            else:
+                # defer until the whole commuting layer is known
+                layer_gates.append((G, where))
 
+        if layer_gates:
+            self.gate_layer(layer_gates)
         self.postlayer()
 
     def _set_progbar_description(self, pbar):
@@ -771,6 +785,14 @@ class TEBDGen:
         """
         pass
 
+    def gate_layer(self, gates):
+        """Perform a layer of commuting gates, ``gates``, a sequence of
+        ``(U, where)`` pairs, only called if ``executor`` is set. By default
+        this simply applies them one after another.
+        """
+        for U, where in gates:
+            self.gate(U, where)
+
     def gate(self, U, where):
         """Perform single gate ``U`` at coordinate pair ``where``. This is the
         the most common method to override.
@@ -913,6 +935,18 @@ class TEBDGen:
         return s.format(self.__class__.__name__, self.n, self.tau, self.D)
 
 
+def _gate_simple_local(tn_where, G, where, gauges, gate_opts):
+    """Apply the gate ``G`` to a copy of the local tensor network
+    ``tn_where``, returning the new tensor of each site in ``where``, and the
+    new gauges of its bonds, leaving the originals untouched.
+    """
+    tn_where = tn_where.copy()
+    gauges = {ix: gauges[ix] for ix in tn_where.ind_map if ix in gauges}
+    tn_where.gate_simple_(G, where, gauges=gauges, **gate_opts)
+    new_tensors = {site: tn_where[tn_where.site_tag(site)] for site in where}
+    return new_tensors, gauges
+
+
 class SimpleUpdateGen(TEBDGen):
     """Simple update for arbitrary geometry hamiltonians.
 
@@ -955,8 +989,11 @@ class SimpleUpdateGen(TEBDGen):
     tol : float, optional
         If not ``None``, stop when either energy difference falls below this
         value, or maximum singluar value changes fall below this value.
-    equilibrate_every : int, optional
-        Equilibrate the gauges every this many steps.
+    equilibrate_every : int or {'gate', 'layer'}, optional
+        Equilibrate the gauges every this many steps, or locally after every
+        gate, or fully after every commuting layer of gates. With an
+        ``executor``, ``'gate'`` equilibrates locally around all the gates
+        of each layer at once, after they have all been applied.
     equilibrate_start : bool, optional
         Whether to equilibrate the gauges at the start, regardless of
         ``equilibrate_every``.
@@ -970,6 +1007,14 @@ class SimpleUpdateGen(TEBDGen):
         Whether to keep track of the best state and energy.
     progbar : bool, optional
         Whether to show a progress bar during evolution.
+    executor : concurrent.futures.Executor, optional
+        If supplied, apply all the gates of each commuting layer, e.g. the
+        edges of one color of the ``'sort'`` ordering, concurrently with this
+        executor. Each gate is applied to a copy of its local tensors, so a
+        ``ThreadPoolExecutor`` is suitable since the SVDs release the GIL.
+        With ``equilibrate_every='gate'``, the gauges are then equilibrated
+        once per layer instead. Subclasses which override :meth:`gate` apply
+        the gates of each layer sequentially.
     """
 
     def __init__(
@@ -995,6 +1040,7 @@ class SimpleUpdateGen(TEBDGen):
         callback=None,
         keep_best=False,
         progbar=True,
+        executor=None,
     ):
         self.equilibrate_every = equilibrate_every
         self.equilibrate_start = bool(equilibrate_start)
@@ -1024,6 +1070,7 @@ class SimpleUpdateGen(TEBDGen):
             callback=callback,
             keep_best=keep_best,
             progbar=progbar,
+            executor=executor,
         )
 
     def gate(self, G, where):
@@ -1035,6 +1082,46 @@ class SimpleUpdateGen(TEBDGen):
             tids = self._psi._get_tids_from_tags(tags, "any")
             self.equilibrate(touched_tids=tids)
 
+    def gate_layer(self, gates):
+        """Concurrent application of a layer of commuting gates, ``gates``, a
+        sequence of ``(G, where)`` pairs, using ``executor``. If a subclass
+        overrides :meth:`gate`, e.g. cluster update, the gates are instead
+        applied one after another with it.
+        """
+        if type(self).gate is not SimpleUpdateGen.gate:
+            # the concurrent path only reproduces plain simple update
+            return super().gate_layer(gates)
+
+        futures = []
+        for G, where in gates:
+            tags = [self._psi.site_tag(x) for x in where]
+            tids = self._psi._get_tids_from_tags(tags, "any")
+            futures.append(
+                self.executor.submit(
+                    _gate_simple_local,
+                    self._psi._select_tids(tids),
+                    G,
+                    where,
+                    self.gauges,
+                    self.gate_opts,
+                )
+            )
+
+        # only modify the state once every gate is complete
+        touched_tids = set()
+        for future in futures:
+            new_tensors, new_gauges = future.result()
+            for site, t in new_tensors.items():
+                (tid,) = self._psi._get_tids_from_tags(
+                    self._psi.site_tag(site)
+                )
+                self._psi.tensor_map[tid].modify(data=t.data, inds=t.inds)
+                touched_tids.add(tid)
+            self.gauges.update(new_gauges)
+
+        if self.equilibrate_every == "gate":
+            self.equilibrate(touched_tids=touched_tids)
+
     def equilibrate(self, **kwargs):
         """Equilibrate the gauges with the current state (like evolving with
         tau=0).
@@ -390,7 +390,9 @@ def TN_from_edges_and_fill_fn(
     else:
         qtype = "scalar"
 
-    ts = []
+    arrays = []
+    inds_seq = []
+    tags_seq = []
     sites = []
     for node, inds in sorted(terms.items(), key=lambda x: x[0]):
         sites.append(node)
@@ -406,31 +408,37 @@ def TN_from_edges_and_fill_fn(
             shape.append(phys_dim)
             shape.append(phys_dim)
 
-        data = fill_fn(shape)
-        tags = site_tag_id.format(node)
-        ts.append(Tensor(data=data, inds=inds, tags=tags))
-
-    tn = TensorNetwork(ts)
+        arrays.append(fill_fn(shape))
+        inds_seq.append(inds)
+        tags_seq.append(site_tag_id.format(node))
 
     if qtype == "vector":
-        tn.view_as_(
-            TensorNetworkGenVector,
+        return TensorNetworkGenVector.from_arrays(
+            arrays,
+            inds_seq,
+            tags_seq,
             sites=sites,
             site_tag_id=site_tag_id,
             site_ind_id=site_ind_id,
         )
     elif qtype == "operator":
-        tn.view_as_(
-            TensorNetworkGenOperator,
+        return TensorNetworkGenOperator.from_arrays(
+            arrays,
+            inds_seq,
+            tags_seq,
             sites=sites,
             site_tag_id=site_tag_id,
             upper_ind_id=upper_ind_id,
             lower_ind_id=lower_ind_id,
         )
     else:
-        tn.view_as_(TensorNetworkGen, sites=sites, site_tag_id=site_tag_id)
-
-    return tn
+        return TensorNetworkGen.from_arrays(
+            arrays,
+            inds_seq,
+            tags_seq,
+            sites=sites,
+            site_tag_id=site_tag_id,
+        )
 
 
 def TN_from_edges_empty(
@@ -1209,7 +1217,9 @@ def TN2D_from_fill_fn(
     except TypeError:
         cyclic_x = cyclic_y = cyclic
 
-    ts = []
+    arrays = []
+    inds_seq = []
+    tags_seq = []
     bonds = collections.defaultdict(rand_uuid)
 
     for i, j in itertools.product(range(Lx), range(Ly)):
@@ -1230,18 +1240,20 @@ def TN2D_from_fill_fn(
             inds.append(bonds[((i - 1) % Lx, j), (i, j)])
 
         shape = (D,) * len(inds)
-        data = fill_fn(shape)
-        tags = [
-            site_tag_id.format(i, j),
-            x_tag_id.format(i),
-            y_tag_id.format(j),
-        ]
-        ts.append(Tensor(data=data, inds=inds, tags=tags))
-
-    tn = TensorNetwork(ts)
+        arrays.append(fill_fn(shape))
+        inds_seq.append(inds)
+        tags_seq.append(
+            (
+                site_tag_id.format(i, j),
+                x_tag_id.format(i),
+                y_tag_id.format(j),
+            )
+        )
 
-    return tn.view_as_(
-        TensorNetwork2D,
+    return TensorNetwork2D.from_arrays(
+        arrays,
+        inds_seq,
+        tags_seq,
         Lx=Lx,
         Ly=Ly,
         site_tag_id=site_tag_id,
@@ -2643,16 +2655,23 @@ def HTN_classical_partition_function_from_edges(
     """
     j_factory = parse_j_coupling_to_function(j)
 
-    ts = []
+    arrays = []
+    inds_seq = []
+    tags_seq = []
     for node_a, node_b in gen_unique_edges(edges):
-        data = classical_ising_S_matrix(beta=beta, j=j_factory(node_a, node_b))
-        inds = [site_ind_id.format(node_a), site_ind_id.format(node_b)]
-        tags = [
-            bond_tag_id.format(node_a, node_b),
-            site_tag_id.format(node_a),
-            site_tag_id.format(node_b),
-        ]
-        ts.append(Tensor(data=data, inds=inds, tags=tags))
+        arrays.append(
+            classical_ising_S_matrix(beta=beta, j=j_factory(node_a, node_b))
+        )
+        inds_seq.append(
+            (site_ind_id.format(node_a), site_ind_id.format(node_b))
+        )
+        tags_seq.append(
+            (
+                bond_tag_id.format(node_a, node_b),
+                site_tag_id.format(node_a),
+                site_tag_id.format(node_b),
+            )
+        )
 
     if h != 0.0:
         if callable(h):
@@ -2663,12 +2682,13 @@ def HTN_classical_partition_function_from_edges(
                 return h
 
         for node in unique(concat(edges)):
-            data = classical_ising_H_matrix(beta, h=float(h_factory(node)))
-            inds = [site_ind_id.format(node)]
-            tags = [site_tag_id.format(node)]
-            ts.append(Tensor(data=data, inds=inds, tags=tags))
+            arrays.append(
+                classical_ising_H_matrix(beta, h=float(h_factory(node)))
+            )
+            inds_seq.append((site_ind_id.format(node),))
+            tags_seq.append(site_tag_id.format(node))
 
-    return TensorNetwork(ts)
+    return TensorNetwork.from_arrays(arrays, inds_seq, tags_seq)
 
 
 def TN_classical_partition_function_from_edges(
@@ -4506,9 +4526,17 @@ class SpinHam1D:
         lower_ind_id="b{}",
         site_tag_id="I{}",
         tags=None,
+        symmetry=None,
+        index_map=None,
     ):
         """Build an MPO instance of this spin hamiltonian of size ``L``. See
         also ``MatrixProductOperator``.
+
+        If ``symmetry`` is given, e.g. ``"U1"`` for hamiltonians conserving
+        total :math:`S^Z` or ``"Z2"`` for those conserving its parity, the MPO
+        is built with block-sparse arrays, see
+        :meth:`~quimb.tensor.tensor_1d.TensorNetwork1DFlat.to_abelian`, with
+        ``index_map`` giving the charge of each spin basis state.
         """
         # cache the default term
         t_defs = {}
@@ -4559,7 +4587,7 @@ class SpinHam1D:
                         cyclic=self.cyclic,
                     )
 
-        return MatrixProductOperator(
+        H = MatrixProductOperator(
             arrays=gen_tensors(),
             upper_ind_id=upper_ind_id,
             lower_ind_id=lower_ind_id,
@@ -4567,6 +4595,11 @@ class SpinHam1D:
             tags=tags,
         )
 
+        if symmetry is not None:
+            H.to_abelian_(symmetry, index_map=index_map)
+
+        return H
+
     def build_sparse(self, L, **ikron_opts):
         """Build a sparse matrix representation of this Hamiltonian.
 
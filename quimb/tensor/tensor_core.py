@@ -4,6 +4,7 @@ import collections
 import contextlib
 import copy
 import functools
+import gc
 import itertools
 import math
 import operator
@@ -34,6 +35,7 @@ except ImportError:
 from ..core import make_immutable, prod, qarray, realify_scalar, vdot
 from ..gen.rand import rand_matrix, rand_uni, randn, seed_rand
 from ..utils import (
+    LRU,
     check_opt,
     concat,
     deprecated,
@@ -45,6 +47,7 @@ from ..utils import (
     unique,
     valmap,
 )
+from ..utils_profile import profile_section, profiled
 from . import decomp
 from .array_ops import (
     PArray,
@@ -62,8 +65,11 @@ from .contraction import (
     array_contract_expression,
     array_contract_path,
     array_contract_pathinfo,
+    array_contract_sliced,
     array_contract_tree,
     get_contract_backend,
+    get_contract_path_cache,
+    get_contract_strategy,
     get_symbol,
     get_tensor_linop_backend,
     inds_to_eq,
@@ -132,7 +138,7 @@ def tags_to_oset(tags):
     if tags is None:
         return oset()
     elif isinstance(tags, (str, int)):
-        return oset((tags,))
+        return oset._from_dict({tags: None})
     elif isinstance(tags, oset):
         return tags.copy()
     else:
@@ -210,6 +216,7 @@ def maybe_realify_scalar(data):
 
 
 @functools.singledispatch
+@profiled("tensor_contract")
 def tensor_contract(
     *tensors: "Tensor",
     output_inds=None,
@@ -347,6 +354,108 @@ def tensor_contract(
     return result
 
 
+class CompiledContraction:
+    """A contraction of tensors with a fixed structure - the indices and shape
+    of each input - into a scalar or tensor. The output indices, contraction
+    path and expression are all computed once, so that repeated calls with new
+    arrays avoid all the python overhead of :func:`tensor_contract`.
+
+    Parameters
+    ----------
+    inputs : tuple[tuple[str]]
+        The indices of each input tensor.
+    output : tuple[str], optional
+        The output indices, if not given computed as for
+        :func:`tensor_contract`.
+    shapes : tuple[tuple[int]]
+        The shape of each input tensor.
+    optimize : str, PathOptimizer, ContractionTree or path_like, optional
+        The contraction path optimization strategy to use.
+    backend : str, optional
+        Which backend to use to perform the contraction.
+    preserve_tensor : bool, optional
+        Whether to return a tensor regardless of whether the output object
+        is a scalar (has no indices) or not.
+    strip_exponent : bool, optional
+        If `True`, return the exponent of the result, log10, as well as the
+        rescaled 'mantissa'.
+    contract_opts
+        Supplied to :func:`cotengra.array_contract_expression`.
+    """
+
+    def __init__(
+        self,
+        inputs,
+        output=None,
+        shapes=None,
+        optimize=None,
+        backend=None,
+        preserve_tensor=False,
+        strip_exponent=False,
+        **contract_opts,
+    ):
+        self.inputs = inputs
+        if output is None:
+            output = tuple(_gen_output_inds(concat(inputs)))
+        self.output = tuple(output)
+        self.shapes = shapes
+        self.backend = backend
+        self.preserve_tensor = preserve_tensor
+        self.strip_exponent = strip_exponent
+        self.expr = array_contract_expression(
+            inputs=inputs,
+            output=self.output,
+            shapes=shapes,
+            optimize=optimize,
+            strip_exponent=strip_exponent,
+            **contract_opts,
+        )
+
+    def __call__(self, *arrays, tags=None, exponent=None):
+        """Contract ``arrays``, which should match the structure this
+        contraction was compiled for.
+
+        Parameters
+        ----------
+        arrays : sequence of array_like
+            The raw arrays to contract.
+        tags : sequence of str, optional
+            Tags to give the output tensor, if one is produced.
+        exponent : float, optional
+            If supplied, an overall base exponent to scale the result by.
+
+        Returns
+        -------
+        scalar, Tensor or (scalar or Tensor, float)
+        """
+        data_out = self.expr(*arrays, backend=self.backend)
+
+        if self.strip_exponent:
+            data_out, result_exponent = data_out
+            if exponent is not None:
+                result_exponent = result_exponent + exponent
+        elif exponent is not None:
+            data_out = data_out * 10**exponent
+
+        if not self.output and not self.preserve_tensor:
+            result = maybe_realify_scalar(data_out)
+        else:
+            result = Tensor(data=data_out, inds=self.output, tags=tags)
+
+        if self.strip_exponent:
+            return result, result_exponent
+        return result
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(num_inputs={len(self.inputs)}, "
+            f"output={self.output})"
+        )
+
+
+_COMPILED_CONTRACTIONS = LRU(2**10)
+
+
 # generate a random base to avoid collisions on difference processes ...
 _RAND_PREFIX = str(uuid.uuid4())[:6]
 # but then make the list orderable to help contraction caching
@@ -465,6 +574,7 @@ def _check_left_right_isom(method, absorb):
 
 
 @functools.singledispatch
+@profiled("tensor_split")
 def tensor_split(
     T: "Tensor",
     left_inds,
@@ -626,7 +736,8 @@ def tensor_split(
     )
 
     # `s` itself will be None unless `absorb=None` is specified
-    left, s, right = _SPLIT_FNS[method](array, **opts)
+    with profile_section(f"decomp.{method}"):
+        left, s, right = _SPLIT_FNS[method](array, **opts)
 
     if nleft != 1:
         # unfuse dangling left indices
@@ -1675,6 +1786,15 @@ class Tensor:
             tensor network, this simply returns ``self``.
         """
         if not (deep or virtual):
+            if self.__class__ is Tensor:
+                # fast path: skip re-parsing the already valid attributes
+                new = object.__new__(Tensor)
+                new._data = self._data
+                new._inds = self._inds
+                new._tags = self._tags.copy()
+                new._left_inds = self._left_inds
+                new._owners = {}
+                return new
             return self.__class__(self, None)
 
         if deep and virtual:
@@ -4187,6 +4307,89 @@ class TensorNetwork(object):
         tn._update_properties(cls, like=like, current=None, **kwargs)
         return tn
 
+    @classmethod
+    def from_arrays(cls, arrays, inds, tags=None, like=None, **kwargs):
+        """Construct a tensor network directly from flat sequences of arrays,
+        indices and tags, building the tensor, tag and index maps in a single
+        pass. This avoids the per-tensor overhead of :meth:`add_tensor`, such
+        as collision checks and owner and map updates, and is thus much faster
+        for building large networks. The indices are assumed to be already
+        consistent, i.e. no mangling of clashing indices is performed.
+
+        Parameters
+        ----------
+        arrays : sequence of array_like
+            The data of each tensor.
+        inds : sequence of sequence of str
+            The indices of each tensor.
+        tags : sequence of str or sequence of str, optional
+            The tag(s) of each tensor, ``None`` or a single tag per tensor is
+            also allowed.
+        like : TensorNetwork, optional
+            If specified, try and retrieve the neccesary attribute values from
+            this tensor network, for when ``cls`` is a subclass.
+        kwargs
+            Extra properties of the TN subclass that should be specified.
+
+        Returns
+        -------
+        TensorNetwork
+        """
+        tn = cls.new(like=like, **kwargs)
+        if tags is None:
+            tags = itertools.repeat(None)
+
+        tensor_map = tn.tensor_map
+        tag_map = tn.tag_map
+        ind_map = tn.ind_map
+        inner = tn._inner_inds._d
+        owner = (weakref.ref(tn),)
+        owner_key = hash(tn)
+
+        # the maps are made of many small containers, tracking which can
+        # trigger many unneccesary garbage collection passes
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for tid, (data, t_inds, t_tags) in enumerate(
+                zip(arrays, inds, tags)
+            ):
+                t = object.__new__(Tensor)
+                t._data = asarray(data)
+                t._inds = t_inds = tuple(t_inds)
+                t._tags = t_tags = tags_to_oset(t_tags)
+                t._left_inds = None
+                t._owners = {owner_key: owner + (tid,)}
+                if do("ndim", t._data) != len(t_inds):
+                    raise ValueError(
+                        f"Wrong number of inds, {t_inds}, supplied for array"
+                        f" of shape {t.shape}."
+                    )
+                tensor_map[tid] = t
+
+                for tag in t_tags._d:
+                    tids = tag_map.get(tag)
+                    if tids is None:
+                        tag_map[tag] = oset._from_dict({tid: None})
+                    else:
+                        tids._d[tid] = None
+
+                for ind in t_inds:
+                    tids = ind_map.get(ind)
+                    if tids is None:
+                        ind_map[ind] = oset._from_dict({tid: None})
+                    else:
+                        tids._d[tid] = None
+                        # order inner indices by their second appearance
+                        inner[ind] = None
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        tn._outer_inds = oset(ix for ix in ind_map if ix not in inner)
+        tn._tid_counter = len(tensor_map)
+        return tn
+
     @classmethod
     def from_TN(cls, tn, like=None, inplace=False, **kwargs):
         """Construct a specific tensor network subclass (i.e. one with some
@@ -4253,11 +4456,13 @@ class TensorNetwork(object):
 
     def _link_tags(self, tags, tid):
         """Link ``tid`` to each of ``tags``."""
+        tag_map = self.tag_map
         for tag in tags:
-            if tag in self.tag_map:
-                self.tag_map[tag].add(tid)
+            tids = tag_map.get(tag)
+            if tids is None:
+                tag_map[tag] = oset._from_dict({tid: None})
             else:
-                self.tag_map[tag] = oset((tid,))
+                tids._d[tid] = None
 
     def _unlink_tags(self, tags, tid):
         """ "Unlink ``tid`` from each of ``tags``."""
@@ -4274,14 +4479,20 @@ class TensorNetwork(object):
 
     def _link_inds(self, inds, tid):
         """Link ``tid`` to each of ``inds``."""
+        # n.b. access the underlying dicts of the osets directly, since this
+        # is called for every tensor added and dominates construction time
+        ind_map = self.ind_map
+        inner = self._inner_inds._d
+        outer = self._outer_inds._d
         for ind in inds:
-            if ind in self.ind_map:
-                self.ind_map[ind].add(tid)
-                self._outer_inds.discard(ind)
-                self._inner_inds.add(ind)
+            tids = ind_map.get(ind)
+            if tids is None:
+                ind_map[ind] = oset._from_dict({tid: None})
+                outer[ind] = None
             else:
-                self.ind_map[ind] = oset((tid,))
-                self._outer_inds.add(ind)
+                tids._d[tid] = None
+                outer.pop(ind, None)
+                inner[ind] = None
 
     def _unlink_inds(self, inds, tid):
         """ "Unlink ``tid`` from each of ``inds``."""
@@ -9167,6 +9378,10 @@ class TensorNetwork(object):
         preserve_tensor=False,
         backend=None,
         inplace=False,
+        compiled=False,
+        checkpoint=None,
+        parallel=None,
+        max_memory=None,
         **kwargs,
     ):
         """Contract some, or all, of the tensors in this network. This method
@@ -9198,6 +9413,10 @@ class TensorNetwork(object):
 
             Contraction with ``cotengra`` might be a bit more efficient but the
             main reason would be to handle sliced contraction automatically.
+            If a contraction path cache is active, see
+            :func:`~quimb.tensor.contraction.set_contract_path_cache`, the
+            path for named strategies is reused between any networks with the
+            same :meth:`geometry_hash`, including across processes.
         get : str, optional
             What to return. If:
 
@@ -9228,6 +9447,27 @@ class TensorNetwork(object):
             Whether to perform the contraction inplace. If ``True`` and all
             tensors are being contracted, this forces the return type to
             be preserved as a ``TensorNetwork``.
+        compiled : bool, optional
+            If ``True``, and all tensors are being contracted, reuse a
+            :class:`CompiledContraction` cached by the structure of this
+            network (see :meth:`get_compiled_contraction`), such that repeated
+            contractions of networks differing only by their arrays avoid
+            re-parsing and re-planning the contraction. Ignored if a
+            'structured' contraction is used.
+        checkpoint : str, optional
+            If given, contract all tensors slice by slice, periodically saving
+            progress to this directory so that the contraction can be resumed
+            if interrupted, see :meth:`contract_sliced`.
+        parallel : int or bool, optional
+            If given, contract all tensors by automatically slicing the
+            contraction and summing the slices using a pool of this many
+            workers (``True`` for the default number), see
+            :meth:`contract_sliced`. The type of pool can be specified with
+            ``pool='process'`` or ``pool='thread'``.
+        max_memory : int, optional
+            If given, contract all tensors by slicing the contraction such that
+            no intermediate tensor is larger than this many bytes, see
+            :meth:`contract_sliced`.
         kwargs
             Passed to :func:`~quimb.tensor.tensor_core.tensor_contract`,
             :meth:`~quimb.tensor.tensor_core.TensorNetwork.contract_compressed`
@@ -9252,6 +9492,24 @@ class TensorNetwork(object):
 
         all_tags = (tags is all) or (tags is ...)
 
+        if (
+            (checkpoint is not None)
+            or (parallel is not None)
+            or (max_memory is not None)
+        ):
+            if not all_tags:
+                raise NotImplementedError
+            if kwargs.pop("get", None) is not None:
+                raise NotImplementedError
+
+            return self.contract_sliced(
+                checkpoint=checkpoint,
+                parallel=parallel,
+                max_memory=max_memory,
+                strip_exponent=strip_exponent,
+                **kwargs,
+            )
+
         if max_bond is not None:
             if not all_tags:
                 raise NotImplementedError
@@ -9280,6 +9538,20 @@ class TensorNetwork(object):
 
         # contracting everything to single output
         if all_tags and not inplace:
+            if compiled:
+                if kwargs.pop("get", None) is not None:
+                    raise ValueError("Can't use `get` with `compiled=True`.")
+                drop_tags = kwargs.pop("drop_tags", False)
+                tags_out = (
+                    None if drop_tags else oset_union(t.tags for t in self)
+                )
+                return self.get_compiled_contraction(
+                    strip_exponent=strip_exponent, **kwargs
+                )(*self.arrays, tags=tags_out, exponent=self.exponent)
+
+            kwargs["optimize"] = self._maybe_use_path_cache(
+                optimize, output_inds
+            )
             return tensor_contract(
                 *self.tensor_map.values(),
                 strip_exponent=strip_exponent,
@@ -9294,6 +9566,110 @@ class TensorNetwork(object):
 
     contract_ = functools.partialmethod(contract, inplace=True)
 
+    def contract_sliced(
+        self,
+        output_inds=None,
+        optimize=None,
+        max_memory=None,
+        checkpoint=None,
+        checkpoint_interval=10.0,
+        executor=None,
+        parallel=None,
+        pool="process",
+        batch_size=None,
+        backend=None,
+        preserve_tensor=False,
+        strip_exponent=False,
+        progbar=False,
+    ):
+        """Contract this entire tensor network by explicitly slicing the
+        contraction tree, such that each slice fits within a memory budget,
+        and summing the slices in batches, optionally in parallel on a process
+        or thread pool and with checkpointing to disk so that a long
+        contraction can be resumed after interruption. See
+        :func:`~quimb.tensor.contraction.array_contract_sliced`.
+
+        Parameters
+        ----------
+        output_inds : sequence of str, optional
+            The output indices, by default those which appear once. These are
+            never sliced.
+        optimize : str, PathOptimizer, ContractionTree or path_like, optional
+            The contraction path optimization strategy to use.
+        max_memory : int, optional
+            The maximum size, in bytes, of any intermediate tensor in the
+            contraction of a single slice.
+        checkpoint : str, optional
+            A directory to store the path, slicing and partial sum of finished
+            slices in. If it contains a checkpoint for a contraction with the
+            same geometry, this is resumed. The arrays are assumed unchanged.
+        checkpoint_interval : float, optional
+            The minimum number of seconds between writing checkpoints.
+        executor : Executor, optional
+            A ``concurrent.futures`` style executor to contract batches of
+            slices with.
+        parallel : int or bool, optional
+            If given, and ``executor`` isn't, the number of workers (``True``
+            for the default number) in a new pool to contract batches of
+            slices with. Extra indices are sliced if needed to give every
+            worker enough work.
+        pool : {'process', 'thread'}, optional
+            The type of pool to use if ``parallel`` is given.
+        batch_size : int, optional
+            How many slices to contract and sum per task.
+        backend : str, optional
+            Which backend to use to perform the contraction.
+        preserve_tensor : bool, optional
+            Whether to return a tensor regardless of whether the output object
+            is a scalar (has no indices) or not.
+        strip_exponent : bool, optional
+            Whether to normalize the result and return its exponent, log10,
+            combined with that of the tensor network, separately.
+        progbar : bool, optional
+            Whether to show a progress bar over slices.
+
+        Returns
+        -------
+        Tensor or scalar
+        """
+        inputs, arrays = zip(*((t.inds, t.data) for t in self))
+        if output_inds is None:
+            output_inds = tuple(_gen_output_inds(concat(inputs)))
+
+        data_out = array_contract_sliced(
+            arrays,
+            inputs,
+            output_inds,
+            optimize=self._maybe_use_path_cache(optimize, output_inds),
+            max_memory=max_memory,
+            checkpoint=checkpoint,
+            checkpoint_interval=checkpoint_interval,
+            executor=executor,
+            parallel=parallel,
+            pool=pool,
+            batch_size=batch_size,
+            backend=backend,
+            progbar=progbar,
+        )
+
+        if output_inds or preserve_tensor:
+            result = Tensor(data_out, inds=output_inds, tags=self.tags)
+        else:
+            result = maybe_realify_scalar(data_out)
+
+        if strip_exponent:
+            # explicitly remove exponent now, as ``contract_tags`` does
+            if isinstance(result, Tensor):
+                tnorm = result.norm()
+            else:
+                # already scalar
+                tnorm = do("abs", result)
+            result = result / tnorm
+            return result, self.exponent + do("log10", tnorm)
+        if self.exponent:
+            result = result * 10**self.exponent
+        return result
+
     def contract_cumulative(
         self,
         tags_seq,
@@ -9376,6 +9752,118 @@ class TensorNetwork(object):
             output_inds=output_inds,
         )
 
+    def get_compiled_contraction(
+        self,
+        output_inds=None,
+        optimize=None,
+        backend=None,
+        preserve_tensor=False,
+        strip_exponent=False,
+        cache=True,
+        **contract_opts,
+    ):
+        """Get a :class:`CompiledContraction` for contracting this entire
+        tensor network, which can then be called repeatedly with just new
+        arrays, for example ``compiled(*tn.arrays)``. By default these are
+        cached by the structure (indices and shapes of every tensor) of the
+        network, so calling this on a network rebuilt with the same structure
+        returns the same object.
+
+        Parameters
+        ----------
+        output_inds : sequence of str, optional
+            The output indices of the contraction.
+        optimize : str, PathOptimizer, ContractionTree or path_like, optional
+            The contraction path optimization strategy to use.
+        backend : str, optional
+            Which backend to use to perform the contraction.
+        preserve_tensor : bool, optional
+            Whether to return a tensor regardless of whether the output object
+            is a scalar (has no indices) or not.
+        strip_exponent : bool, optional
+            Whether to return the exponent of the result, log10, separately.
+        cache : bool, optional
+            Whether to cache the compiled contraction. Only possible when
+            ``optimize`` is hashable, such as a named strategy or a path.
+        contract_opts
+            Supplied to :func:`cotengra.array_contract_expression`.
+
+        Returns
+        -------
+        CompiledContraction
+        """
+        inputs, shapes = zip(*((t.inds, t.shape) for t in self))
+
+        if output_inds is not None:
+            output_inds = tuple(output_inds)
+        if optimize is None:
+            optimize = get_contract_strategy()
+
+        if cache:
+            try:
+                key = (
+                    inputs,
+                    output_inds,
+                    shapes,
+                    optimize,
+                    backend,
+                    preserve_tensor,
+                    strip_exponent,
+                    tuple(sorted(contract_opts.items())),
+                )
+                return _COMPILED_CONTRACTIONS[key]
+            except KeyError:
+                pass
+            except TypeError:
+                # unhashable optimize or options
+                cache = False
+
+        compiled = CompiledContraction(
+            inputs,
+            output=output_inds,
+            shapes=shapes,
+            optimize=self._maybe_use_path_cache(optimize, output_inds),
+            backend=backend,
+            preserve_tensor=preserve_tensor,
+            strip_exponent=strip_exponent,
+            **contract_opts,
+        )
+        if cache:
+            _COMPILED_CONTRACTIONS[key] = compiled
+        return compiled
+
+    def _maybe_use_path_cache(self, optimize=None, output_inds=None):
+        """If a global contraction path cache is active (see
+        :func:`~quimb.tensor.contraction.set_contract_path_cache`) and
+        ``optimize`` is a named strategy, look up the path for this network's
+        geometry, or find and store it, returning it in place of ``optimize``.
+        """
+        cache = get_contract_path_cache()
+        if (cache is None) or (self.num_tensors < 2):
+            return optimize
+
+        if optimize is None:
+            optimize = get_contract_strategy()
+
+        key = cache.get_key(self.geometry_hash(output_inds), optimize)
+        if key is None:
+            # not a cacheable strategy
+            return optimize
+
+        path = cache.get(key)
+        if path is not None:
+            return path
+
+        inputs, shapes = zip(*((t.inds, t.shape) for t in self))
+        tree = array_contract_tree(
+            inputs, output=output_inds, shapes=shapes, optimize=optimize
+        )
+        if not tree.sliced_inds:
+            # sliced indices are specific to index names, so only cache paths
+            cache.put(key, tree.get_path())
+
+        return tree
+
     def contraction_path(
         self,
         optimize=None,
@@ -9411,6 +9899,7 @@ class TensorNetwork(object):
         -------
         list[tuple[int, int]]
         """
+        optimize = self._maybe_use_path_cache(optimize, output_inds)
         inputs, shapes = zip(*((t.inds, t.shape) for t in self))
         return array_contract_path(
             inputs,
@@ -9455,6 +9944,7 @@ class TensorNetwork(object):
         -------
         opt_einsum.PathInfo
         """
+        optimize = self._maybe_use_path_cache(optimize, output_inds)
         inputs, shapes = zip(*((t.inds, t.shape) for t in self))
         return array_contract_pathinfo(
             inputs,
@@ -9498,6 +9988,7 @@ class TensorNetwork(object):
         -------
         cotengra.ContractionTree
         """
+        optimize = self._maybe_use_path_cache(optimize, output_inds)
         inputs, shapes = zip(*((t.inds, t.shape) for t in self))
         return array_contract_tree(
             inputs,
@@ -1,18 +1,26 @@
 """DMRG-like variational algorithms, but in tensor network language."""
 
 import itertools
+import os
+import tempfile
 import warnings
 
 import numpy as np
+import scipy.sparse.linalg as spla
 
 from ..core import prod
 from ..linalg.base_linalg import IdentityLinearOperator, eigh
 from ..utils import progbar
+from ..utils_profile import profiled
+from .array_ops import isblocksparse
+from .decomp import map_cutoff_mode, svd_truncated
 from .tensor_core import (
     Tensor,
     TNLinearOperator,
     asarray,
+    rand_uuid,
     tensor_contract,
+    tensor_direct_product,
 )
 
 
@@ -27,25 +35,51 @@ def get_default_opts(cyclic=False):
         Method used to compress sites after update.
     bond_compress_cutoff_mode : {'sum2', 'abs', 'rel'}
         How to perform compression truncation.
+    bond_expand_method : {'rand', 'subspace'}
+        How DMRG1 grows the bond dimension. ``'rand'`` pads each bond with
+        random noise before each sweep, ``'subspace'`` enriches each bond
+        with the hamiltonian applied to the local state after each local
+        update then truncates it, the 'DMRG3S' algorithm, which converges
+        like DMRG2 at the cost of DMRG1.
     bond_expand_rand_strength : float
         In DMRG1, strength of randomness to expand bonds with. Needed to avoid
         singular matrices after expansion.
+    bond_expand_subspace_alpha : float
+        In DMRG1 with subspace expansion, the mixing factor of the enrichment
+        term. Larger values grow bonds more aggressively.
     local_eig_tol : float
         Relative tolerance to solve inner eigenproblem to, larger = quicker but
         more unstable, default: 1e-3. Note this can be much looser than the
         overall tolerance, the starting point for each local solve is the
         previous state, and the overall accuracy comes from multiple sweeps.
+    local_eig_tol_adapt : None or float
+        If a float, ``f``, tighten ``local_eig_tol`` each sweep to
+        ``sqrt(f * dE) / |E|``, where ``dE`` is the change in energy of the
+        previous sweep and ``|E|`` its energy magnitude (at least 1), since
+        eigenvalue errors scale as the residual norm squared. This is never
+        tighter than ``sqrt(f * tol) / |E|``, with ``tol`` the overall
+        tolerance of the solve, and a solve is only deemed converged after a
+        sweep at this tightest tolerance, such that early sweeps are cheap and
+        later sweeps accurate.
     local_eig_ncv : int
         Number of inner eigenproblem lanczos vectors. Smaller can mean quicker.
-    local_eig_backend : {None, 'AUTO', 'SCIPY', 'SLEPC'}
+        For the ``'davidson'`` backend, the maximum subspace size.
+    local_eig_backend : {None, 'AUTO', 'SCIPY', 'SLEPC', 'DAVIDSON'}
         Which to backend to use for the inner eigenproblem. None or 'AUTO' to
         choose best. Generally ``'SLEPC'`` best if available for large
         problems, but it can't currently handle ``LinearOperator`` Neff as well
-        as ``'lobpcg'``.
+        as ``'lobpcg'``. ``'DAVIDSON'`` uses the lightweight in-house
+        :func:`~quimb.linalg.davidson_linalg.eigs_davidson`, preconditioned
+        with the diagonal of the effective hamiltonian, which has very little
+        overhead for the many small, warm started local problems.
     local_eig_maxiter : int
         Maximum number of inner eigenproblem iterations.
     local_eig_ham_dense : bool
         Force dense representation of the effective hamiltonian.
+    local_eig_ham_threads : int
+        For open boundary conditions, how many threads to split the sum over
+        the hamiltonian bond of each effective hamiltonian matvec between.
+        Useful when the BLAS library is itself single threaded.
     local_eig_EPSType : {'krylovschur', 'gd', 'jd', ...}
         Eigensovler tpye if ``local_eig_backend='slepc'``.
     local_eig_norm_dense : bool
@@ -78,18 +112,30 @@ def get_default_opts(cyclic=False):
         distance to 1 (pseudo-orthogonoalized), then the generalized eigen
         decomposition is *not* used, which is much more efficient. If set too
         large the total normalization can become unstable.
+    env_spill_dir : None, True or str
+        If not None, spill the left and right environments not adjacent to
+        the active block to memory-mapped files in a temporary directory,
+        inside this path, or the default temporary location if ``True``. See
+        ``MovingEnvironment``.
+    env_spill_prefetch : bool
+        When spilling environments, asynchronously prefetch the next one in
+        the direction of the sweep.
     """
     return {
         "default_sweep_sequence": "R",
         "bond_compress_method": "svd",
         "bond_compress_cutoff_mode": "rel" if cyclic else "sum2",
+        "bond_expand_method": "rand",
         "bond_expand_rand_strength": 1e-6,
+        "bond_expand_subspace_alpha": 1e-2,
         "local_eig_tol": 1e-3,
+        "local_eig_tol_adapt": None,
         "local_eig_ncv": 4,
         "local_eig_backend": None,
         "local_eig_maxiter": None,
         "local_eig_EPSType": None,
         "local_eig_ham_dense": None,
+        "local_eig_ham_threads": 1,
         "local_eig_norm_dense": None,
         "periodic_segment_size": 1 / 2,
         "periodic_compress_method": "isvd",
@@ -99,6 +145,8 @@ def get_default_opts(cyclic=False):
         "periodic_nullspace_fudge_factor": 1e-12,
         "periodic_canonize_inv_tol": 1e-10,
         "periodic_orthog_tol": 1e-6,
+        "env_spill_dir": None,
+        "env_spill_prefetch": True,
     }
 
 
@@ -209,6 +257,18 @@ class MovingEnvironment:
     norm : bool, optional
         If True, treat this ``MovingEnvironment`` as the state overlap, which
         enables a few extra checks.
+    spill_dir : None, True or str, optional
+        If given, spill the contracted left and right environment tensors of
+        all but the current and previous positions to memory-mapped files in
+        a temporary directory, created inside ``spill_dir`` if it is a path,
+        or in the default temporary location if ``True``. They are loaded back
+        into memory as the environment moves onto them, such that memory
+        usage scales with a few environments rather than the length of the
+        chain. Only numpy arrays are spilled.
+    prefetch : bool, optional
+        If spilling, asynchronously load the spilled environment of the next
+        position in the direction of travel, so that it is ready by the time
+        it is needed.
 
     Notes
     -----
@@ -231,12 +291,28 @@ class MovingEnvironment:
         method="isvd",
         max_bond=-1,
         norm=False,
+        spill_dir=None,
+        prefetch=True,
     ):
         self.tn = tn.copy(virtual=True)
         self.begin = begin
         self.bsz = bsz
         self.cyclic = cyclic
 
+        if spill_dir is None or spill_dir is False:
+            self._spill_tmpdir = None
+        else:
+            # removed automatically once this environment is garbage collected
+            self._spill_tmpdir = tempfile.TemporaryDirectory(
+                prefix="quimb-env-",
+                dir=None if spill_dir is True else spill_dir,
+            )
+        self.prefetch = prefetch
+        self._spilled = {}
+        self._prefetched = {}
+        self._spill_counter = itertools.count()
+        self._prefetch_pool = None
+
         if callable(segment_callbacks):
             self.segment_callbacks = (segment_callbacks,)
         else:
@@ -287,6 +363,7 @@ class MovingEnvironment:
 
         self.segment = range(start, stop)
         self.init_non_segment(start, stop + self.bsz // 2)
+        self._clear_spilled()
 
         if begin == "left":
             tags_initital = ["_RIGHT"] + [
@@ -300,6 +377,10 @@ class MovingEnvironment:
                 self.envs[i] |= self.tnc.select(i)
                 self.envs[i] ^= ("_RIGHT", self.site_tag(i + self.bsz))
 
+                if i + 1 > start + 1:
+                    # won't be needed until we have swept back to it
+                    self._spill(i + 1)
+
             self.envs[start] |= self.tnc["_LEFT"]
             self.pos = start
 
@@ -315,6 +396,10 @@ class MovingEnvironment:
                 self.envs[i] |= self.tnc.select(i + self.bsz - 1)
                 self.envs[i] ^= ("_LEFT", self.site_tag(i - 1))
 
+                if i - 1 < stop - 2:
+                    # won't be needed until we have swept back to it
+                    self._spill(i - 1)
+
             self.envs[i] |= self.tnc["_RIGHT"]
             self.pos = stop - 1
 
@@ -402,6 +487,11 @@ class MovingEnvironment:
             )
             self.envs[i] |= new_left ^ all
 
+        if self._spill_tmpdir is not None:
+            self._spill(i - 2)
+            self._restore(i)
+            self._prefetch(i + 1)
+
     def move_left(self):
         if (not self.cyclic) and (self.pos - 1 not in self.segment):
             raise ValueError("For OBC, ``0 <= position <= n - bsz``.")
@@ -424,6 +514,11 @@ class MovingEnvironment:
             )
             self.envs[i] |= new_right ^ all
 
+        if self._spill_tmpdir is not None:
+            self._spill(i + 2)
+            self._restore(i)
+            self._prefetch(i - 1)
+
     def move_to(self, i):
         """Move this effective environment to site ``i``."""
 
@@ -442,6 +537,97 @@ class MovingEnvironment:
         """Get the current environment."""
         return self.envs[self.pos]
 
+    def _spill(self, i):
+        """Write the contracted boundary tensors of the environment at
+        position ``i`` to disk, replacing their data with memory-maps.
+        """
+        if (self._spill_tmpdir is None) or (i not in self.envs):
+            return
+
+        for t in self.envs[i]:
+            if ("_LEFT" not in t.tags) and ("_RIGHT" not in t.tags):
+                # only the contracted boundaries are spilled
+                continue
+
+            data = t.data
+            if isinstance(data, np.memmap) or not isinstance(data, np.ndarray):
+                # already spilled, or not a numpy array
+                continue
+
+            fname = os.path.join(
+                self._spill_tmpdir.name,
+                f"env-{i}-{next(self._spill_counter)}.npy",
+            )
+            np.save(fname, data)
+            t.modify(data=np.load(fname, mmap_mode="r"))
+            self._spilled.setdefault(i, []).append((t, fname))
+
+    def _prefetch(self, i):
+        """Asynchronously load the spilled tensors of the environment at
+        position ``i`` back into memory.
+        """
+        if (not self.prefetch) or (i not in self._spilled):
+            return
+
+        if self._prefetch_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._prefetch_pool = ThreadPoolExecutor(1)
+
+        self._prefetched[i] = [
+            self._prefetch_pool.submit(np.load, fname)
+            for _, fname in self._spilled[i]
+        ]
+
+    def _restore(self, i):
+        """Load the spilled tensors of the environment at position ``i`` back
+        into memory, using the prefetched arrays if available.
+        """
+        futures = self._prefetched.pop(i, None)
+        for j, (t, fname) in enumerate(self._spilled.pop(i, ())):
+            if futures is not None:
+                data = futures[j].result()
+            else:
+                data = np.load(fname)
+            t.modify(data=data)
+            _remove_file(fname)
+
+    def _clear_spilled(self):
+        """Remove all files spilled by the current segment."""
+        for futures in self._prefetched.values():
+            for future in futures:
+                # make sure nothing is still reading the file
+                if not future.cancel():
+                    future.exception()
+        self._prefetched.clear()
+
+        for spilled in self._spilled.values():
+            for _, fname in spilled:
+                _remove_file(fname)
+        self._spilled.clear()
+
+    def close(self):
+        """Release the spilled files and prefetching thread, if any. The
+        environment should not be used afterwards.
+        """
+        self._clear_spilled()
+        self.envs = {}
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=True)
+            self._prefetch_pool = None
+        if self._spill_tmpdir is not None:
+            self._spill_tmpdir.cleanup()
+            self._spill_tmpdir = None
+
+
+def _remove_file(fname):
+    try:
+        os.remove(fname)
+    except OSError:
+        # e.g. still memory-mapped on windows, in which case it is removed
+        # along with the temporary directory instead
+        pass
+
 
 def get_cyclic_canonizer(k, b, inv_tol=1e-10):
     """Get a function to use as a callback for ``MovingEnvironment`` that
@@ -494,6 +680,421 @@ def parse_2site_inds_dims(k, b, i):
     return dims, lix_L, lix_R, lix, uix_L, uix_R, uix, l_bond_ind, u_bond_ind
 
 
+class BlockSparseEffectiveOperator(spla.LinearOperator):
+    r"""Linear operator form of an effective operator acting on a symmetric
+    block-sparse local tensor, such as the site tensors of an abelian MPS. The
+    vector space is the concatenation of all the symmetry allowed blocks of
+    ``x0``, so that dense linear algebra only ever acts on the (much smaller)
+    charge conserving sector::
+
+              /|\
+             / | \        <-- right_inds, contracted with x
+            L--H--R
+             \ | /
+              \|/         <-- left_inds, output
+
+    Parameters
+    ----------
+    tn : TensorNetwork
+        The environment and operator tensors, with open ``left_inds`` and
+        ``right_inds``.
+    x0 : block-sparse array
+        An example local tensor, with indices ``right_inds``, which defines
+        the charge sectors and block shapes of the vector space.
+    left_inds : sequence of str
+        The output indices, matching ``right_inds`` position-wise.
+    right_inds : sequence of str
+        The indices that the local tensor is contracted with.
+    optimize : str, optional
+        The path optimizer to use for each 'matrix-vector' contraction.
+    """
+
+    def __init__(self, tn, x0, left_inds, right_inds, optimize="auto-hq"):
+        self.tensors = tuple(tn)
+        self.left_inds = tuple(left_inds)
+        self.right_inds = tuple(right_inds)
+        self.optimize = optimize
+
+        # x0 might be missing charges that are present in the operator, so
+        # take the full indices from the tensors that x is contracted with
+        indices = []
+        for ix in self.right_inds:
+            (t,) = (t for t in self.tensors if ix in t.inds)
+            indices.append(t.data.indices[t.inds.index(ix)].conj())
+
+        # get all symmetry allowed sectors, including any missing from x0
+        self._x0 = x0.copy_with(indices=tuple(indices), blocks={})
+        self._x0.fill_missing_blocks()
+        self._layout = []
+        n = 0
+        for sector in sorted(self._x0.sectors):
+            shape = self._x0.get_block_shape(sector)
+            size = prod(shape)
+            self._layout.append((sector, shape, n, n + size))
+            n += size
+
+        super().__init__(dtype=x0.dtype, shape=(n, n))
+
+    def to_vector(self, x):
+        """Concatenate the allowed blocks of block-sparse array ``x``."""
+        v = np.zeros(self.shape[0], dtype=np.result_type(x.dtype, self.dtype))
+        for sector, _, i0, i1 in self._layout:
+            if x.has_sector(sector):
+                v[i0:i1] = np.ravel(x.get_block(sector))
+        return v
+
+    def from_vector(self, v):
+        """Create a block-sparse array from the concatenated blocks ``v``."""
+        v = np.asarray(v).ravel()
+        blocks = {
+            sector: v[i0:i1].reshape(shape)
+            for sector, shape, i0, i1 in self._layout
+        }
+        return self._x0.copy_with(blocks=blocks)
+
+    def to_dense(self):
+        """Form the dense matrix of this operator within the allowed
+        sectors, by contracting it to a single block-sparse operator.
+        """
+        op = tensor_contract(
+            *self.tensors,
+            output_inds=self.left_inds + self.right_inds,
+            optimize=self.optimize,
+        ).data
+
+        A = np.zeros(self.shape, dtype=self.dtype)
+        for sector_l, _, i0, i1 in self._layout:
+            for sector_r, _, j0, j1 in self._layout:
+                sector = sector_l + sector_r
+                if op.has_sector(sector):
+                    block = op.get_block(sector)
+                    A[i0:i1, j0:j1] = np.reshape(block, (i1 - i0, j1 - j0))
+        return A
+
+    def _matvec(self, vec):
+        x = Tensor(self.from_vector(vec), inds=self.right_inds)
+        y = tensor_contract(
+            *self.tensors,
+            x,
+            output_inds=self.left_inds,
+            optimize=self.optimize,
+        )
+        return self.to_vector(y.data).reshape(np.shape(vec))
+
+    def _adjoint(self):
+        # effective hamiltonians are hermitian
+        return self
+
+
+def _slice_ind(data, inds, ix, sl):
+    """Slice array ``data``, with indices ``inds``, along index ``ix``."""
+    if ix not in inds:
+        return data
+    selector = [slice(None)] * len(inds)
+    selector[inds.index(ix)] = sl
+    return data[tuple(selector)]
+
+
+def _plan_matmul_step(cur, t, data, sizes, open_inds, dtype):
+    """Plan the contraction of the current local array, with indices
+    ``cur``, with tensor ``t`` (with array ``data``), as a single matrix
+    multiplication into a preallocated buffer, avoiding transposing the
+    local array where possible.
+    """
+    shared = tuple(ix for ix in cur if ix in t.inds)
+    # put open indices first, so that bonds to the next tensor end up
+    # adjacent to the local indices it will also be contracted over
+    kept_t = tuple(
+        sorted(
+            (ix for ix in t.inds if ix not in shared),
+            key=lambda ix: ix not in open_inds,
+        )
+    )
+    A = np.transpose(data, tuple(map(t.inds.index, shared + kept_t)))
+    ds = prod(sizes[ix] for ix in shared)
+    dt = prod(sizes[ix] for ix in kept_t)
+
+    p0 = cur.index(shared[0])
+    pre, post = cur[:p0], cur[p0 + len(shared) :]
+    dp = prod(sizes[ix] for ix in pre)
+    dq = prod(sizes[ix] for ix in post)
+
+    if cur[p0 : p0 + len(shared)] != shared:
+        # need to transpose the local array: (rest, shared) @ (shared, kept)
+        rest = pre + post
+        perm = tuple(map(cur.index, rest + shared))
+        xbuf = np.empty((dp * dq, ds), dtype=dtype)
+        xshape = tuple(sizes[ix] for ix in rest + shared)
+        A = np.ascontiguousarray(A).reshape(ds, dt)
+        step = ("transpose", perm, xshape, xbuf, A)
+        obuf = np.empty((dp * dq, dt), dtype=dtype)
+        return step + (obuf,), rest + kept_t
+
+    if not post:
+        # (pre, shared) @ (shared, kept)
+        A = np.ascontiguousarray(A).reshape(ds, dt)
+        obuf = np.empty((dp, dt), dtype=dtype)
+        return ("right", (dp, ds), A, obuf), pre + kept_t
+
+    # (kept, shared) @ (pre, shared, post), batched over pre if present
+    A = np.ascontiguousarray(np.reshape(A, (ds, dt)).T)
+    if pre:
+        xshape, oshape = (dp, ds, dq), (dp, dt, dq)
+    else:
+        xshape, oshape = (ds, dq), (dt, dq)
+    obuf = np.empty(oshape, dtype=dtype)
+    return ("left", xshape, A, obuf), pre + kept_t + post
+
+
+class DenseEffectiveOperator(spla.LinearOperator):
+    r"""Linear operator form of an open boundary effective hamiltonian,
+    acting on a dense local tensor::
+
+              /|\
+             / | \        <-- right_inds, contracted with x
+            L--H--R
+             \ | /
+              \|/         <-- left_inds, output
+
+    Compared to :class:`~quimb.tensor.tensor_core.TNLinearOperator`, there
+    is no contraction path search. Instead the vector is absorbed in the
+    fixed order ``L``, then each operator tensor in turn, then ``R``, with
+    every pairwise contraction performed as a single (possibly batched)
+    matrix multiplication into a buffer that is allocated once and reused for
+    every matvec. The contraction is performed in two stages, the first
+    summing the bond between the first two tensors, the second the bond
+    between the last two, and each of these sums can be split into
+    ``num_threads`` chunks, contracted in separate threads then added.
+
+    Parameters
+    ----------
+    tn : TensorNetwork or sequence of Tensor
+        The environment and operator tensors, with open ``left_inds`` and
+        ``right_inds``.
+    left_inds : sequence of str
+        The output indices, matching ``right_inds`` position-wise.
+    right_inds : sequence of str
+        The indices that the local tensor is contracted with, in order along
+        the chain.
+    num_threads : int, optional
+        How many chunks to split each operator bond sum into.
+    executor : concurrent.futures.Executor, optional
+        The thread pool to contract the chunks with, required if
+        ``num_threads > 1``.
+    """
+
+    def __init__(
+        self,
+        tn,
+        left_inds,
+        right_inds,
+        num_threads=1,
+        executor=None,
+    ):
+        self.left_inds = tuple(left_inds)
+        self.right_inds = tuple(right_inds)
+        self.executor = executor
+        if (num_threads > 1) and (executor is None):
+            raise ValueError("An `executor` is needed if `num_threads > 1`.")
+
+        ts = tuple(tn)
+        sizes = {}
+        for t in ts:
+            sizes.update(zip(t.inds, t.shape))
+        self.ldims = tuple(sizes[ix] for ix in self.left_inds)
+        self.rdims = tuple(sizes[ix] for ix in self.right_inds)
+        dtype = np.result_type(*(t.dtype for t in ts))
+        open_inds = {*self.left_inds, *self.right_inds}
+
+        def bond(ta, tb):
+            return next(
+                (
+                    ix
+                    for ix in ta.inds
+                    if ix in tb.inds and ix not in open_inds
+                ),
+                None,
+            )
+
+        # order tensors along the chain, by walking along the operator bonds
+        # from the end touching the first local index
+        def touches_first(t):
+            return min(
+                self.right_inds.index(ix)
+                for ix in t.inds
+                if ix in self.right_inds
+            )
+
+        ends = [
+            t
+            for t in ts
+            if sum(bond(t, o) is not None for o in ts if o is not t) <= 1
+        ]
+        chain = [min(ends, key=touches_first)]
+        while len(chain) < len(ts):
+            (t,) = (
+                o
+                for o in ts
+                if all(o is not c for c in chain)
+                and bond(chain[-1], o) is not None
+            )
+            chain.append(t)
+        ts = chain
+
+        # transpose the local array into chain order once at the start
+        cur = tuple(ix for t in ts for ix in t.inds if ix in self.right_inds)
+        self._in_perm = tuple(map(self.right_inds.index, cur))
+
+        # group the tensors into stages, that sum over a single bond
+        n = len(ts)
+        if n <= 2:
+            stages = [(range(n), bond(*ts) if n == 2 else None)]
+        else:
+            stages = [((0, 1), bond(ts[0], ts[1]))]
+            if n == 3:
+                stages.append(((2,), bond(ts[1], ts[2])))
+            else:
+                if n > 4:
+                    stages.append((range(2, n - 2), None))
+                stages.append(((n - 2, n - 1), bond(ts[n - 2], ts[n - 1])))
+
+        self._stages = []
+        for positions, split_ix in stages:
+            cur_in = cur
+            ishape_full = tuple(sizes[ix] for ix in cur)
+            if split_ix is None:
+                bounds = (0, 1)
+            else:
+                nchunks = max(1, min(num_threads, sizes[split_ix]))
+                bounds = np.linspace(0, sizes[split_ix], nchunks + 1)
+                bounds = tuple(map(int, bounds))
+
+            chunks = []
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                if split_ix is None:
+                    sl, chunk_sizes = slice(None), sizes
+                else:
+                    sl = slice(start, stop)
+                    chunk_sizes = {**sizes, split_ix: stop - start}
+
+                if split_ix in cur:
+                    # input is sliced -> need a contiguous copy
+                    ishape = tuple(chunk_sizes[ix] for ix in cur)
+                    ibuf = np.empty(ishape, dtype=dtype)
+                else:
+                    ibuf = None
+
+                steps = []
+                chunk_cur = cur
+                for p in positions:
+                    t = ts[p]
+                    data = _slice_ind(t.data, t.inds, split_ix, sl)
+                    step, chunk_cur = _plan_matmul_step(
+                        chunk_cur, t, data, chunk_sizes, open_inds, dtype
+                    )
+                    steps.append(step)
+
+                chunks.append((sl, ibuf, steps))
+
+            oshape = tuple(sizes[ix] for ix in chunk_cur)
+            cur = chunk_cur
+            if len(chunks) > 1:
+                rbuf = np.empty(oshape, dtype=dtype)
+            else:
+                rbuf = None
+            self._stages.append((split_ix, ishape_full, cur_in, chunks, rbuf))
+
+        self._tensors = ts
+        self._oshape = oshape
+        self._out_perm = tuple(map(cur.index, self.left_inds))
+
+        d = prod(self.ldims)
+        super().__init__(dtype=dtype, shape=(d, d))
+
+    @staticmethod
+    def _contract_chunk(x, ibuf, steps):
+        if ibuf is not None:
+            np.copyto(ibuf, x)
+            x = ibuf
+        for step in steps:
+            kind = step[0]
+            if kind == "transpose":
+                _, perm, xshape, xbuf, A, obuf = step
+                np.copyto(xbuf.reshape(xshape), np.transpose(x, perm))
+                np.matmul(xbuf, A, out=obuf)
+            elif kind == "right":
+                _, xshape, A, obuf = step
+                np.matmul(x.reshape(xshape), A, out=obuf)
+            else:
+                _, xshape, A, obuf = step
+                np.matmul(A, x.reshape(xshape), out=obuf)
+            x = obuf
+        return x
+
+    def _matvec(self, vec):
+        vec = np.asarray(vec)
+        if np.iscomplexobj(vec) and not np.issubdtype(
+            self.dtype, np.complexfloating
+        ):
+            # buffers are real, act on real and imaginary parts separately
+            return self._matvec(vec.real) + 1j * self._matvec(vec.imag)
+
+        x = vec.astype(self.dtype, copy=False).reshape(self.rdims)
+        x = np.ascontiguousarray(np.transpose(x, self._in_perm))
+        for split_ix, ishape, inds, chunks, rbuf in self._stages:
+            x = x.reshape(ishape)
+
+            if rbuf is None:
+                ((_, ibuf, steps),) = chunks
+                x = self._contract_chunk(x, ibuf, steps)
+                continue
+
+            futures = [
+                self.executor.submit(
+                    self._contract_chunk,
+                    _slice_ind(x, inds, split_ix, sl),
+                    ibuf,
+                    steps,
+                )
+                for sl, ibuf, steps in chunks
+            ]
+            np.copyto(rbuf, futures[0].result().reshape(rbuf.shape))
+            for f in futures[1:]:
+                rbuf += f.result().reshape(rbuf.shape)
+            x = rbuf
+
+        y = np.transpose(x.reshape(self._oshape), self._out_perm)
+        return np.array(y, dtype=self.dtype).reshape(np.shape(vec))
+
+    def diagonal(self):
+        """Get the diagonal of this operator, by contracting the diagonals
+        of each of the environment and operator tensors, e.g. for use as a
+        Davidson preconditioner.
+        """
+        diags = []
+        for t in self._tensors:
+            data, inds = t.data, t.inds
+            for lix, rix in zip(self.left_inds, self.right_inds):
+                if (lix in inds) and (rix in inds):
+                    # the diagonal is moved to the last axis
+                    data = np.diagonal(
+                        data, axis1=inds.index(lix), axis2=inds.index(rix)
+                    )
+                    inds = (*(ix for ix in inds if ix not in (lix, rix)), rix)
+            diags.append(Tensor(data, inds))
+
+        return tensor_contract(
+            *diags,
+            output_inds=self.right_inds,
+            optimize="greedy",
+            preserve_tensor=True,
+        ).data.reshape(-1)
+
+    def _adjoint(self):
+        # effective hamiltonians are hermitian
+        return self
+
+
 class DMRGError(Exception):
     pass
 
@@ -507,7 +1108,11 @@ class DMRG:
     Parameters
     ----------
     ham : MatrixProductOperator
-        The hamiltonian in MPO form.
+        The hamiltonian in MPO form. If it has abelian symmetric block-sparse
+        arrays, e.g. from ``MPO_ham_heis(L, symmetry="U1")``, then the local
+        eigenproblems are solved only within the allowed charge sectors, in
+        which case ``p0`` must be supplied, in the target sector, and the
+        bond dimensions of ``DMRG1`` are fixed by those of ``p0``.
     bond_dims : int or sequence of ints.
         The bond-dimension of the MPS to optimize. If ``bsz > 1``, then this
         corresponds to the maximum bond dimension when splitting the effective
@@ -561,6 +1166,20 @@ class DMRG:
         self._set_bond_dim_seq(bond_dims)
         self._set_cutoff_seq(cutoffs)
 
+        self.blocksparse = isblocksparse(ham.arrays[0])
+        if self.blocksparse:
+            if self.cyclic:
+                raise ValueError(
+                    "Block-sparse DMRG is only supported for open boundary "
+                    "conditions."
+                )
+            if p0 is None:
+                raise ValueError(
+                    "An initial state ``p0`` in the target charge sector "
+                    "must be supplied for a block-sparse hamiltonian, e.g. "
+                    "via ``MPS_computational_state(...).to_abelian(...)``."
+                )
+
         # create internal states and ham
         if p0 is not None:
             self._k = p0.copy()
@@ -581,6 +1200,9 @@ class DMRG:
         self.energies = []
         self.local_energies = []
         self.total_energies = []
+        self._matvec_pool = None
+        self._solve_tol = 1e-4
+        self._local_eig_tol_tight = True
 
         # if cyclic need to keep track of normalization
         if self.cyclic:
@@ -612,6 +1234,16 @@ class DMRG:
         copy.drop_tags("_KET")
         return copy
 
+    @property
+    def _subspace_expansion(self):
+        # XXX: block-sparse arrays don't yet support the direct product
+        return (
+            (self.bsz == 1)
+            and (not self.cyclic)
+            and (not self.blocksparse)
+            and (self.opts["bond_expand_method"] == "subspace")
+        )
+
     # -------------------- standard DMRG update methods --------------------- #
 
     def _canonize_after_1site_update(self, direction, i):
@@ -623,6 +1255,85 @@ class DMRG:
         elif (direction == "left") and ((i > 0) or self.cyclic):
             self._k.right_canonize_site(i, bra=self._b)
 
+    def _expand_subspace_after_1site_update(
+        self, direction, i, max_bond=None, cutoff=1e-10, **compress_opts
+    ):
+        r"""Enrich the bond between site ``i`` and the next site in
+        ``direction`` with the hamiltonian applied to the local state, then
+        truncate it and move the orthogonality center along, as in the single
+        site 'DMRG3S' algorithm [1]. E.g. for ``direction='right'``, with the
+        updated site ``A`` and the next site ``B``, form::
+
+                  ╭─A─          ╭─A─┬─αP─╮   ╭─B─╮
+            P  =  L─H─   then   |   |    | & | 0 |
+                  ╰─ ─          ╰───┴────╯   ╰───╯
+
+        i.e. expand the bond ``A-B`` by concatenating ``αP``, with its open
+        hamiltonian bond fused into the ket bond, onto ``A`` and padding
+        ``B`` with zeros, such that the state is unchanged. The new bond,
+        of size ``D (1 + w)`` for MPO bond dimension ``w``, is then
+        compressed back down to at most ``max_bond`` with the non-isometric
+        part absorbed into ``B``.
+
+        [1] Hubig, C., McCulloch, I. P., Schollwöck, U. & Wolf, F. A.
+        Strictly single-site DMRG algorithm with subspace expansion. Phys.
+        Rev. B 91, 155115 (2015).
+        """
+        if direction == "right":
+            j, env_tag = i + 1, "_LEFT"
+            if j == self.L:
+                return
+        else:
+            j, env_tag = i - 1, "_RIGHT"
+            if j == -1:
+                return
+
+        k, b = self._k, self._b
+        ki, kj = k[i], k[j]
+        bix = k.bond(i, j)
+        wix = self.ham.bond(i, j)
+
+        # ket indices of site i other than the bond being expanded, and the
+        # matching bra indices open on P
+        kix = [ix for ix in ki.inds if ix != bix]
+        ix_map = {b.site_ind(i): k.site_ind(i)}
+        if 0 <= 2 * i - j < self.L:
+            ix_map[b.bond(i, 2 * i - j)] = k.bond(i, 2 * i - j)
+
+        # contract the environment on the other side with the hamiltonian
+        # and local state, leaving open the hamiltonian bond
+        P = tensor_contract(
+            *self._eff_ham.select_tensors(env_tag),
+            self.ham[i],
+            ki,
+            output_inds=(*ix_map, bix, wix),
+        )
+        P.reindex_(ix_map)
+        P.fuse_({bix: (bix, wix)})
+        P *= self.opts["bond_expand_subspace_alpha"]
+
+        # expand the bond, and compress it back down
+        T = tensor_direct_product(ki, P, sum_inds=kix)
+        D = ki.ind_size(bix)
+        L, R = T.split(
+            left_inds=kix,
+            absorb="right",
+            get="arrays",
+            max_bond=max_bond,
+            cutoff=cutoff,
+            **compress_opts,
+        )
+        ki.modify(data=Tensor(L, inds=(*kix, bix)).transpose(*ki.inds).data)
+
+        # the zero padding of the next site removes the enrichment part of R
+        nix = rand_uuid()
+        R = Tensor(R[:, :D], inds=(nix, bix))
+        kj.modify(data=(R @ kj).reindex({nix: bix}).transpose(*kj.inds).data)
+
+        b[i].modify(data=ki.data.conj())
+        b[j].modify(data=kj.data.conj())
+
+    @profiled("DMRG.eigensolve")
     def _eigs(self, A, B=None, v0=None):
         """Find single eigenpair, using all the internal settings."""
         # intercept generalized eigen
@@ -639,11 +1350,42 @@ class DMRG:
             backend=backend,
             EPSType=self.opts["local_eig_EPSType"],
             ncv=self.opts["local_eig_ncv"],
-            tol=self.opts["local_eig_tol"],
+            tol=self._get_local_eig_tol(),
             maxiter=self.opts["local_eig_maxiter"],
             fallback_to_scipy=True,
         )
 
+    def _get_local_eig_tol_min(self):
+        """Get the tightest adaptive local eigensolve tolerance, that needed
+        to resolve the energy to the tolerance of the current solve.
+        """
+        factor = self.opts["local_eig_tol_adapt"]
+        scale = max(abs(self.energies[-1]), 1.0) if self.energies else 1.0
+        # eigenvalue errors scale as the residual norm squared, and the
+        # tolerance is relative to the magnitude of the eigenvalue
+        return max((factor * self._solve_tol) ** 0.5 / scale, 1e-14)
+
+    def _get_local_eig_tol(self):
+        """Get the local eigensolve tolerance for the current sweep,
+        possibly tightened according to the last change in energy.
+        """
+        tol = self.opts["local_eig_tol"]
+        factor = self.opts.get("local_eig_tol_adapt", None)
+        if factor is None:
+            return tol
+
+        tol_min = self._get_local_eig_tol_min()
+        if len(self.energies) >= 2:
+            dE = abs(self.energies[-1] - self.energies[-2])
+            scale = max(abs(self.energies[-1]), 1.0)
+            # a small change in energy can just be from a loose solve
+            # returning its starting vector, so never stop short of the
+            # tolerance actually needed to resolve the solve tolerance
+            tol = min(tol, max((factor * dE) ** 0.5 / scale, tol_min))
+        # record whether the current sweep can be trusted to converge
+        self._local_eig_tol_tight = tol <= tol_min
+        return tol
+
     def print_energy_info(self, Heff=None, loc_gs=None):
         sweep_num = len(self.energies) + 1
         full_en = self.TN_energy ^ ...
@@ -678,12 +1420,27 @@ class DMRG:
             f"effvN={effv_n} siteN={site_norm}"
         )
 
-    def form_local_ops(self, i, dims, lix, uix):
-        """Construct the effective Hamiltonian, and if needed, norm."""
+    def form_local_ops(self, i, dims, lix, uix, x0=None):
+        """Construct the effective Hamiltonian, and if needed, norm. For
+        block-sparse states, ``x0`` is the current local tensor, defining the
+        symmetry sectors the effective Hamiltonian acts on.
+        """
         if self.cyclic:
             self._eff_norm = self.ME_eff_norm()
         self._eff_ham = self.ME_eff_ham()
 
+        if self.blocksparse:
+            # also keep the operator for mapping to and from vectors
+            Heff = self._eff_ham_op = BlockSparseEffectiveOperator(
+                self._eff_ham["_HAM"], x0, left_inds=lix, right_inds=uix
+            )
+            dense = self.opts["local_eig_ham_dense"]
+            if dense is None:
+                dense = Heff.shape[0] < 800
+            if dense:
+                Heff = Heff.to_dense()
+            return Heff, None
+
         # choose a rough value at which dense effective ham should not be used
         dense = self.opts["local_eig_ham_dense"]
         if dense is None:
@@ -700,6 +1457,23 @@ class DMRG:
         if dense:
             # contract remaining hamiltonian and get its dense representation
             Heff = (self._eff_ham ^ "_HAM")["_HAM"].to_dense(lix, uix)
+        elif not self.cyclic and all(
+            isinstance(t.data, np.ndarray) for t in self._eff_ham["_HAM"]
+        ):
+            # fixed contraction order, reused buffers and optional threading
+            num_threads = self.opts["local_eig_ham_threads"]
+            if (num_threads > 1) and (self._matvec_pool is None):
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._matvec_pool = ThreadPoolExecutor(num_threads)
+
+            Heff = DenseEffectiveOperator(
+                self._eff_ham["_HAM"],
+                left_inds=lix,
+                right_inds=uix,
+                num_threads=num_threads,
+                executor=self._matvec_pool,
+            )
         else:
             Heff = TNLinearOperator(self._eff_ham["_HAM"], **dims_inds)
 
@@ -772,10 +1546,13 @@ class DMRG:
         dims = self._k[i].shape
 
         # get local operators
-        Heff, Neff = self.form_local_ops(i, dims, lix, uix)
+        Heff, Neff = self.form_local_ops(i, dims, lix, uix, x0=self._k[i].data)
 
         # get the old local groundstate to use as initial guess
-        loc_gs_old = self._k[i].data.ravel()
+        if self.blocksparse:
+            loc_gs_old = self._eff_ham_op.to_vector(self._k[i].data)
+        else:
+            loc_gs_old = self._k[i].data.ravel()
 
         # find the local energy and groundstate
         loc_en, loc_gs = self._eigs(Heff, B=Neff, v0=loc_gs_old)
@@ -784,7 +1561,10 @@ class DMRG:
         loc_en, loc_gs = self.post_check(i, Neff, loc_gs, loc_en, loc_gs_old)
 
         # insert back into state and all tensor networks viewing it
-        loc_gs = loc_gs.toarray().reshape(dims)
+        if self.blocksparse:
+            loc_gs = self._eff_ham_op.from_vector(loc_gs)
+        else:
+            loc_gs = loc_gs.toarray().reshape(dims)
         self._k[i].modify(data=loc_gs)
         self._b[i].modify(data=loc_gs.conj())
 
@@ -796,7 +1576,12 @@ class DMRG:
 
         tot_en = self._eff_ham ^ all
 
-        self._canonize_after_1site_update(direction, i)
+        if self._subspace_expansion:
+            self._expand_subspace_after_1site_update(
+                direction, i, **compress_opts
+            )
+        else:
+            self._canonize_after_1site_update(direction, i)
 
         return loc_en.item(), tot_en
 
@@ -825,11 +1610,17 @@ class DMRG:
             u_bond_ind,
         ) = parse_2site_inds_dims(self._k, self._b, i)
 
-        # get local operators
-        Heff, Neff = self.form_local_ops(i, dims, lix, uix)
+        if self.blocksparse:
+            # keep the 2-site tensor in block-sparse form
+            x0 = self._k[i].contract(self._k[i + 1]).transpose(*uix).data
+            Heff, Neff = self.form_local_ops(i, dims, lix, uix, x0=x0)
+            loc_gs_old = self._eff_ham_op.to_vector(x0)
+        else:
+            # get local operators
+            Heff, Neff = self.form_local_ops(i, dims, lix, uix)
 
-        # get the old 2-site local groundstate to use as initial guess
-        loc_gs_old = self._k[i].contract(self._k[i + 1]).to_dense(uix)
+            # get the old 2-site local groundstate to use as initial guess
+            loc_gs_old = self._k[i].contract(self._k[i + 1]).to_dense(uix)
 
         # find the 2-site local groundstate and energy
         loc_en, loc_gs = self._eigs(Heff, B=Neff, v0=loc_gs_old)
@@ -838,7 +1629,10 @@ class DMRG:
         loc_en, loc_gs = self.post_check(i, Neff, loc_gs, loc_en, loc_gs_old)
 
         # split the two site local groundstate
-        T_AB = Tensor(loc_gs.toarray().reshape(dims), uix)
+        if self.blocksparse:
+            T_AB = Tensor(self._eff_ham_op.from_vector(loc_gs), uix)
+        else:
+            T_AB = Tensor(loc_gs.toarray().reshape(dims), uix)
         L, R = T_AB.split(
             left_inds=uix_L,
             get="arrays",
@@ -882,6 +1676,7 @@ class DMRG:
             2: self._update_local_state_2site,
         }[self.bsz](i, **update_opts)
 
+    @profiled("DMRG.sweep")
     def sweep(self, direction, canonize=True, verbosity=0, **update_opts):
         r"""Perform a sweep of optimizations, either rightwards::
 
@@ -940,6 +1735,8 @@ class DMRG:
             "ssz": self.opts["periodic_segment_size"],
             "method": self.opts["periodic_compress_method"],
             "max_bond": self.opts["periodic_compress_max_bond"],
+            "spill_dir": self.opts["env_spill_dir"],
+            "prefetch": self.opts["env_spill_prefetch"],
         }
 
         if self.cyclic:
@@ -978,6 +1775,15 @@ class DMRG:
             self.bond_sizes_ham.append(self.ME_eff_ham.bond_sizes)
             self.bond_sizes_norm.append(self.ME_eff_norm.bond_sizes)
 
+        if self.opts["env_spill_dir"] is not None:
+            self.ME_eff_ham.close()
+            if self.cyclic:
+                self.ME_eff_norm.close()
+
+        if self._matvec_pool is not None:
+            self._matvec_pool.shutdown(wait=True)
+            self._matvec_pool = None
+
         return tot_ens[-1]
 
     def sweep_right(self, canonize=True, verbosity=0, **update_opts):
@@ -1026,6 +1832,11 @@ class DMRG:
         """By default check the absolute change in energy."""
         if len(self.energies) < 2:
             return False
+        # only trust the change in energy of a sweep that was solved
+        # to the tightest adaptive local tolerance
+        adapt = self.opts.get("local_eig_tol_adapt", None) is not None
+        if adapt and not getattr(self, "_local_eig_tol_tight", True):
+            return False
         return abs(self.energies[-2] - self.energies[-1]) < tol
 
     # -------------------------- main solve driver -------------------------- #
@@ -1079,6 +1890,7 @@ class DMRG:
 
         directions = itertools.cycle(sweep_sequence)
         previous_direction = "0"
+        self._solve_tol = tol
 
         for _ in range(max_sweeps):
             # Get the next direction, bond dimension and cutoff
@@ -1102,8 +1914,13 @@ class DMRG:
                 else True
             )
 
-            # need to manually expand bond dimension for DMRG1
-            if self.bsz == 1:
+            # need to manually expand bond dimension for DMRG1, block-sparse
+            # bonds are instead fixed by the sectors of the initial state
+            if (
+                (self.bsz == 1)
+                and (not self.blocksparse)
+                and (not self._subspace_expansion)
+            ):
                 self._k.expand_bond_dimension(
                     max_bond,
                     bra=self._b,
@@ -1182,6 +1999,509 @@ class DMRG2(DMRG):
         )
 
 
+# --------------------------------------------------------------------------- #
+#                          Real-space parallel DMRG                           #
+# --------------------------------------------------------------------------- #
+
+
+def _pad_end_arrays(arrays):
+    """Give the end arrays of an open MPS or MPO size 1 outer bonds, so that
+    every array has the same 'lr...' structure.
+    """
+    arrays = list(arrays)
+    arrays[0] = arrays[0][None]
+    arrays[-1] = arrays[-1][:, None]
+    return arrays
+
+
+def _unpad_end_arrays(arrays):
+    """Inverse of :func:`_pad_end_arrays`."""
+    return [arrays[0][0], *arrays[1:-1], arrays[-1][:, 0]]
+
+
+def _left_canonize_pair(Tl, Tr):
+    """Left canonize ``Tl``, absorbing the remainder into ``Tr``, both in
+    padded 'lrp' order.
+    """
+    dl, dr, dp = Tl.shape
+    Q, R = np.linalg.qr(Tl.transpose(0, 2, 1).reshape(dl * dp, dr))
+    Tl = Q.reshape(dl, dp, -1).transpose(0, 2, 1)
+    return Tl, np.tensordot(R, Tr, axes=1)
+
+
+def _right_canonize_pair(Tl, Tr):
+    """Right canonize ``Tr``, absorbing the remainder into ``Tl``, both in
+    padded 'lrp' order.
+    """
+    dl, dr, dp = Tr.shape
+    Q, R = np.linalg.qr(Tr.reshape(dl, dr * dp).T)
+    Tr = Q.T.reshape(-1, dr, dp)
+    return np.tensordot(Tl, R, axes=(1, 1)).transpose(0, 2, 1), Tr
+
+
+def _env_extend_left(lenv, A, W):
+    """Extend the left environment ``lenv[bra, ham, ket]`` by one site, with
+    ``A`` in 'lrp' and ``W`` in 'lrud' order.
+    """
+    T = np.tensordot(lenv, A, axes=(2, 0))
+    T = np.tensordot(T, W, axes=((1, 3), (0, 2)))
+    T = np.tensordot(T, A.conj(), axes=((0, 3), (0, 2)))
+    return T.transpose(2, 1, 0)
+
+
+def _env_extend_right(renv, B, W):
+    """Extend the right environment ``renv[bra, ham, ket]`` by one site, with
+    ``B`` in 'lrp' and ``W`` in 'lrud' order.
+    """
+    T = np.tensordot(B, renv, axes=(1, 2))
+    T = np.tensordot(T, W, axes=((1, 3), (2, 1)))
+    T = np.tensordot(T, B.conj(), axes=((1, 3), (1, 2)))
+    return T.transpose(2, 1, 0)
+
+
+def _dmrg_parallel_segment(
+    ham_arrays,
+    psi_arrays,
+    which,
+    max_bond,
+    cutoff,
+    sweep_sequence,
+    opts,
+):
+    """Optimize a single segment of a chain with two site DMRG. The padded
+    'lrud' MPO and 'lrp' MPS arrays can have extra end sites representing the
+    fixed environments of the rest of the chain, whose 'physical' index is
+    the dangling bond of the segment. This is a module level function so that
+    it can be sent to other processes.
+    """
+    from .tensor_1d import MatrixProductOperator, MatrixProductState
+
+    ham = MatrixProductOperator(_unpad_end_arrays(ham_arrays), shape="lrud")
+    p0 = MatrixProductState(_unpad_end_arrays(psi_arrays), shape="lrp")
+
+    dmrg = DMRG2(ham, which=which, bond_dims=max_bond, cutoffs=cutoff, p0=p0)
+    dmrg.opts.update(opts)
+    dmrg.solve(
+        tol=0.0,
+        sweep_sequence=sweep_sequence,
+        max_sweeps=len(sweep_sequence),
+    )
+
+    psi = dmrg.state
+    psi.permute_arrays("lrp")
+    return _pad_end_arrays(psi.arrays), dmrg.energy
+
+
+class DMRGParallel:
+    r"""Real-space parallel two site DMRG [1]. The chain is split into
+    ``num_segments`` segments, with the state written as
+
+    .. math::
+
+        |\psi\rangle =
+        \psi_1 \Lambda_1^{-1} \psi_2 \Lambda_2^{-1} \cdots \psi_P
+
+    where :math:`\Lambda_p` are the singular values on the bond between
+    segments :math:`p` and :math:`p + 1`. Each segment is optimized
+    independently, and concurrently if ``executor`` is given, with two site
+    DMRG sweeps inside the fixed environments of the rest of the chain. The
+    segments are then stitched back together via the inverse boundary
+    singular values, and the two sites spanning each boundary optimized in
+    the exact environments of the stitched state. Successive iterations shift
+    the segment boundaries by half a segment.
+
+    Note that besides the concurrent segment optimizations, each iteration
+    performs three serial :math:`O(L D^3)` passes over the whole chain
+    (canonizing, optimizing the boundary pairs, and forming the segment
+    environments), so that the speedup from ``executor`` saturates once the
+    segment work per worker becomes comparable to these.
+
+    Parameters
+    ----------
+    ham : MatrixProductOperator
+        The hamiltonian in MPO form, with open boundary conditions and numpy
+        arrays.
+    bond_dims : int or sequence of ints, optional
+        The maximum bond dimension. If a sequence is supplied then successive
+        iterations iterate through, then repeat the final value.
+    cutoffs : float or sequence of float, optional
+        The cutoff threshold(s) to use when compressing.
+    num_segments : int, optional
+        The number of segments to split the chain into, each of which must
+        have at least four sites.
+    which : {'SA', 'LA'}, optional
+        Whether to search for smallest or largest real part eigenvectors.
+    p0 : MatrixProductState, optional
+        If given, use as the initial state.
+    executor : executor, optional
+        An executor with a ``submit`` method to optimize the segments with,
+        e.g. a ``concurrent.futures.ProcessPoolExecutor``, or the pool
+        returned by :func:`~quimb.linalg.mpi_launcher.get_mpi_pool`. If not
+        given, the segments are optimized in turn.
+    segment_sweeps : str, optional
+        The sequence of sweeps each segment performs per iteration.
+    inv_tol : float, optional
+        Boundary singular values smaller than this, relative to the largest,
+        are discarded, so that their inverse is well conditioned.
+
+    Attributes
+    ----------
+    state : MatrixProductState
+        The current, optimized state.
+    energy : float
+        The current most optimized energy.
+    energies : list of float
+        The total energy after each iteration.
+    local_energies : list of list of float
+        The energy found by each segment in each iteration.
+    opts : dict
+        Advanced options to override for the DMRG of each segment, see
+        :func:`~quimb.tensor.tensor_dmrg.get_default_opts`.
+
+    References
+    ----------
+    .. [1] E. M. Stoudenmire and S. R. White, "Real-space parallel density
+       matrix renormalization group", Phys. Rev. B 87, 155137 (2013).
+    """
+
+    def __init__(
+        self,
+        ham,
+        bond_dims=None,
+        cutoffs=1e-8,
+        num_segments=2,
+        which="SA",
+        p0=None,
+        executor=None,
+        segment_sweeps="RL",
+        inv_tol=1e-10,
+    ):
+        if ham.cyclic:
+            raise ValueError(
+                "Parallel DMRG is only supported for open boundary conditions."
+            )
+        if isblocksparse(ham.arrays[0]):
+            raise ValueError(
+                "Parallel DMRG does not yet support block-sparse hamiltonians."
+            )
+        if ham.L < 4 * num_segments:
+            raise ValueError(
+                f"Each segment needs at least four sites, but {num_segments} "
+                f"segments were requested for {ham.L} sites."
+            )
+        if bond_dims is None:
+            bond_dims = [8, 16, 32, 64, 128, 256, 512, 1024]
+
+        self.L = ham.L
+        self.num_segments = num_segments
+        self.which = which
+        self.executor = executor
+        self.segment_sweeps = segment_sweeps
+        self.inv_tol = inv_tol
+        self._set_bond_dim_seq(bond_dims)
+        self._set_cutoff_seq(cutoffs)
+        self.opts = {}
+
+        if p0 is None:
+            p0 = ham.rand_state(self._bond_dim0)
+        psi = p0.copy()
+        psi.permute_arrays("lrp")
+        self._site_ind_id = psi.site_ind_id
+        self._psi_arrays = _pad_end_arrays(psi.arrays)
+
+        ham = ham.copy()
+        ham.permute_arrays("lrud")
+        self._ham_arrays = _pad_end_arrays(ham.arrays)
+
+        self.energies = []
+        self.local_energies = []
+        self._prepare(self._get_segments(0))
+
+    _set_bond_dim_seq = DMRG._set_bond_dim_seq
+    _set_cutoff_seq = DMRG._set_cutoff_seq
+    _check_convergence = DMRG._check_convergence
+
+    @property
+    def energy(self):
+        return self.energies[-1]
+
+    @property
+    def state(self):
+        from .tensor_1d import MatrixProductState
+
+        return MatrixProductState(
+            _unpad_end_arrays(self._psi_arrays),
+            shape="lrp",
+            site_ind_id=self._site_ind_id,
+        )
+
+    def _get_segments(self, iteration):
+        """Get the ``(start, stop)`` sites of each segment, shifting the inner
+        boundaries by half a segment on every other iteration.
+        """
+        bounds = np.linspace(0, self.L, self.num_segments + 1)
+        bounds = bounds.round().astype(int)
+        if iteration % 2:
+            bounds[1:-1] += np.diff(bounds).min() // 2
+        return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+    def _optimize_boundary(self, lenv, theta0, W1, W2, renv, max_bond, cutoff):
+        """Optimize the two site wavefunction ``theta0``, spanning a segment
+        boundary, within the exact environments of the stitched state, then
+        split it into a left isometry and right factor in 'lrp' order.
+        """
+        opts = {**get_default_opts(), **self.opts}
+        shape = theta0.shape
+
+        def matvec(x):
+            x = np.tensordot(lenv, x.reshape(shape), axes=(2, 0))
+            x = np.tensordot(x, W1, axes=((1, 2), (0, 2)))
+            x = np.tensordot(x, W2, axes=((3, 1), (0, 2)))
+            x = np.tensordot(x, renv, axes=((1, 3), (2, 1)))
+            return x.ravel()
+
+        Heff = spla.LinearOperator(
+            shape=(theta0.size, theta0.size),
+            matvec=matvec,
+            dtype=np.result_type(theta0, W1, W2),
+        )
+        _, theta = eigh(
+            Heff,
+            k=1,
+            which=self.which,
+            v0=theta0.ravel(),
+            backend=opts["local_eig_backend"],
+            tol=opts["local_eig_tol"],
+            ncv=opts["local_eig_ncv"],
+            fallback_to_scipy=True,
+        )
+
+        dl, dp, dq, dr = shape
+        U, S, VH = svd_truncated(
+            np.asarray(theta).reshape(dl * dp, dq * dr),
+            cutoff=cutoff,
+            cutoff_mode=map_cutoff_mode(opts["bond_compress_cutoff_mode"]),
+            max_bond=max_bond,
+            absorb=None,
+        )
+        A = U.reshape(dl, dp, -1).transpose(0, 2, 1)
+        C = (S[:, None] * VH).reshape(-1, dq, dr).transpose(0, 2, 1)
+        return A, C
+
+    def _prepare(self, segments, boundaries=(), max_bond=None, cutoff=None):
+        """Bring the current state into canonical form, optimizing the two
+        sites spanning each of the previous segment ``boundaries``, which
+        otherwise only see the state of the neighbouring segment before its
+        optimization, then form the environments, boundary singular values
+        and initial state of each new segment. This takes three serial passes
+        over the chain, with every environment formed after all the
+        boundaries have been optimized. Returns the energy of the current
+        state.
+        """
+        Ts = list(self._psi_arrays)
+        Ws = self._ham_arrays
+        boundaries = set(boundaries)
+        starts = {s for s, _ in segments[1:]}
+
+        # right canonize up to the first boundary, keeping the right
+        # environment of each boundary pair
+        renv = np.ones((1, 1, 1))
+        renvs = {}
+        for i in range(self.L - 1, min(boundaries, default=self.L), -1):
+            Ts[i - 1], Ts[i] = _right_canonize_pair(Ts[i - 1], Ts[i])
+            renv = _env_extend_right(renv, Ts[i], Ws[i])
+            if i - 1 in boundaries:
+                renvs[i] = renv
+
+        # left canonize, optimizing each boundary pair in the exact
+        # environments, and keeping the left environment at each segment
+        # start, which the following right canonization leaves intact
+        lenv = np.ones((1, 1, 1))
+        lenvs = {}
+        for i in range(max(starts | boundaries, default=0)):
+            if i + 1 in boundaries:
+                theta0 = np.tensordot(Ts[i], Ts[i + 1], axes=(1, 0))
+                theta0 = theta0.transpose(0, 1, 3, 2)
+                Ts[i], Ts[i + 1] = self._optimize_boundary(
+                    lenv,
+                    theta0,
+                    Ws[i],
+                    Ws[i + 1],
+                    renvs[i + 2],
+                    max_bond,
+                    cutoff,
+                )
+            else:
+                Ts[i], Ts[i + 1] = _left_canonize_pair(Ts[i], Ts[i + 1])
+            lenv = _env_extend_left(lenv, Ts[i], Ws[i])
+            if i + 1 in starts:
+                lenvs[i + 1] = lenv
+
+        # right canonize, forming each segment from the right
+        renv = np.ones((1, 1, 1))
+        C = Ts[-1]
+        tasks = []
+        self._inv_singular_values = {}
+        for s, e in reversed(segments):
+            hs, ps = list(Ws[s:e]), [*Ts[s : e - 1], C]
+
+            # the environments become extra sites whose 'physical' index is
+            # the dangling bond, with the identity as the initial state
+            if s > 0:
+                hs.insert(0, lenvs[s].transpose(1, 2, 0)[None])
+                ps.insert(0, np.eye(lenvs[s].shape[2], dtype=C.dtype)[None])
+            if e < self.L:
+                hs.append(renv.transpose(1, 2, 0)[:, None])
+                ps.append(np.eye(renv.shape[2], dtype=C.dtype)[:, None])
+            tasks.append((hs, ps))
+
+            # move the orthogonality center through the segment
+            for i in range(e - 1, max(s - 1, 0), -1):
+                dl, dr, dp = C.shape
+                M = C.reshape(dl, dr * dp)
+                if i == s:
+                    # split at the segment boundary, gauge the left basis to
+                    # the schmidt basis, A U, and store Lambda^-1 U^dag
+                    U, S, Vh = np.linalg.svd(M, full_matrices=False)
+                    keep = S > self.inv_tol * S[0]
+                    U, S, Vh = U[:, keep], S[keep], Vh[keep]
+                    self._inv_singular_values[s] = U.conj().T / S[:, None]
+                    L, B = U * S[None, :], Vh
+                else:
+                    Q, R = np.linalg.qr(M.T)
+                    L, B = R.T, Q.T
+                Ts[i] = B.reshape(-1, dr, dp)
+                renv = _env_extend_right(renv, Ts[i], Ws[i])
+                C = np.tensordot(Ts[i - 1], L, axes=(1, 0))
+                C = C.transpose(0, 2, 1)
+
+        Ts[0] = C
+        self._psi_arrays = Ts
+        self._segments = segments
+        self._tasks = tasks[::-1]
+
+        en = _env_extend_right(renv, C, Ws[0]).item()
+        return np.real(en) / np.linalg.norm(C) ** 2
+
+    def _stitch(self, results):
+        """Stitch the optimized segments back together into a single state,
+        absorbing the environment sites and inverse boundary singular values.
+        """
+        arrays = []
+        for (s, e), (seg, _) in zip(self._segments, results):
+            seg = list(seg)
+            if s > 0:
+                t0 = seg.pop(0)
+                seg[0] = np.einsum("xa,xrp->arp", t0[0], seg[0])
+            if e < self.L:
+                t1 = seg.pop()
+                seg[-1] = np.einsum(
+                    "lxp,xb,bk->lkp",
+                    seg[-1],
+                    t1[:, 0],
+                    self._inv_singular_values[e],
+                )
+            arrays.extend(seg)
+        self._psi_arrays = arrays
+
+    def solve(
+        self,
+        tol=1e-4,
+        bond_dims=None,
+        cutoffs=None,
+        max_sweeps=10,
+        verbosity=0,
+        suppress_warnings=True,
+    ):
+        """Solve the system with a sequence of parallel iterations, up to a
+        certain absolute tolerance in the energy or maximum number of
+        iterations.
+
+        Parameters
+        ----------
+        tol : float, optional
+            The absolute tolerance to converge energy to.
+        bond_dims : int or sequence of int
+            Overide the initial/current bond_dim sequence.
+        cutoffs : float of sequence of float
+            Overide the initial/current cutoff sequence.
+        max_sweeps : int, optional
+            The maximum number of iterations to perform, in each of which
+            every segment performs ``segment_sweeps``.
+        verbosity : {0, 1}, optional
+            How much information to print about progress.
+        suppress_warnings : bool, optional
+            Whether to suppress warnings about non-convergence, usually due to
+            the intentional low accuracy of the inner eigensolve.
+
+        Returns
+        -------
+        converged : bool
+            Whether the algorithm has converged to ``tol`` yet.
+        """
+        if bond_dims is not None:
+            self._set_bond_dim_seq(bond_dims)
+        if cutoffs is not None:
+            self._set_cutoff_seq(cutoffs)
+
+        converged = False
+        for _ in range(max_sweeps):
+            max_bond, cutoff = next(self._bond_dims), next(self._cutoffs)
+            if verbosity > 0:
+                print(
+                    f"ITERATION-{len(self.energies) + 1}, "
+                    f"segments={self._segments}, max_bond={max_bond}, "
+                    f"cutoff:{cutoff}",
+                    flush=True,
+                )
+
+            args = [
+                (
+                    hs,
+                    ps,
+                    self.which,
+                    max_bond,
+                    float(cutoff),
+                    self.segment_sweeps,
+                    self.opts,
+                )
+                for hs, ps in self._tasks
+            ]
+            with warnings.catch_warnings():
+                if suppress_warnings:
+                    warnings.simplefilter("ignore")
+                if self.executor is None:
+                    results = [_dmrg_parallel_segment(*a) for a in args]
+                else:
+                    futures = [
+                        self.executor.submit(_dmrg_parallel_segment, *a)
+                        for a in args
+                    ]
+                    results = [f.result() for f in futures]
+
+            self._stitch(results)
+            self.local_energies.append([en for _, en in results])
+            boundaries = [e for _, e in self._segments[:-1]]
+            segments = self._get_segments(len(self.energies) + 1)
+            self.energies.append(
+                self._prepare(segments, boundaries, max_bond, cutoff)
+            )
+
+            converged = self._check_convergence(tol)
+            if verbosity > 0:
+                print(
+                    "Energy: {} ... {}".format(
+                        self.energy,
+                        "converged!" if converged else "not converged.",
+                    ),
+                    flush=True,
+                )
+            if converged:
+                break
+
+        return converged
+
+
 # --------------------------------------------------------------------------- #
 #                                    DMRGX                                    #
 # --------------------------------------------------------------------------- #
@@ -1240,7 +2560,11 @@ class DMRGX(DMRG):
             "bond_compress_method": "svd",
             "bond_compress_cutoff_mode": "sum2",
             "default_sweep_sequence": "RRLL",
+            "bond_expand_method": "rand",
             "bond_expand_rand_strength": 1e-9,
+            "bond_expand_subspace_alpha": 1e-2,
+            "env_spill_dir": None,
+            "env_spill_prefetch": True,
         }
 
     @property
@@ -1404,6 +2728,7 @@ class DMRGX(DMRG):
             # 2: self._update_local_state_2site_dmrgx,
         }[self.bsz](i, **update_opts)
 
+    @profiled("DMRGX.sweep")
     def sweep(self, direction, canonize=True, verbosity=0, **update_opts):
         """Perform a sweep of the algorithm.
 
@@ -1431,7 +2756,13 @@ class DMRGX(DMRG):
             "L": ("left", "right", reversed(range(0, self.L - self.bsz + 1))),
         }[direction]
 
-        eff_opts = {"begin": begin, "bsz": self.bsz, "cyclic": self.cyclic}
+        eff_opts = {
+            "begin": begin,
+            "bsz": self.bsz,
+            "cyclic": self.cyclic,
+            "spill_dir": self.opts["env_spill_dir"],
+            "prefetch": self.opts["env_spill_prefetch"],
+        }
         self.ME_eff_ham = MovingEnvironment(self.TN_energy, **eff_opts)
         self.ME_eff_ham2 = MovingEnvironment(self.TN_energy2, **eff_opts)
         self.ME_eff_ovlp = MovingEnvironment(TN_overlap, **eff_opts)
@@ -1449,6 +2780,10 @@ class DMRGX(DMRG):
         self.local_energies.append(local_ens)
         self.total_energies.append(tot_ens)
 
+        if self.opts["env_spill_dir"] is not None:
+            for me in (self.ME_eff_ham, self.ME_eff_ham2, self.ME_eff_ovlp):
+                me.close()
+
         return tot_ens[-1]
 
     def _compute_post_sweep(self):
@@ -176,6 +176,60 @@ def deprecated(fn, old_name, new_name):
     return new_fn
 
 
+def lazy_module_attrs(package, lazy_imports, submodules=()):
+    """Create the module level ``__getattr__`` and ``__dir__`` functions
+    (PEP 562) for a package whose public attributes are only imported from
+    their submodules when first accessed.
+
+    Parameters
+    ----------
+    package : str
+        The name of the package, i.e. ``__name__``.
+    lazy_imports : dict[str, tuple[str]]
+        Mapping of relative submodule name, e.g. ``".core"``, to the names
+        it provides.
+    submodules : sequence of str, optional
+        The names of submodules that should also be lazily importable as
+        attributes of the package, e.g. ``"core"`` for ``quimb.core``.
+
+    Returns
+    -------
+    __getattr__ : callable
+    __dir__ : callable
+    """
+    import importlib
+    import sys
+
+    attr_to_module = {
+        name: module
+        for module, names in lazy_imports.items()
+        for name in names
+    }
+    submodules = frozenset(submodules)
+
+    def __getattr__(name):
+        try:
+            module = attr_to_module[name]
+        except KeyError:
+            if name in submodules:
+                return importlib.import_module(f".{name}", package)
+            raise AttributeError(
+                f"module '{package}' has no attribute '{name}'"
+            ) from None
+
+        value = getattr(importlib.import_module(module, package), name)
+        # cache on the package so that __getattr__ is only hit once
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(
+            {*vars(sys.modules[package]), *attr_to_module, *submodules}
+        )
+
+    return __getattr__, __dir__
+
+
 def int2tup(x):
     return (
         x if isinstance(x, tuple) else (x,) if isinstance(x, int) else tuple(x)
@@ -526,6 +580,7 @@ class ExponentialGeometricRollingDiffMean:
     """Track the absolute rolling mean of diffs between values, weighted in a
     exponentially decaying geometric fashion.
     """
+
     def __init__(self, factor=1 / 3, initial=1.0):
         self.y_prev = None
         self.x_prev = None
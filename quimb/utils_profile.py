@@ -0,0 +1,270 @@
+"""Opt-in instrumentation of hot paths, for finding out where time goes during
+contractions, decompositions and algorithm sweeps. Nothing is recorded unless
+a :func:`profile` context is active, in which case every instrumented call
+reports its wall time and, where it is cheap to compute, its FLOP count and
+largest intermediate size.
+"""
+
+import contextlib
+import functools
+import json
+import threading
+import time
+
+# the stack of currently active profilers, checked by every hook
+_PROFILERS = []
+_PROFILERS_LOCK = threading.Lock()
+
+
+class Profiler:
+    """Accumulate call counts, wall time, FLOPs and peak intermediate sizes
+    for named sections of code. Usually created via :func:`profile`.
+
+    Times are inclusive, so that e.g. ``"DMRG.sweep"`` contains the time spent
+    in ``"tensor_contract"`` during that sweep.
+
+    Attributes
+    ----------
+    stats : dict[str, dict]
+        The raw statistics, keyed by section name.
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self._lock = threading.Lock()
+        self._tstart = time.perf_counter()
+        self._tstop = None
+
+    def record(self, name, time, flops=None, size=None):
+        """Record a single call of section ``name``.
+
+        Parameters
+        ----------
+        name : str
+            The name of the section.
+        time : float
+            The wall time the call took, in seconds.
+        flops : int, optional
+            The number of floating point operations the call performed.
+        size : int, optional
+            The size of the largest intermediate array the call produced.
+        """
+        with self._lock:
+            try:
+                stat = self.stats[name]
+            except KeyError:
+                stat = self.stats[name] = {
+                    "count": 0,
+                    "time": 0.0,
+                    "max_time": 0.0,
+                    "flops": 0,
+                    "peak_size": 0,
+                }
+            stat["count"] += 1
+            stat["time"] += time
+            stat["max_time"] = max(stat["max_time"], time)
+            if flops is not None:
+                stat["flops"] += int(flops)
+            if size is not None:
+                stat["peak_size"] = max(stat["peak_size"], int(size))
+
+    @property
+    def total_time(self):
+        """The wall time the profiler has been (or was) active for."""
+        tstop = self._tstop if self._tstop is not None else time.perf_counter()
+        return tstop - self._tstart
+
+    def summary(self, sort="time"):
+        """Get a structured summary of the recorded statistics.
+
+        Parameters
+        ----------
+        sort : {"time", "count", "flops", "peak_size", "name"}, optional
+            How to order the sections, descending apart from ``"name"``.
+
+        Returns
+        -------
+        dict
+            With keys ``"total_time"`` and ``"sections"``, the latter mapping
+            each section name to its ``count``, ``time``, ``time_per_call``,
+            ``max_time``, ``flops``, ``flops_per_second`` and ``peak_size``.
+        """
+        if sort == "name":
+            names = sorted(self.stats)
+        else:
+            names = sorted(self.stats, key=lambda k: -self.stats[k][sort])
+
+        sections = {}
+        for name in names:
+            stat = dict(self.stats[name])
+            stat["time_per_call"] = stat["time"] / stat["count"]
+            stat["flops_per_second"] = (
+                stat["flops"] / stat["time"] if stat["time"] > 0 else 0.0
+            )
+            sections[name] = stat
+
+        return {"total_time": self.total_time, "sections": sections}
+
+    def to_json(self, fname=None, sort="time", **dump_opts):
+        """Export the summary as JSON.
+
+        Parameters
+        ----------
+        fname : str or path-like, optional
+            If given, write the JSON to this file, else return it as a string.
+        sort : str, optional
+            How to order the sections, see :meth:`summary`.
+        dump_opts
+            Supplied to :func:`json.dump`.
+
+        Returns
+        -------
+        str or None
+        """
+        dump_opts.setdefault("indent", 2)
+        data = self.summary(sort=sort)
+        if fname is None:
+            return json.dumps(data, **dump_opts)
+        with open(fname, "w") as f:
+            json.dump(data, f, **dump_opts)
+
+    def print_summary(self, sort="time"):
+        """Print a table of the recorded statistics."""
+        print(self._table(sort=sort))
+
+    def _table(self, sort="time"):
+        data = self.summary(sort=sort)
+        sections = data["sections"]
+        width = max((len(name) for name in sections), default=7)
+        width = max(width, 7)
+        header = (
+            f"{'section':<{width}} {'count':>8} {'time':>10} "
+            f"{'per call':>10} {'flops':>10} {'peak size':>10}"
+        )
+        lines = [header]
+        for name, stat in sections.items():
+            lines.append(
+                f"{name:<{width}} {stat['count']:>8} "
+                f"{stat['time']:>10.4g} {stat['time_per_call']:>10.4g} "
+                f"{stat['flops']:>10.4g} {stat['peak_size']:>10.4g}"
+            )
+        lines.append(f"total time: {data['total_time']:.4g}s")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(sections={len(self.stats)}, "
+            f"total_time={self.total_time:.4g})>"
+        )
+
+
+def is_profiling():
+    """Whether any :func:`profile` context is currently active."""
+    return bool(_PROFILERS)
+
+
+def record(name, time, flops=None, size=None):
+    """Record a call of section ``name`` with every active profiler. See
+    :meth:`Profiler.record`.
+    """
+    for profiler in _PROFILERS:
+        profiler.record(name, time, flops=flops, size=size)
+
+
+@contextlib.contextmanager
+def profile(profiler=None):
+    """Context manager that profiles the instrumented hot paths of ``quimb``:
+    tensor contraction, contraction path finding, tensor splitting and the
+    individual decompositions, and the sweeps of ``DMRG``, ``TEBD`` and
+    ``TEBDGen``.
+
+    Parameters
+    ----------
+    profiler : Profiler, optional
+        An existing profiler to accumulate into, else a new one is created.
+
+    Yields
+    ------
+    Profiler
+
+    Examples
+    --------
+
+        >>> with qu.profile() as prof:
+        ...     dmrg.solve()
+        >>> prof.print_summary()
+        >>> prof.to_json("dmrg-profile.json")
+
+    """
+    if profiler is None:
+        profiler = Profiler()
+    profiler._tstop = None
+
+    with _PROFILERS_LOCK:
+        _PROFILERS.append(profiler)
+    try:
+        yield profiler
+    finally:
+        with _PROFILERS_LOCK:
+            _PROFILERS.remove(profiler)
+        profiler._tstop = time.perf_counter()
+
+
+class profile_section:
+    """Context manager that times the enclosed block as section ``name``, if
+    profiling is active, else does nothing.
+    """
+
+    __slots__ = ("_t0", "name")
+
+    def __init__(self, name):
+        self.name = name
+        self._t0 = None
+
+    def __enter__(self):
+        if _PROFILERS:
+            self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        if self._t0 is not None:
+            record(self.name, time.perf_counter() - self._t0)
+            self._t0 = None
+
+
+def profiled(name, info=None):
+    """Decorate a function such that calls to it are recorded as section
+    ``name`` whenever profiling is active. When it is not, the only overhead
+    is a single check of the active profiler stack.
+
+    Parameters
+    ----------
+    name : str
+        The name of the section.
+    info : callable, optional
+        A function with the same signature as the decorated function that
+        returns a tuple ``(flops, size)`` describing the call, which is only
+        called when profiling is active.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapped(*args, **kwargs):
+            if not _PROFILERS:
+                return fn(*args, **kwargs)
+
+            t0 = time.perf_counter()
+            result = fn(*args, **kwargs)
+            elapsed = time.perf_counter() - t0
+
+            if info is not None:
+                flops, size = info(*args, **kwargs)
+            else:
+                flops = size = None
+            record(name, elapsed, flops=flops, size=size)
+
+            return result
+
+        return wrapped
+
+    return decorator
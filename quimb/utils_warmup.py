@@ -0,0 +1,331 @@
+"""Ahead-of-time compilation of the ``numba`` kernels used by ``quimb``.
+
+With numba caching enabled (the default, see the ``QUIMB_NUMBA_CACHE``
+environment variable), the compiled machine code of every kernel is written to
+disk the first time it is called with a given signature, and subsequent
+processes load it rather than compiling again. :func:`warmup` calls every
+kernel with each of the signatures that ``quimb`` itself uses, so that this
+cost can be paid once, e.g. when building a container image, rather than at
+the start of every new process. It can also be run from the command line::
+
+    quimb-warmup --cache-dir /opt/numba-cache
+
+where the same ``NUMBA_CACHE_DIR`` must then be set in the environment of any
+processes that should use the cache.
+"""
+
+import os
+import sys
+import time
+import warnings
+
+_WARMUP_DTYPES = ("float32", "float64", "complex64", "complex128")
+
+
+def _rand(shape, dtype, seed=42):
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=shape)
+    if "complex" in dtype:
+        x = x + 1j * rng.normal(size=shape)
+    return x.astype(dtype)
+
+
+def _rand_pos(d, dtype, seed=42):
+    """A random hermitian positive definite matrix."""
+    import numpy as np
+
+    x = _rand((d, d), dtype, seed=seed)
+    return (x @ x.conj().T + d * np.eye(d)).astype(dtype)
+
+
+def _scalar(dtype):
+    import numpy as np
+
+    return np.dtype(dtype).type(0.5)
+
+
+def _warmup_core(dtype):
+    """The dense and sparse linear algebra kernels of ``quimb.core``."""
+    import numpy as np
+    import scipy.sparse as sp
+
+    from . import core
+
+    a = core.qarray(_rand((4, 4), dtype))
+    b = core.qarray(_rand((4, 4), dtype, seed=7))
+    v = core.qarray(_rand((16, 1), dtype))
+    d = _rand((4,), dtype)
+
+    core.kron_dense(a, b)
+    core.mul_dense(a, b)
+    core.l_diag_dot_dense(d, a)
+    core.r_diag_dot_dense(a, d)
+    core.outer(d, d)
+    core.rdot(d, d)
+    core.trace(a)
+
+    core.subtract_update_(v.copy(), _scalar(dtype), v)
+    core.subtract_update_(v.ravel().copy(), _scalar(dtype), v.ravel())
+    core.divide_update_(v, _scalar(dtype), np.empty_like(v))
+    core.divide_update_(v.ravel(), _scalar(dtype), np.empty_like(v.ravel()))
+
+    A = sp.random(16, 16, density=0.5, format="csr", random_state=42)
+    core.par_dot_csr_matvec(A.astype(dtype), v)
+
+    if "complex" not in dtype:
+        x = _rand((16,), dtype)
+        core.complex_array(x, x)
+        core.phase_to_complex(x)
+        core.explt(x, 0.1)
+
+
+def _warmup_decomp(dtype):
+    """The decompositions used by ``tensor_split`` and compression."""
+    import numpy as np
+
+    from .tensor import decomp
+    from .tensor.tensor_core import Tensor
+
+    x = _rand((8, 8), dtype)
+    xp = _rand_pos(8, dtype)
+
+    for method, array in [
+        ("svd", x),
+        ("eig", x),
+        ("eigh", xp),
+        ("cholesky", xp),
+    ]:
+        T = Tensor(array, inds=("a", "b"))
+        for absorb in ("left", "right", "both", None):
+            if method == "cholesky" and absorb is None:
+                continue
+            for renorm in (None, True):
+                T.split(
+                    "a",
+                    method=method,
+                    absorb=absorb,
+                    cutoff=1e-10,
+                    max_bond=4,
+                    renorm=renorm,
+                )
+
+    T = Tensor(x, inds=("a", "b"))
+    for method in ("qr", "lq", "polar_right", "polar_left"):
+        T.split("a", method=method)
+    T.split("a", method="eig", get="values")
+
+    if dtype in ("float64", "complex128"):
+        similarity_methods = ("eig", "eigh", "svd", "biorthog")
+    else:
+        # the other numba similarity compressions are double precision only
+        similarity_methods = ("eig",)
+
+    for method in similarity_methods:
+        for renorm in (False, True):
+            decomp.similarity_compress(
+                xp if method == "eigh" else x,
+                4,
+                renorm=renorm,
+                method=method,
+            )
+
+    for right in (True, False):
+        decomp.squared_op_to_reduced_factor(xp, 4, 4, right=right)
+        decomp.squared_op_to_reduced_factor(xp, 2, 8, right=right)
+        decomp.squared_op_to_reduced_factor(xp, 8, 2, right=right)
+
+    decomp.sgn(np.diag(x).copy())
+
+
+def _warmup_array_ops(dtype):
+    """The diagonal and column finding kernels used in simplification."""
+    from .tensor import array_ops
+
+    x = _rand((2, 2, 2), dtype)
+    array_ops.find_diag_axes(x)
+    array_ops.find_antidiag_axes(x)
+    array_ops.find_columns(x)
+
+
+def _warmup_operatorbuilder(dtype):
+    """The sparse operator building kernels of the experimental
+    ``operatorbuilder``, which only support real and complex double or single
+    precision.
+    """
+    from .experimental.operatorbuilder import (
+        fermi_hubbard_from_edges,
+        heisenberg_from_edges,
+    )
+
+    edges = [(0, 1), (1, 2), (2, 3), (3, 0)]
+
+    H = heisenberg_from_edges(edges)
+    for symmetry, sector in [(None, None), ("Z2", 0), ("U1", 2)]:
+        A = H.build_sparse_matrix(
+            symmetry=symmetry, sector=sector, dtype=dtype
+        )
+        H.matvec(
+            _rand((A.shape[0],), dtype),
+            symmetry=symmetry,
+            sector=sector,
+            dtype=dtype,
+        )
+
+    H = fermi_hubbard_from_edges(edges[:2])
+    H.build_sparse_matrix(
+        symmetry="U1U1", sector=((3, 1), (3, 1)), dtype=dtype
+    )
+
+
+_WARMUP_FNS = {
+    "core": _warmup_core,
+    "decomp": _warmup_decomp,
+    "array_ops": _warmup_array_ops,
+    "operatorbuilder": _warmup_operatorbuilder,
+}
+
+
+def _set_numba_cache_dir(cache_dir):
+    """Point numba's cache at ``cache_dir``. This only affects kernels whose
+    modules have not been imported yet, since numba fixes the cache location
+    of each function when it is decorated.
+    """
+    cache_dir = os.path.abspath(os.fspath(cache_dir))
+    os.makedirs(cache_dir, exist_ok=True)
+    os.environ["NUMBA_CACHE_DIR"] = cache_dir
+
+    if "numba" in sys.modules:
+        from numba import config
+
+        config.CACHE_DIR = cache_dir
+
+    imported = [
+        name
+        for name in (
+            "quimb.core",
+            "quimb.tensor.decomp",
+            "quimb.tensor.array_ops",
+            "quimb.experimental.operatorbuilder.configcore",
+        )
+        if name in sys.modules
+    ]
+    if imported:
+        warnings.warn(
+            f"The modules {imported} have already been imported, so their "
+            f"kernels will not be cached in '{cache_dir}'. Set the "
+            "`NUMBA_CACHE_DIR` environment variable or call `warmup` before "
+            "using quimb instead."
+        )
+
+
+def warmup(groups=None, dtypes=None, cache_dir=None, verbosity=0):
+    """Compile, and if caching is enabled write to disk, all the ``numba``
+    kernels used by ``quimb``, for each of the signatures it calls them with.
+    Subsequent processes sharing the same cache then incur no JIT latency.
+
+    Parameters
+    ----------
+    groups : sequence of str, optional
+        Which groups of kernels to compile, by default all of:
+
+        - ``"core"``: dense and sparse linear algebra in ``quimb.core``,
+        - ``"decomp"``: the decompositions used by ``tensor_split``,
+        - ``"array_ops"``: the array structure finders used in simplification,
+        - ``"operatorbuilder"``: the experimental sparse operator builder.
+
+    dtypes : sequence of str, optional
+        The data types to compile for, by default single and double precision
+        real and complex.
+    cache_dir : str or path-like, optional
+        If given, the directory to write the cache to, equivalent to setting
+        the ``NUMBA_CACHE_DIR`` environment variable. This must be called
+        before any of the kernel modules are imported to take effect, and the
+        same ``NUMBA_CACHE_DIR`` must be set for processes using the cache.
+    verbosity : int, optional
+        If ``> 0``, print the time taken to compile each group and dtype.
+
+    Returns
+    -------
+    timings : dict[(str, str), float]
+        The time taken to compile, or load from cache, each group and dtype.
+    """
+    if cache_dir is not None:
+        _set_numba_cache_dir(cache_dir)
+
+    if groups is None:
+        groups = tuple(_WARMUP_FNS)
+    if dtypes is None:
+        dtypes = _WARMUP_DTYPES
+
+    from numba.core.errors import NumbaPerformanceWarning
+
+    from .core import _NUMBA_CACHE
+
+    if not _NUMBA_CACHE:
+        warnings.warn(
+            "Numba caching is disabled by `QUIMB_NUMBA_CACHE`, so the "
+            "compiled kernels will only be available in this process."
+        )
+
+    timings = {}
+    for group in groups:
+        fn = _WARMUP_FNS[group]
+        for dtype in dtypes:
+            t0 = time.perf_counter()
+            with warnings.catch_warnings():
+                # these are only relevant for actual, not dummy, inputs
+                warnings.simplefilter("ignore", NumbaPerformanceWarning)
+                fn(dtype)
+            timings[group, dtype] = time.perf_counter() - t0
+            if verbosity > 0:
+                print(f"{group:>16} {dtype:>11}: {timings[group, dtype]:.2f}s")
+
+    return timings
+
+
+def main(argv=None):
+    """Command line entry point, ``quimb-warmup``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="quimb-warmup",
+        description="Compile and cache the numba kernels used by quimb.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory to write the cache to, defaults to NUMBA_CACHE_DIR "
+        "or else numba's default location next to the source files.",
+    )
+    parser.add_argument(
+        "--groups",
+        nargs="+",
+        choices=tuple(_WARMUP_FNS),
+        default=None,
+        help="Which groups of kernels to compile, defaults to all.",
+    )
+    parser.add_argument(
+        "--dtypes",
+        nargs="+",
+        choices=_WARMUP_DTYPES,
+        default=None,
+        help="Which data types to compile for, defaults to all.",
+    )
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    warmup(
+        groups=args.groups,
+        dtypes=args.dtypes,
+        cache_dir=args.cache_dir,
+        verbosity=0 if args.quiet else 1,
+    )
+    if not args.quiet:
+        print(f"Total: {time.perf_counter() - t0:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
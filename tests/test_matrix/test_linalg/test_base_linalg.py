@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
 import scipy.sparse as sp
+import scipy.sparse.linalg as spla
 from numpy.testing import assert_allclose
 
 import quimb as qu
@@ -179,6 +180,34 @@ class TestLOBPCG:
         assert_allclose(np.eye(6), abs(vk.H @ svk), atol=1e-9, rtol=1e-9)
 
 
+class TestDavidson:
+    @pytest.mark.parametrize("dtype", [float, complex])
+    @pytest.mark.parametrize("k", [1, 4])
+    @pytest.mark.parametrize("which", ["SA", "LA"])
+    def test_against_arpack(self, dtype, k, which):
+        A = qu.rand_herm(64, dtype=dtype)
+        lk, vk = qu.eigh(A, k=k, which=which, backend="davidson")
+        slk, svk = qu.eigh(A, k=k, which=which, backend="scipy")
+        assert_allclose(lk, slk)
+        assert_allclose(np.eye(k), abs(vk.H @ svk), atol=1e-8)
+
+    def test_linear_operator_with_precond(self):
+        H = qu.ham_heis(10, sparse=True)
+        Hl = spla.aslinearoperator(H)
+        v0 = qu.rand_ket(2**10)
+        lk, vk = qu.eigh(
+            Hl, k=2, v0=v0, backend="davidson", precond=H.diagonal(), ncv=8
+        )
+        slk = qu.eigh(H, k=2, backend="scipy", return_vecs=False)
+        assert_allclose(lk, slk)
+        assert_allclose(vk.H @ vk, np.eye(2), atol=1e-12)
+
+    def test_generalized_raises(self):
+        A = qu.rand_herm(8)
+        with pytest.raises(ValueError):
+            qu.eigh(A, k=1, B=qu.eye(8), backend="davidson")
+
+
 class TestEvalsWindowed:
     @pytest.mark.parametrize("backend", eigs_backends)
     def test_bound_spectrum(self, ham1, backend):
@@ -318,6 +347,29 @@ class TestExpm:
             assert isinstance(p, sp.csr_matrix)
 
 
+class TestExpmMultiplyKrylov:
+    @pytest.mark.parametrize("t", [0.1, 1.0, 10.0])
+    @pytest.mark.parametrize("imag", [False, True])
+    @pytest.mark.parametrize("linop", [False, True])
+    def test_matches_expm(self, t, imag, linop):
+        H = qu.ham_heis(6, sparse=True)
+        v = qu.rand_ket(2**6)
+        factor = -t if imag else -1j * t
+        ex = qu.expm(factor * H.toarray()) @ v
+
+        A = spla.aslinearoperator(H) * factor if linop else factor * H
+        x = qu.expm_multiply(A, v, backend="krylov")
+        assert x.shape == v.shape
+        assert_allclose(x, ex, atol=1e-10 * np.linalg.norm(ex))
+
+    def test_small_subspace_substeps(self):
+        H = qu.ham_heis(6)
+        v = qu.rand_ket(2**6)
+        ex = qu.expm(-2j * H) @ v
+        x = qu.expm_multiply(-2j * H, v, backend="krylov", ncv=6)
+        assert_allclose(x, ex, atol=1e-9)
+
+
 class TestSqrtm:
     @pytest.mark.parametrize("sparse", [True, False])
     @pytest.mark.parametrize("herm", [True, False])
@@ -340,7 +392,7 @@ class TestLazy:
         h_ex = qu.ham_heis(n=4, sparse=sparse)[slice(*ownership), :]
         assert_allclose(h.toarray(), h_ex.toarray())
 
-    @pytest.mark.parametrize("backend", ["scipy", "lobpcg"])
+    @pytest.mark.parametrize("backend", ["scipy", "lobpcg", "davidson"])
     def test_project_eig(self, backend):
         Hl = qu.Lazy(qu.ham_heis, 4, sparse=True, shape=(16, 16), cyclic=True)
         Pl = qu.Lazy(qu.zspin_projector, 4, shape=(16, 6))
@@ -30,6 +30,23 @@ def test_contract_normal(damping, diis):
     assert Z == pytest.approx(Z_bp, rel=1e-1)
 
 
+@pytest.mark.parametrize("damping", [0.0, 0.1])
+def test_contract_residual(damping):
+    tn = qtn.TN2D_from_fill_fn(lambda s: qu.randn(s, dist="uniform"), 6, 6, 2)
+    info = {}
+    Z_ref = qbp.contract_d1bp(tn, damping=damping, tol=1e-10)
+    Z_bp = qbp.contract_d1bp(
+        tn, damping=damping, update="residual", tol=1e-10, info=info
+    )
+    assert info["converged"]
+    assert Z_bp == pytest.approx(Z_ref, rel=1e-8)
+
+    # tree-like networks are exact
+    tn = qtn.TN_rand_tree(20, 3)
+    Z_bp = qbp.contract_d1bp(tn, update="residual", damping=damping)
+    assert Z_bp == pytest.approx(tn.contract(), rel=1e-10)
+
+
 def test_get_gauged_tn():
     tn = qtn.TN2D_from_fill_fn(lambda s: qu.randn(s, dist="uniform"), 6, 6, 2)
     Z = tn.contract()
@@ -40,3 +57,18 @@ def test_get_gauged_tn():
     tn_gauged = bp.get_gauged_tn()
     Zg = qu.prod(array.item(0) for array in tn_gauged.arrays)
     assert Z == pytest.approx(Zg, rel=1e-1)
+
+
+@pytest.mark.parametrize("update", ["sequential", "parallel"])
+def test_contract_executor(update):
+    from concurrent.futures import ThreadPoolExecutor
+
+    tn = qtn.TN2D_from_fill_fn(lambda s: qu.randn(s, dist="uniform"), 6, 6, 2)
+    Z_ref = qbp.contract_d1bp(tn, update=update, tol=1e-10)
+    with ThreadPoolExecutor(2) as pool:
+        info = {}
+        Z_bp = qbp.contract_d1bp(
+            tn, update=update, tol=1e-10, info=info, executor=pool
+        )
+    assert info["converged"]
+    assert Z_bp == pytest.approx(Z_ref, rel=1e-8)
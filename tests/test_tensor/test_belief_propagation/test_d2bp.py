@@ -1,5 +1,6 @@
 import pytest
 
+import quimb as qu
 import quimb.tensor as qtn
 import quimb.tensor.belief_propagation as qbp
 
@@ -76,3 +77,89 @@ def test_sample(dtype):
 
     # check we are doing better than random guessing
     assert ptotal > nrepeat * 2**-peps.nsites
+
+
+@pytest.mark.parametrize("damping", [0.0, 0.1])
+def test_contract_residual(damping):
+    peps = qtn.PEPS.rand(4, 4, 3, seed=42, dtype="float64")
+    info = {}
+    N_ref = qbp.contract_d2bp(peps, damping=damping, tol=1e-10)
+    N_ap = qbp.contract_d2bp(
+        peps, damping=damping, update="residual", tol=1e-10, info=info
+    )
+    assert info["converged"]
+    assert N_ap == pytest.approx(N_ref, rel=1e-8)
+
+    # tree-like networks are exact
+    psi = qtn.TN_rand_tree(20, 3, 2, seed=42)
+    norm2_bp = qbp.contract_d2bp(psi, update="residual", damping=damping)
+    assert norm2_bp == pytest.approx(psi.H @ psi, rel=1e-4)
+
+
+@pytest.mark.parametrize("dtype", ["float64", "complex128"])
+@pytest.mark.parametrize("damping", [0.0, 0.1])
+def test_contract_batched(dtype, damping):
+    peps = qtn.PEPS.rand(4, 5, 3, seed=42, dtype=dtype)
+    info = {}
+    N_ref = qbp.contract_d2bp(peps, damping=damping, tol=1e-10)
+    N_ap = qbp.contract_d2bp(
+        peps, damping=damping, update="batched", tol=1e-10, info=info
+    )
+    assert info["converged"]
+    assert N_ap == pytest.approx(N_ref, rel=1e-8)
+
+    # tree-like networks are exact
+    psi = qtn.TN_rand_tree(20, 3, 2, seed=42, dtype=dtype)
+    norm2_bp = qbp.contract_d2bp(psi, update="batched", damping=damping)
+    assert norm2_bp == pytest.approx(psi.H @ psi, rel=1e-4)
+
+
+def test_get_d2bp_warm_start():
+    peps = qtn.PEPS.rand(5, 5, 2, seed=42, dtype="float64")
+    bp = peps.get_d2bp()
+    assert peps.get_d2bp() is bp
+    bp.run(tol=1e-8)
+    assert bp.update_touched_from_data() == ()
+
+    G = qu.expm(-0.1 * qu.ham_heis(2)).real
+    peps.gate_(G, [(1, 1), (1, 2)], contract="reduce-split", max_bond=2)
+    # growing the bond dimension reinitializes the affected messages
+    peps.gate_(G, [(3, 3), (4, 3)], contract="reduce-split")
+    assert peps.bond_size((3, 3), (4, 3)) > 2
+
+    info = {}
+    bp.run(tol=1e-8, info=info)
+    assert info["converged"]
+    N_ref = qbp.contract_d2bp(peps, tol=1e-8)
+    assert bp.contract() == pytest.approx(N_ref, rel=1e-6)
+    assert peps.get_d2bp(reset=True) is not bp
+
+
+def test_get_d2bp_pickle():
+    import pickle
+
+    peps = qtn.PEPS.rand(3, 3, 2, seed=42, dtype="float64")
+    bp = peps.get_d2bp()
+    bp.run(tol=1e-8)
+    peps2 = pickle.loads(pickle.dumps(peps))
+    # the session is not carried over, but can be recreated
+    bp2 = peps2.get_d2bp()
+    assert bp2 is not bp
+    bp2.run(tol=1e-8)
+    assert bp2.contract() == pytest.approx(bp.contract(), rel=1e-6)
+    assert peps.get_d2bp() is bp
+
+
+@pytest.mark.parametrize("update", ["sequential", "parallel"])
+def test_contract_executor(update):
+    from concurrent.futures import ThreadPoolExecutor
+
+    peps = qtn.PEPS.rand(4, 4, 3, seed=42, dtype="float64")
+    N_ref = qbp.contract_d2bp(peps, update=update, tol=1e-10)
+    with ThreadPoolExecutor(2) as pool:
+        info = {}
+        N_ap = qbp.contract_d2bp(
+            peps, update=update, tol=1e-10, info=info, executor=pool
+        )
+    assert info["converged"]
+    assert N_ap == pytest.approx(N_ref, rel=1e-8)
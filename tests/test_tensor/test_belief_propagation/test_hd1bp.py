@@ -67,3 +67,17 @@ def test_get_gauged_tn():
     tn_gauged = bp.get_gauged_tn()
     Zg = qu.prod(array.item(0) for array in tn_gauged.arrays)
     assert Z == pytest.approx(Zg, rel=1e-1)
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+def test_contract_executor(kind):
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    htn = qtn.HTN_random_ksat(3, 30, alpha=2.0, seed=42, mode="dense")
+    Z_ref = qbp.contract_hd1bp(htn)
+    cls = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}[kind]
+    with cls(2) as pool:
+        info = {}
+        Z_bp = qbp.contract_hd1bp(htn, info=info, executor=pool)
+    assert info["converged"]
+    assert Z_bp == pytest.approx(Z_ref, rel=1e-12)
@@ -165,3 +165,18 @@ def test_mps():
         site_tags=[f"I{i}" for i in range(L)],
     )
     assert O == pytest.approx(expec ^ ..., abs=1e-6)
+
+
+@pytest.mark.parametrize("update", ["sequential", "parallel"])
+def test_contract_executor(update):
+    from concurrent.futures import ThreadPoolExecutor
+
+    tn = qtn.TN2D_rand(3, 4, 3, seed=42, dist="uniform")
+    Z_ref = qbp.contract_l1bp(tn, update=update, tol=1e-10)
+    with ThreadPoolExecutor(2) as pool:
+        info = {}
+        Z_bp = qbp.contract_l1bp(
+            tn, update=update, tol=1e-10, info=info, executor=pool
+        )
+    assert info["converged"]
+    assert Z_bp == pytest.approx(Z_ref, rel=1e-8)
@@ -96,3 +96,18 @@ def test_compress_double_layer_loopy(dtype, damping, update):
     # assert we did better than basic local compression
     fid_bp = abs(tn_bp.H @ tn_lazy)
     assert fid_bp > fid_basic
+
+
+@pytest.mark.parametrize("update", ["sequential", "parallel"])
+def test_contract_executor(update):
+    from concurrent.futures import ThreadPoolExecutor
+
+    peps = qtn.PEPS.rand(3, 4, 2, seed=42, dtype="float64")
+    N_ref = qbp.contract_l2bp(peps, update=update, tol=1e-10)
+    with ThreadPoolExecutor(2) as pool:
+        info = {}
+        N_bp = qbp.contract_l2bp(
+            peps, update=update, tol=1e-10, info=info, executor=pool
+        )
+    assert info["converged"]
+    assert N_bp == pytest.approx(N_ref, rel=1e-8)
@@ -0,0 +1,62 @@
+import pickle
+
+import pytest
+
+import quimb.tensor as qtn
+import quimb.tensor.belief_propagation as qbp
+
+
+def get_gloops(Lx=4, Ly=4, max_size=6):
+    tn = qtn.TN2D_rand(Lx, Ly, 2, seed=42)
+    return tuple(tn.gen_gloops(max_size))
+
+
+@pytest.mark.parametrize("max_size", [4, 6])
+def test_region_graph_counts(max_size):
+    gloops = get_gloops(max_size=max_size)
+    rg = qbp.RegionGraph(gloops)
+    rg.check()
+    assert rg.get_total_count() == 1
+    counts = dict(qbp.gen_region_counts(gloops))
+    assert {r: rg.get_count(r) for r in rg.regions} == counts
+
+
+def test_region_graph_incremental():
+    gloops = get_gloops()
+    rg = qbp.RegionGraph(gloops, autoprune=False)
+    counts = {r: rg.get_count(r) for r in rg.regions}
+
+    # adding and removing a region should restore all counts
+    r = max(rg.regions, key=len) | min(rg.regions, key=len)
+    rg.add_region(r)
+    rg.check()
+    assert rg.get_count(r) == 1
+    assert rg.get_total_count() == 1
+    rg.remove_region(r)
+    rg.check()
+    assert {r: rg.get_count(r) for r in rg.regions} == counts
+
+    # removing a generating region should match building without it
+    r = gloops[0]
+    rg.remove_region(r)
+    rg.check()
+    rg_new = qbp.RegionGraph(
+        (r for r in rg.regions), autocomplete=False, autoprune=False
+    )
+    assert {r: rg.get_count(r) for r in rg.regions} == {
+        r: rg_new.get_count(r) for r in rg_new.regions
+    }
+
+
+def test_region_graph_pickle():
+    rg = qbp.RegionGraph(get_gloops())
+    rg_new = pickle.loads(pickle.dumps(rg))
+    assert rg_new.regions == rg.regions
+    assert rg_new.parents == rg.parents
+    assert rg_new.children == rg.children
+    # counts are carried over without recomputation
+    assert rg_new.info["count"] == {r: rg.get_count(r) for r in rg.regions}
+    rg_new.check()
+    rg_c = rg.copy()
+    rg_c.add_region(frozenset.union(*rg.regions))
+    assert len(rg_c.regions) == len(rg.regions) + 1
@@ -164,6 +164,174 @@ class TestContractOpts:
 
         assert info["num_calls"] == 1
 
+    def test_contract_path_cache(self, tmp_path):
+        import cotengra as ctg
+
+        info = {"num_calls": 0}
+
+        def my_custom_opt(inputs, output, size_dict, memory_limit=None):
+            info["num_calls"] += 1
+            return [(0, 1)] * (len(inputs) - 1)
+
+        ctg.register_preset("quimb_test_path_cache_opt", my_custom_opt)
+
+        # index names are different, but geometry the same
+        tna = qtn.TN_rand_reg(10, 3, 2, seed=7)
+        tnb = tna.copy()
+        tnb.mangle_inner_()
+        tnb.randomize_(seed=42)
+
+        assert qtn.get_contract_path_cache() is None
+        with qtn.contract_path_cache(str(tmp_path)) as cache:
+            Za = tna.contract(optimize="quimb_test_path_cache_opt")
+            Zb = tnb.contract(optimize="quimb_test_path_cache_opt")
+            assert info["num_calls"] == 1
+            assert cache.hits == 1
+            assert cache.misses == 1
+            assert tna.contraction_path(
+                "quimb_test_path_cache_opt"
+            ) == tnb.contraction_path("quimb_test_path_cache_opt")
+            assert info["num_calls"] == 1
+        assert qtn.get_contract_path_cache() is None
+
+        assert Za == pytest.approx(tna.contract(optimize="greedy"))
+        assert Zb == pytest.approx(tnb.contract(optimize="greedy"))
+
+        # a new cache, e.g. in another process, should load path from disk
+        with qtn.contract_path_cache(str(tmp_path)) as cache:
+            assert len(cache) == 0
+            tnb.contract(optimize="quimb_test_path_cache_opt")
+            assert info["num_calls"] == 1
+            assert cache.hits == 1
+
+    @pytest.mark.parametrize("output", [False, True])
+    @pytest.mark.parametrize("strip_exponent", [False, True])
+    def test_contract_compiled(self, output, strip_exponent):
+        tn = qtn.TN_rand_reg(8, 3, 2, seed=42)
+        if output:
+            output_inds = tuple(tn.inner_inds()[:2])
+        else:
+            output_inds = None
+
+        Zex = tn.contract(
+            all, output_inds=output_inds, strip_exponent=strip_exponent
+        )
+        Z = tn.contract(
+            all,
+            output_inds=output_inds,
+            strip_exponent=strip_exponent,
+            compiled=True,
+        )
+        if strip_exponent:
+            (Zex, eex), (Z, e) = Zex, Z
+            assert e == pytest.approx(eex)
+        if output:
+            assert Z.inds == output_inds
+            assert Z.tags == tn.tags
+            Z, Zex = Z.data, Zex.data
+        assert Z == pytest.approx(Zex)
+
+        # compiled contraction is reused for new arrays
+        c = tn.get_compiled_contraction(
+            output_inds=output_inds, strip_exponent=strip_exponent
+        )
+        tn.randomize_(seed=7)
+        assert c is tn.get_compiled_contraction(
+            output_inds=output_inds, strip_exponent=strip_exponent
+        )
+        Zex = tn.contract(
+            all, output_inds=output_inds, strip_exponent=strip_exponent
+        )
+        Z = c(*tn.arrays)
+        if strip_exponent:
+            (Zex, _), (Z, _) = Zex, Z
+        if output:
+            Z, Zex = Z.data, Zex.data
+        assert Z == pytest.approx(Zex)
+
+
+class TestContractSliced:
+    @pytest.mark.parametrize("executor", [None, "threads"])
+    def test_basic(self, executor):
+        tn = qtn.TN2D_rand(4, 4, 3, seed=0, dist="uniform")
+        Zex = tn.contract(all)
+        if executor == "threads":
+            from concurrent.futures import ThreadPoolExecutor
+
+            executor = ThreadPoolExecutor(2)
+        Z = tn.contract_sliced(max_memory=8 * 27, executor=executor)
+        assert Z == pytest.approx(Zex)
+
+    @pytest.mark.parametrize("pool", ["process", "thread"])
+    def test_parallel(self, pool):
+        tn = qtn.TN2D_rand(4, 4, 3, seed=0, dist="uniform")
+        Zex = tn.contract(all)
+        Z = tn.contract(all, parallel=2, pool=pool)
+        assert Z == pytest.approx(Zex)
+        Z = tn.contract(all, parallel=2, pool=pool, max_memory=8 * 27)
+        assert Z == pytest.approx(Zex)
+
+    def test_strip_exponent(self):
+        tn = qtn.TN2D_rand(4, 4, 3, seed=0, dist="uniform")
+        Zex = tn.contract(all)
+        tn.equalize_norms_(value=2.0)
+        m, e = tn.contract_sliced(max_memory=8 * 27, strip_exponent=True)
+        assert abs(m) == pytest.approx(1.0)
+        assert m * 10**e == pytest.approx(Zex)
+
+    def test_output_inds_not_sliced(self):
+        tn = qtn.TN2D_rand(3, 3, 3, seed=1, dist="uniform")
+        output_inds = (tn.inner_inds()[0],)
+        Tex = tn.contract(all, output_inds=output_inds)
+        T = tn.contract_sliced(output_inds=output_inds, max_memory=8 * 9)
+        assert T.inds == output_inds
+        assert T.data == pytest.approx(Tex.data)
+
+    def test_checkpoint_resume(self, tmp_path):
+        from concurrent.futures import Future
+
+        class CrashingExecutor:
+            _max_workers = 1
+
+            def __init__(self, crash_after):
+                self.num_calls = 0
+                self.crash_after = crash_after
+
+            def submit(self, fn, *args):
+                self.num_calls += 1
+                if self.num_calls > self.crash_after:
+                    raise KeyboardInterrupt
+                f = Future()
+                f.set_result(fn(*args))
+                return f
+
+        tn = qtn.TN2D_rand(4, 4, 3, seed=0, dist="uniform")
+        Zex = tn.contract(all)
+
+        # simulate a crash midway through the contraction
+        ex = CrashingExecutor(crash_after=5)
+        with pytest.raises(KeyboardInterrupt):
+            tn.contract(
+                all,
+                checkpoint=tmp_path,
+                max_memory=8 * 27,
+                executor=ex,
+                batch_size=2,
+            )
+
+        # rebuild network with new index names, e.g. in a new process
+        tn = tn.copy()
+        tn.mangle_inner_()
+        ex = CrashingExecutor(crash_after=float("inf"))
+        Z = tn.contract(all, checkpoint=tmp_path, executor=ex, batch_size=2)
+        assert Z == pytest.approx(Zex)
+        # only the unfinished slices should have been contracted
+        assert ex.num_calls < 14
+
+        # different contractions can't use the same checkpoint
+        with pytest.raises(ValueError):
+            qtn.TN2D_rand(3, 3, 3).contract(all, checkpoint=tmp_path)
+
 
 @pytest.mark.parametrize("around", ["I3,3", "I0,0", "I1,2"])
 @pytest.mark.parametrize("equalize_norms", [False, True])
@@ -1,3 +1,5 @@
+import importlib
+
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
@@ -7,6 +9,11 @@ import quimb.tensor as qtn
 
 dtypes = ["float32", "float64", "complex64", "complex128"]
 
+requires_symmray = pytest.mark.skipif(
+    importlib.util.find_spec("symmray") is None,
+    reason="symmray not installed",
+)
+
 
 class TestMatrixProductState:
     def test_matrix_product_state(self):
@@ -1056,6 +1063,38 @@ class TestMatrixProductOperator:
         assert mpo.num_indices == 3
         assert mpo.cyclic
 
+    @requires_symmray
+    @pytest.mark.parametrize("symmetry", ["U1", "Z2"])
+    def test_to_abelian(self, symmetry):
+        H = qtn.MPO_ham_heis(6)
+        Hs = H.to_abelian(symmetry)
+        assert Hs.backend == "symmray"
+        assert all(t.data.charge == 0 for t in Hs)
+
+        p = qtn.MPS_computational_state("011010")
+        ps = p.to_abelian(symmetry)
+        assert ps[-1].data.charge == (3 if symmetry == "U1" else 1)
+
+        for HH, k in [(H, p), (Hs, ps)]:
+            b = k.H
+            k.align_(HH, b)
+            if HH is H:
+                en = (b | HH | k) ^ all
+            else:
+                assert (b | HH | k) ^ all == pytest.approx(en)
+
+        # built directly
+        Hs = qtn.MPO_ham_heis(6, symmetry=symmetry)
+        assert Hs.backend == "symmray"
+
+    @requires_symmray
+    def test_to_abelian_not_symmetric(self):
+        H = qtn.MPO_ham_ising(6, bx=0.5)
+        with pytest.raises(ValueError):
+            H.to_abelian("U1")
+        with pytest.raises(ValueError):
+            qtn.MPS_rand_state(6, 4).to_abelian("U1")
+
 
 # --------------------------------------------------------------------------- #
 #                         Test specific 1D instances                          #
@@ -112,6 +112,43 @@ class TestSimpleUpdate:
         assert su.best["energy"] < -6.25
 
 
+class TestSimpleUpdateGen:
+    def test_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        ham = qtn.ham_2d_heis(3, 4)
+        psi0 = qtn.PEPS.rand(3, 4, 2, seed=7)
+        opts = dict(D=3, ordering="sort", progbar=False)
+
+        su = qtn.SimpleUpdateGen(psi0, ham, **opts)
+        su.evolve(10, tau=0.1)
+
+        with ThreadPoolExecutor(2) as executor:
+            su_par = qtn.SimpleUpdateGen(psi0, ham, executor=executor, **opts)
+            su_par.evolve(10, tau=0.1)
+
+        assert su_par.energy == pytest.approx(su.energy)
+
+    def test_executor_overridden_gate(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        class CountingUpdate(qtn.SimpleUpdateGen):
+            def gate(self, G, where):
+                self.ngates += 1
+                super().gate(G, where)
+
+        ham = qtn.ham_2d_heis(2, 3)
+        psi0 = qtn.PEPS.rand(2, 3, 2, seed=7)
+        with ThreadPoolExecutor(2) as executor:
+            su = CountingUpdate(
+                psi0, ham, D=2, executor=executor, progbar=False
+            )
+            su.ngates = 0
+            su.evolve(2, tau=0.1)
+        # every gate should go via the overridden method
+        assert su.ngates == 2 * len(ham.terms)
+
+
 class TestFullUpdate:
     @pytest.mark.parametrize("backend", ["numpy", pytorch_case])
     def test_heis_small(self, backend):
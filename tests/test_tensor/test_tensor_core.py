@@ -70,6 +70,14 @@ class TestBasicTensorOperations:
         # still reference the same underlying array
         assert_allclose(a.data, b.data)
 
+    def test_tensor_copy_owners_and_left_inds(self):
+        a = Tensor(np.random.randn(2, 3), inds=[0, 1], left_inds=[0])
+        tn = qtn.TensorNetwork([a], virtual=True)
+        b = a.copy()
+        assert a.owners and not b.owners
+        assert b.left_inds == (0,)
+        assert isinstance(tn.copy().tensors[0], Tensor)
+
     def test_tensor_deep_copy(self):
         a = Tensor(np.random.randn(2, 3, 4), inds=[0, 1, 2], tags="blue")
         b = a.copy(deep=True)
@@ -807,6 +815,31 @@ class TestTensorNetwork:
         assert_allclose(abc1.data, abc4.data)
         assert_allclose(abc1.data, abc5.data)
 
+    def test_from_arrays(self):
+        tn = qtn.TN_rand_reg(10, 3, 2, phys_dim=2, seed=7)
+        arrays = tn.arrays
+        inds = [t.inds for t in tn]
+        tags = [t.tags for t in tn]
+        tnb = TensorNetwork.from_arrays(arrays, inds, tags)
+        tnb.check()
+        assert tnb.tensor_map.keys() == tn.tensor_map.keys()
+        assert tuple(tnb.tag_map) == tuple(tn.tag_map)
+        assert tuple(tnb.ind_map) == tuple(tn.ind_map)
+        assert tnb.outer_inds() == tn.outer_inds()
+        assert tnb.inner_inds() == tn.inner_inds()
+        assert_allclose(
+            tnb.to_dense(tn.outer_inds()), tn.to_dense(tn.outer_inds())
+        )
+
+        # subclass with extra properties
+        tnv = qtn.tensor_arbgeom.TensorNetworkGenVector.from_arrays(
+            arrays, inds, tags, like=tn
+        )
+        assert tnv.site_ind_id == tn.site_ind_id
+
+        with pytest.raises(ValueError):
+            TensorNetwork.from_arrays([np.ones((2, 2))], [("a",)])
+
     def test_copy(self):
         a = rand_tensor((2, 3, 4), inds="abc", tags="t0")
         b = rand_tensor((2, 3, 4), inds="abd", tags="t1")
@@ -1,3 +1,6 @@
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import numpy as np
@@ -16,6 +19,7 @@ from quimb.tensor import (
     MPS_rand_state,
     MPS_product_state,
     MPS_computational_state,
+    MPS_neel_state,
     MPO_ham_ising,
     MPO_ham_XY,
     MPO_ham_heis,
@@ -23,14 +27,23 @@ from quimb.tensor import (
     MovingEnvironment,
     DMRG1,
     DMRG2,
+    DMRGParallel,
     DMRGX,
     SpinHam1D,
 )
+from quimb.tensor.tensor_core import TNLinearOperator
+from quimb.tensor.tensor_dmrg import DenseEffectiveOperator
 
 
 np.random.seed(42)
 
 
+requires_symmray = pytest.mark.skipif(
+    importlib.util.find_spec("symmray") is None,
+    reason="symmray not installed",
+)
+
+
 class TestMovingEnvironment:
     def test_bsz1_start_left(self):
         tn = MPS_rand_state(6, bond_dim=7)
@@ -140,6 +153,71 @@ class TestMovingEnvironment:
             assert len(cur_env.tensors) == 2 * bsz + 2
             assert (cur_env ^ all) == pytest.approx(1.0)
 
+    @pytest.mark.parametrize("begin", ["left", "right"])
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_spill_to_disk(self, begin, prefetch, tmp_path):
+        n = 10
+        p = MPS_rand_state(n, bond_dim=7)
+        norm = p.H & p
+        mes = MovingEnvironment(
+            norm, begin=begin, bsz=2, spill_dir=tmp_path, prefetch=prefetch
+        )
+
+        def is_spilled(i):
+            return any(isinstance(t.data, np.memmap) for t in mes.envs[i])
+
+        sweep = range(n - 1) if begin == "left" else reversed(range(n - 1))
+        for i in sweep:
+            mes.move_to(i)
+            assert mes.pos == i
+            assert not is_spilled(i)
+            assert (mes() ^ all) == pytest.approx(1.0)
+            assert sum(map(is_spilled, mes.envs)) >= min(i, n - 2 - i) - 1
+
+        assert len(list(tmp_path.iterdir())) == 1
+        mes.close()
+        assert len(list(tmp_path.iterdir())) == 0
+
+
+class TestDenseEffectiveOperator:
+    @pytest.mark.parametrize("bsz", [1, 2])
+    @pytest.mark.parametrize("num_threads", [1, 3])
+    def test_matches_tn_linear_operator(self, bsz, num_threads):
+        n = 6
+        k = MPS_rand_state(n, bond_dim=5)
+        b = k.H.reindex({ix: f"{ix}_b" for ix in k.ind_map})
+        H = MPO_ham_heis(n, upper_ind_id="k{}", lower_ind_id="k{}_b")
+        for tn, tag in [(b, "_BRA"), (H, "_HAM"), (k, "_KET")]:
+            tn.add_tag(tag)
+        mes = MovingEnvironment(b | H | k, begin="left", bsz=bsz)
+
+        with ThreadPoolExecutor(num_threads) as pool:
+            for i in range(n - bsz + 1):
+                mes.move_to(i)
+                kts = [k[j] for j in range(i, i + bsz)]
+                uix = tuple(
+                    ix
+                    for t in kts
+                    for ix in t.inds
+                    if sum(ix in o.inds for o in kts) == 1
+                )
+                lix = tuple(f"{ix}_b" for ix in uix)
+                tn = mes()["_HAM"]
+                Ha = TNLinearOperator(tn, left_inds=lix, right_inds=uix)
+                Hb = DenseEffectiveOperator(
+                    tn,
+                    left_inds=lix,
+                    right_inds=uix,
+                    num_threads=num_threads,
+                    executor=pool,
+                )
+                assert Hb.shape == Ha.shape
+                for _ in range(2):
+                    x = np.random.randn(Ha.shape[1])
+                    x = x + 1j * np.random.randn(Ha.shape[1])
+                    assert_allclose(Hb @ x, Ha @ x)
+                assert_allclose(Hb.diagonal(), np.diag(Ha.to_dense()))
+
 
 class TestDMRG1:
     def test_single_explicit_sweep(self):
@@ -239,6 +317,16 @@ class TestDMRG1:
         exp_gs = MPS_product_state([plus()] * 6)
         assert_allclose(abs(exp_gs.H @ mps_gs), 1.0, rtol=1e-3)
 
+    def test_subspace_expansion(self):
+        n = 12
+        h = MPO_ham_heis(n)
+        dmrg = DMRG1(h, bond_dims=[4, 8, 16, 32])
+        dmrg.opts["bond_expand_method"] = "subspace"
+        assert dmrg.solve(tol=1e-8, sweep_sequence="RL", verbosity=1)
+        assert dmrg.state.max_bond() > 4
+        actual_e = eigh(ham_heis(n, sparse=True), k=1, return_vecs=False)
+        assert_allclose(actual_e, dmrg.energy, rtol=1e-6)
+
 
 class TestDMRG2:
     @pytest.mark.parametrize("dense", [False, True])
@@ -302,6 +390,60 @@ class TestDMRG2:
         (res_dtype,) = {t.dtype for t in dmrg.state}
         assert res_dtype == dtype
 
+    def test_spill_envs(self, tmp_path):
+        H = MPO_ham_heis(10)
+        dmrg = DMRG2(H, bond_dims=[4, 8, 16, 32])
+        dmrg.opts["env_spill_dir"] = tmp_path
+        assert dmrg.solve(tol=1e-6)
+        assert len(list(tmp_path.iterdir())) == 0
+        en_ex = eigh(ham_heis(10, sparse=True), k=1, return_vecs=False)
+        assert dmrg.energy == pytest.approx(en_ex, rel=1e-6)
+
+    @pytest.mark.parametrize("num_threads", [1, 2])
+    def test_local_eig_ham_threads(self, num_threads):
+        H = MPO_ham_heis(10)
+        dmrg = DMRG2(H, bond_dims=[4, 8, 16, 32])
+        dmrg.opts["local_eig_ham_dense"] = False
+        dmrg.opts["local_eig_ham_threads"] = num_threads
+        assert dmrg.solve(tol=1e-6)
+        assert dmrg._matvec_pool is None
+        en_ex = eigh(ham_heis(10, sparse=True), k=1, return_vecs=False)
+        assert dmrg.energy == pytest.approx(en_ex, rel=1e-6)
+
+    @pytest.mark.parametrize("tol,tol_adapt", [(1e-6, None), (1e-3, 0.1)])
+    def test_davidson(self, tol, tol_adapt):
+        H = MPO_ham_heis(10)
+        p0 = MPS_rand_state(10, 4, seed=42)
+        dmrg = DMRG2(H, bond_dims=[4, 8, 16, 32], p0=p0)
+        dmrg.opts["local_eig_backend"] = "davidson"
+        dmrg.opts["local_eig_tol"] = tol
+        dmrg.opts["local_eig_tol_adapt"] = tol_adapt
+        assert dmrg.solve(tol=1e-8)
+        if tol_adapt is not None:
+            assert dmrg._get_local_eig_tol() < tol
+        en_ex = eigh(ham_heis(10, sparse=True), k=1, return_vecs=False)
+        assert dmrg.energy == pytest.approx(en_ex, rel=1e-6)
+
+    @requires_symmray
+    @pytest.mark.parametrize("symmetry", ["U1", "Z2"])
+    def test_blocksparse(self, symmetry):
+        n = 10
+        H = MPO_ham_heis(n, symmetry=symmetry)
+        p0 = MPS_neel_state(n).to_abelian(symmetry)
+        dmrg = DMRG2(H, bond_dims=[4, 8, 16, 32], p0=p0)
+        assert dmrg.solve(tol=1e-8)
+        assert dmrg.state.backend == "symmray"
+        en_ex = eigh(ham_heis(n, sparse=True), k=1, return_vecs=False)
+        assert dmrg.energy == pytest.approx(en_ex, rel=1e-6)
+
+        # continue optimizing with fixed bonds
+        dmrg1 = DMRG1(H, bond_dims=32, p0=dmrg.state)
+        dmrg1.solve(tol=1e-8)
+        assert dmrg1.energy == pytest.approx(en_ex, rel=1e-6)
+
+        with pytest.raises(ValueError):
+            DMRG2(H, bond_dims=8)
+
     def test_total_size_2(self):
         N = 2
         builder = SpinHam1D(1 / 2)
@@ -339,6 +481,56 @@ class TestDMRG2:
         assert_allclose(H_explicit, H_sps.toarray())
 
 
+class TestDMRGParallel:
+    @pytest.mark.parametrize("num_segments", [2, 3])
+    @pytest.mark.parametrize("MPO_ham", [MPO_ham_XY, MPO_ham_heis])
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_matches_exact(self, num_segments, MPO_ham, parallel):
+        n = 12
+        h = MPO_ham(n)
+
+        if parallel:
+            executor = ThreadPoolExecutor(num_segments)
+        else:
+            executor = None
+
+        dmrg = DMRGParallel(
+            h,
+            bond_dims=[8, 16, 32],
+            num_segments=num_segments,
+            executor=executor,
+        )
+        assert dmrg.solve(tol=1e-8, max_sweeps=20, verbosity=1)
+        if executor is not None:
+            executor.shutdown()
+
+        assert len(dmrg.local_energies[0]) == num_segments
+
+        # check against dense form
+        actual_e, gs = eigh(h.to_qarray(), k=1)
+        assert_allclose(actual_e, dmrg.energy, rtol=1e-6)
+
+        mps_gs = dmrg.state
+        assert mps_gs.max_bond() <= 32
+        mps_gs_dense = mps_gs.to_qarray()
+        assert_allclose(expec(mps_gs_dense, mps_gs_dense), 1.0, rtol=1e-6)
+        assert_allclose(abs(expec(mps_gs_dense, gs)), 1.0, rtol=1e-6)
+
+    def test_matches_dmrg2(self):
+        n = 24
+        h = MPO_ham_heis(n)
+        dmrg2 = DMRG2(h, bond_dims=[8, 16])
+        dmrg2.solve(tol=1e-8, max_sweeps=20)
+
+        dmrgp = DMRGParallel(h, bond_dims=[8, 16], num_segments=4)
+        assert dmrgp.solve(tol=1e-6, max_sweeps=30)
+        assert dmrgp.energy == pytest.approx(dmrg2.energy, rel=1e-6)
+
+    def test_too_many_segments(self):
+        with pytest.raises(ValueError):
+            DMRGParallel(MPO_ham_heis(10), num_segments=3)
+
+
 class TestDMRGX:
     def test_explicit_sweeps(self):
         n = 8
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from pytest import approx
+
+import quimb as qu
+import quimb.tensor as qtn
+
+
+def long_range_ising(n, alpha=2, hx=0.7):
+    dims = [2] * n
+    Z, X = qu.pauli("Z"), qu.pauli("X")
+    H = sum(
+        qu.ikron([Z, Z], dims, [i, j]) / (j - i) ** alpha
+        for i in range(n)
+        for j in range(i + 1, n)
+    )
+    H = H + sum(hx * qu.ikron(X, dims, i) for i in range(n))
+    return H
+
+
+class TestTDVP:
+    @pytest.mark.parametrize("bsz", [1, 2])
+    def test_long_range_matches_exact(self, bsz):
+        n = 8
+        H = long_range_ising(n)
+        H_mpo = qtn.MatrixProductOperator.from_dense(H, [2] * n, cutoff=1e-12)
+
+        psi0 = qtn.MPS_neel_state(n)
+        if bsz == 1:
+            # one site TDVP can't grow the bond dimension itself
+            psi0.expand_bond_dimension(16, rand_strength=0.0)
+
+        tdvp = qtn.TDVP(
+            psi0,
+            H_mpo,
+            dt=0.05,
+            bsz=bsz,
+            split_opts={"cutoff": 1e-10},
+        )
+        tdvp.update_to(1.0)
+        assert tdvp.t == approx(1.0)
+
+        dpsi0 = psi0.to_dense()
+        dpsit = qu.expm(-1j * np.asarray(H)) @ dpsi0
+
+        pt = tdvp.pt
+        assert pt.max_bond() > 1
+        assert qu.fidelity(pt.to_dense(), dpsit) == approx(1.0, rel=1e-8)
+        assert qu.expec(pt.to_dense(), H) == approx(
+            qu.expec(dpsi0, H), rel=1e-6
+        )
+
+    def test_at_times(self):
+        n = 6
+        H_mpo = qtn.MPO_ham_heis(n)
+        psi0 = qtn.MPS_neel_state(n)
+        tdvp = qtn.TDVP(psi0, H_mpo, dt=0.05)
+
+        ts = np.linspace(0, 1, 5)
+        dham = qu.ham_heis(n, sparse=True)
+        dpsi0 = psi0.to_dense()
+        for t, pt in zip(ts, tdvp.at_times(ts, progbar=False)):
+            assert tdvp.t == approx(t)
+            dpsit = qu.expm_multiply(-1j * t * dham, dpsi0)
+            assert qu.fidelity(pt.to_dense(), dpsit) == approx(1.0, rel=1e-8)
+
+    def test_imag_time(self):
+        n = 8
+        H_mpo = qtn.MPO_ham_heis(n)
+        psi0 = qtn.MPS_neel_state(n)
+        tdvp = qtn.TDVP(psi0, H_mpo, dt=0.2, imag=True, progbar=False)
+        tdvp.update_to(20)
+
+        pt = tdvp.pt
+        assert pt.H @ pt == approx(1.0)
+        dham = qu.ham_heis(n, sparse=True)
+        en = qu.expec(pt.to_dense(), dham)
+        assert en == approx(qu.groundenergy(dham), rel=1e-6)
+
+    def test_bad_args(self):
+        with pytest.raises(ValueError):
+            qtn.TDVP(qtn.MPS_neel_state(4), qtn.MPO_ham_heis(4), bsz=3)
+        with pytest.raises(ValueError):
+            qtn.TDVP(
+                qtn.MPS_neel_state(4, cyclic=True),
+                qtn.MPO_ham_heis(4, cyclic=True),
+            )
+        tdvp = qtn.TDVP(qtn.MPS_neel_state(4), qtn.MPO_ham_heis(4))
+        with pytest.raises(ValueError):
+            tdvp.update_to(1.0)
@@ -216,6 +216,110 @@ class TestTEBD:
         ef_mpo = qtn.expec_TN_1D(tebd.pt.H, H_mpo, tebd.pt)
         assert ef_mpo == pytest.approx(e0, 1e-5)
 
+    @pytest.mark.parametrize("n", [7, 8])
+    def test_batched(self, n):
+        psi0 = qtn.MPS_rand_state(n, bond_dim=3, seed=7)
+        H = qtn.ham_1d_mbl(n, dh=1.7, cyclic=False, seed=42)
+
+        tebd = qtn.TEBD(psi0, H, dt=0.05, batched=True, progbar=False)
+        tebd.split_opts["cutoff"] = 1e-12
+        tebd.update_to(1.0)
+        assert tebd.t == approx(1.0)
+
+        tebd_ref = qtn.TEBD(psi0, H, dt=0.05, progbar=False)
+        tebd_ref.split_opts["cutoff"] = 1e-12
+        tebd_ref.update_to(1.0)
+
+        pt = tebd.pt
+        assert pt.H @ pt == approx(1.0, rel=1e-8)
+        assert pt.max_bond() > 3
+        assert abs(pt.H @ tebd_ref.pt) == approx(1.0, rel=1e-8)
+
+        Hd = qu.ham_mbl(n, dh=1.7, cyclic=False, seed=42, sparse=True)
+        evo = qu.Evolution(psi0.to_dense(), Hd)
+        evo.update_to(1.0)
+        assert qu.expec(pt.to_dense(), evo.pt) == approx(1.0, rel=1e-5)
+
+    def test_batched_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        n = 8
+        psi0 = qtn.MPS_neel_state(n)
+        H = qtn.ham_1d_heis(n)
+        tebd = qtn.TEBD(psi0, H, dt=0.05, batched=True, progbar=False)
+        tebd.update_to(0.5)
+
+        with ThreadPoolExecutor(2) as executor:
+            tebd_par = qtn.TEBD(
+                psi0,
+                H,
+                dt=0.05,
+                batched=True,
+                executor=executor,
+                progbar=False,
+            )
+            tebd_par.update_to(0.5)
+
+        assert abs(tebd_par.pt.H @ tebd.pt) == approx(1.0, rel=1e-8)
+
+        with pytest.raises(ValueError):
+            qtn.TEBD(psi0, H, executor=executor)
+
+    @pytest.mark.parametrize("cyclic,imag", [(True, False), (False, True)])
+    def test_batched_bad_args(self, cyclic, imag):
+        psi0 = qtn.MPS_neel_state(6, cyclic=cyclic)
+        H = qtn.ham_1d_heis(6, cyclic=cyclic)
+        with pytest.raises(ValueError):
+            qtn.TEBD(psi0, H, batched=True, imag=imag)
+
+    @pytest.mark.parametrize("batched", [False, True])
+    @pytest.mark.parametrize("n", [7, 8])
+    def test_observe(self, n, batched):
+        psi0 = qtn.MPS_neel_state(n)
+        H = qtn.ham_1d_heis(n)
+        ts = np.linspace(0, 1, 6)
+        ops = {"Z": qu.pauli("Z"), "S+": qu.spin_operator("+")}
+
+        tebd = qtn.TEBD(psi0, H, dt=0.05, batched=batched, progbar=False)
+        data = tebd.observe(ts, ops=ops, rdms=True)
+        assert data["entropy"].shape == (6, n - 1)
+        assert data["rdms"].shape == (6, n, 2, 2)
+        assert data["Z"].dtype == float
+        assert data["S+"].dtype == complex
+
+        tebd_ref = qtn.TEBD(psi0, H, dt=0.05, batched=batched, progbar=False)
+        for k, pt in enumerate(tebd_ref.at_times(ts)):
+            for i in range(n):
+                if i < n - 1:
+                    assert data["entropy"][k, i] == approx(
+                        pt.entropy(i + 1), abs=1e-6
+                    )
+                rho = pt.partial_trace_exact((i,))
+                assert data["rdms"][k, i] == approx(rho, abs=1e-6)
+                assert data["Z"][k, i] == approx(
+                    pt.local_expectation_exact(ops["Z"], (i,)), abs=1e-6
+                )
+
+        assert abs(tebd.pt.H @ tebd_ref.pt) == approx(1.0)
+
+    @pytest.mark.parametrize("order", [2, 4])
+    def test_observe_records_final_sweep_only(self, order):
+        n = 7
+        tebd = qtn.TEBD(
+            qtn.MPS_neel_state(n), qtn.ham_1d_heis(n), dt=0.05, progbar=False
+        )
+        record_center = tebd._record_center
+        centers = []
+
+        def counting_record_center(i):
+            centers.append(i)
+            record_center(i)
+
+        tebd._record_center = counting_record_center
+        tebd.observe([0.2, 0.4], order=order)
+        # the center passes each site once per observed time
+        assert centers == [1, 3, 5, 6] * 2
+
     def test_build_mpo_propagator_trotterized(self):
         n = 5
         ham = qtn.ham_1d_mbl(n, dh=1.7, cyclic=False, seed=42)
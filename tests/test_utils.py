@@ -1,8 +1,9 @@
 import pytest
+
 from quimb.utils import (
-    raise_cant_find_library_function,
     deprecated,
     oset,
+    raise_cant_find_library_function,
 )
 
 
@@ -83,3 +84,129 @@ class TestOset:
         a = oset("abcdefg")
         a.difference_update(oset("abd"), oset("bdf"))
         assert list(a) == ["c", "e", "g"]
+
+
+class TestProfile:
+    def test_inactive_by_default(self):
+        from quimb.utils_profile import _PROFILERS, is_profiling
+
+        assert not is_profiling()
+        assert not _PROFILERS
+
+    def test_contract_and_split(self, tmp_path):
+        import json
+
+        import quimb as qu
+        import quimb.tensor as qtn
+
+        tn = qtn.TN2D_rand(3, 3, 2, seed=42)
+        with qu.profile() as prof:
+            tn.contract(optimize="greedy")
+            qtn.MPS_rand_state(6, 4, seed=42).compress(max_bond=2)
+
+        # nothing recorded once exited
+        ncontract = prof.stats["tensor_contract"]["count"]
+        tn.contract(optimize="greedy")
+        assert prof.stats["tensor_contract"]["count"] == ncontract
+
+        stats = prof.summary()["sections"]
+        assert stats["array_contract"]["flops"] > 0
+        assert stats["array_contract"]["peak_size"] > 0
+        assert stats["tensor_split"]["count"] > 0
+        assert stats["decomp.svd"]["count"] > 0
+        assert all(v["time"] >= 0.0 for v in stats.values())
+
+        fname = tmp_path / "profile.json"
+        prof.to_json(fname)
+        with open(fname) as f:
+            data = json.load(f)
+        assert data["sections"].keys() == stats.keys()
+
+    def test_sweeps(self):
+        import quimb as qu
+        import quimb.tensor as qtn
+
+        with qu.profile() as prof:
+            dmrg = qtn.DMRG2(qtn.MPO_ham_heis(6), bond_dims=[4])
+            dmrg.solve(max_sweeps=1)
+            tebd = qtn.TEBD(qtn.MPS_neel_state(6), qtn.ham_1d_heis(6))
+            tebd.update_to(0.1, dt=0.05, progbar=False)
+
+        assert prof.stats["DMRG.sweep"]["count"] == 1
+        assert prof.stats["DMRG.eigensolve"]["count"] > 0
+        assert prof.stats["TEBD.sweep"]["count"] > 0
+
+
+class TestLazyImports:
+    # cold start budget for ``import quimb.tensor``, in seconds, much
+    # larger than the actual time to avoid spurious failures
+    MAX_IMPORT_TIME = 1.0
+
+    def _run(self, code):
+        import subprocess
+        import sys
+
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+    def test_import_is_lazy(self):
+        out = self._run(
+            "import sys, quimb, quimb.tensor; "
+            "print(any(m in sys.modules for m in "
+            "('numba', 'scipy', 'quimb.core', 'quimb.tensor.tensor_core')))"
+        )
+        assert out == "False"
+
+    def test_import_time(self):
+        out = self._run(
+            "import time; t0 = time.perf_counter(); import quimb.tensor; "
+            "print(time.perf_counter() - t0)"
+        )
+        assert float(out) < self.MAX_IMPORT_TIME
+
+    def test_lazy_attributes(self):
+        import quimb as qu
+        import quimb.tensor as qtn
+        from quimb.tensor.tensor_core import Tensor
+
+        assert qtn.Tensor is Tensor
+        assert set(qu.__all__) <= set(dir(qu))
+        assert set(qtn.__all__) <= set(dir(qtn))
+        assert "tensor_1d" in dir(qtn)
+        assert qtn.tensor_1d.MatrixProductState is qtn.MatrixProductState
+        with pytest.raises(AttributeError):
+            _ = qtn.not_a_real_attribute
+
+
+class TestWarmup:
+    def test_warmup(self):
+        import quimb as qu
+
+        timings = qu.warmup(groups=["array_ops"], dtypes=["float64"])
+        assert set(timings) == {("array_ops", "float64")}
+
+    def test_warmup_cli_cache_dir(self, tmp_path):
+        import subprocess
+        import sys
+
+        cache_dir = tmp_path / "numba-cache"
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "quimb.utils_warmup",
+                "--cache-dir",
+                str(cache_dir),
+                "--groups",
+                "array_ops",
+                "--dtypes",
+                "float64",
+                "--quiet",
+            ],
+            check=True,
+        )
+        assert any(cache_dir.rglob("*.nbi"))